@@ -1,24 +1,64 @@
 import google.generativeai as genai
 import json
-import re
 import asyncio
 import os
+import time
 import logging
 from groq import Groq
+from services.prompt_budget import PromptBudget
+from services.ai_stub import StubProvider
+from services.response_parser import ResponseParser
+from services.telemetry import AITelemetry
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("AIHelper")
 
+class ReviewBatchPacker:
+    """
+    커밋을 순서대로 받아 묶음 리뷰 단위를 만듭니다.
+    diff 가 큰 커밋은 단독 묶음, 작은 커밋은 max_commits / 토큰 예산까지 모읍니다.
+    add() 는 닫힌 묶음만 돌려주므로 diff 가 도착하는 대로 리뷰를 시작할 수 있습니다.
+    """
+    def __init__(self, budget, conf):
+        self.budget = budget
+        self.enabled = conf.get("enabled", True)
+        self.max_commits = conf.get("max_commits", 8)
+        self.small_tokens = conf.get("small_diff_tokens", 1500)
+        self.max_tokens = budget.budget_for('code_review_batch') - 1000  # 템플릿 몫
+        self.current, self.used = [], 0
+
+    def add(self, commit):
+        if not self.enabled: return [[commit]]
+        cost = self.budget.estimate(commit['diff']) + self.budget.estimate(commit['msg']) + 30
+        if cost > self.small_tokens: return [[commit]]
+        closed = []
+        if self.current and (len(self.current) >= self.max_commits or self.used + cost > self.max_tokens):
+            closed.append(self.current)
+            self.current, self.used = [], 0
+        self.current.append(commit); self.used += cost
+        return closed
+
+    def flush(self):
+        closed = [self.current] if self.current else []
+        self.current, self.used = [], 0
+        return closed
+
 class AIHelper:
-    def __init__(self, gemini_key, groq_key=None):
+    def __init__(self, gemini_key, groq_key=None, config=None):
         self.gemini_key = gemini_key
         self.groq_key = groq_key
-        self.load_config()
+        self.load_config(config)
         self.load_prompts()
         self.setup_client()
+        self.budget = PromptBudget(self.config)
+        self.parser = ResponseParser()
+        self.telemetry = AITelemetry(self.config.get("ai_pricing", {}), self.model_name)
 
-    def load_config(self):
+    def load_config(self, config=None):
+        if config is not None:
+            self.config = config
+            return
         try:
             with open("src/config.json", "r", encoding="utf-8") as f:
                 self.config = json.load(f)
@@ -43,81 +83,211 @@ class AIHelper:
             self.client = Groq(api_key=self.groq_key)
             self.groq_model = self.config.get("groq_model", "llama-3.3-70b-versatile")
             logger.info(f"Groq Client Setup Complete. Model: {self.groq_model}")
+        elif self.provider == "stub":
+            # [NEW] 오프라인 벤치마크/부하 테스트용 공급자 (키 불필요)
+            self.stub = StubProvider(self.config.get("stub", {}))
+            logger.info("Stub Client Setup Complete (offline mode)")
         else:
             logger.error("❌ AI Provider 설정 오류 또는 키 누락")
             self.model = None
 
-    async def generate_content(self, prompt, is_json=False):
+    @property
+    def model_name(self):
+        if self.provider == "gemini": return self.config.get("ai_model", "gemini-1.5-pro")
+        if self.provider == "groq": return self.config.get("groq_model", "llama-3.3-70b-versatile")
+        return self.provider
+
+    async def generate_content(self, prompt, is_json=False, prompt_type=None, guild_id=None):
+        # [UPDATE] 모든 호출을 계측 (TTFB/총 지연, 프롬프트·응답 크기, 토큰 수)
+        t0 = time.perf_counter()
+        ttfb, usage, ok = None, None, False
+        text = "❌ 설정 오류"
         try:
             logger.debug(f"Generating content... (JSON Mode: {is_json})")
             if self.provider == "gemini":
-                if not self.model: return "❌ 키 설정 필요"
-                config = genai.types.GenerationConfig(response_mime_type="application/json") if is_json else None
-                response = await asyncio.to_thread(self.model.generate_content, prompt, generation_config=config)
-                return response.text
+                if not self.model: text = "❌ 키 설정 필요"
+                else:
+                    config = genai.types.GenerationConfig(response_mime_type="application/json") if is_json else None
+                    text, ttfb, usage = await asyncio.to_thread(self._call_gemini, prompt, config)
+                    ok = True
             elif self.provider == "groq":
-                if not hasattr(self, 'client'): return "❌ Groq 키 필요"
-                final_prompt = prompt
-                if is_json and "json" not in prompt.lower():
-                    final_prompt += "\n\n(IMPORTANT: Respond in JSON format)"
-                kwargs = {"messages": [{"role": "user", "content": final_prompt}], "model": self.groq_model}
-                if is_json: kwargs["response_format"] = {"type": "json_object"}
-                def call(): return self.client.chat.completions.create(**kwargs).choices[0].message.content
-                return await asyncio.to_thread(call)
+                if not hasattr(self, 'client'): text = "❌ Groq 키 필요"
+                else:
+                    final_prompt = prompt
+                    if is_json and "json" not in prompt.lower():
+                        final_prompt += "\n\n(IMPORTANT: Respond in JSON format)"
+                    kwargs = {"messages": [{"role": "user", "content": final_prompt}], "model": self.groq_model}
+                    if is_json: kwargs["response_format"] = {"type": "json_object"}
+                    text, ttfb, usage = await asyncio.to_thread(self._call_groq, kwargs)
+                    ok = True
+            elif self.provider == "stub":
+                text = await self.stub.generate(prompt, is_json=is_json, prompt_type=prompt_type)
+                ok = True
         except Exception as e:
             logger.error(f"AI Generation Error: {e}", exc_info=True)
-            return f"Error: {e}"
-        return "❌ 설정 오류"
+            text = f"Error: {e}"
+        finally:
+            p_tok, r_tok = usage or (None, None)
+            self.telemetry.record_call(prompt_type, guild_id, ttfb, time.perf_counter() - t0,
+                                       len(prompt), len(text or ""), p_tok, r_tok, ok=ok)
+        return text
+
+    def _call_gemini(self, prompt, config):
+        """(응답 텍스트, 첫 청크까지 걸린 시간, (입력 토큰, 출력 토큰)) 반환. 스레드에서 실행"""
+        t0 = time.perf_counter()
+        if not self.config.get("ai_stream", True):
+            response = self.model.generate_content(prompt, generation_config=config)
+            return response.text, None, self._gemini_usage(response)
+        response = self.model.generate_content(prompt, generation_config=config, stream=True)
+        parts, ttfb = [], None
+        for chunk in response:
+            if ttfb is None: ttfb = time.perf_counter() - t0
+            parts.extend(self._gemini_chunk_parts(chunk))
+        # [FIX] 차단 / 빈 응답은 비스트리밍의 response.text 처럼 예외로 올려 generate_content 의 오류 처리로 보냄
+        if not parts: raise ValueError(f"Gemini 스트림에 텍스트가 없습니다 (prompt_feedback={getattr(response, 'prompt_feedback', None)})")
+        return "".join(parts), ttfb, self._gemini_usage(response)
+
+    @staticmethod
+    def _gemini_chunk_parts(chunk):
+        """스트림 청크의 텍스트 조각. chunk.text 는 후보 / parts 가 빈 청크(안전 필터, 마지막 메타데이터)에서 예외를 내므로 직접 읽음"""
+        out = []
+        for cand in getattr(chunk, 'candidates', None) or ():
+            content = getattr(cand, 'content', None)
+            for part in getattr(content, 'parts', None) or ():
+                t = getattr(part, 'text', None)
+                if t: out.append(t)
+        return out
+
+    @staticmethod
+    def _gemini_usage(response):
+        meta = getattr(response, 'usage_metadata', None)
+        if not meta: return None
+        return getattr(meta, 'prompt_token_count', None), getattr(meta, 'candidates_token_count', None)
 
-    async def generate_meeting_summary(self, transcript):
+    def _call_groq(self, kwargs):
+        t0 = time.perf_counter()
+        # Groq 는 JSON 모드(response_format)와 stream 을 함께 쓸 수 없음 → JSON 호출은 항상 비스트리밍 (TTFB = 총 지연)
+        if not self.config.get("ai_stream", True) or "response_format" in kwargs:
+            resp = self.client.chat.completions.create(**kwargs)
+            u = resp.usage
+            return resp.choices[0].message.content, None, (u.prompt_tokens, u.completion_tokens) if u else None
+        parts, ttfb, usage = [], None, None
+        for chunk in self.client.chat.completions.create(**kwargs, stream=True):
+            if ttfb is None: ttfb = time.perf_counter() - t0
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+            x_groq = getattr(chunk, 'x_groq', None)
+            if x_groq is not None and getattr(x_groq, 'usage', None):
+                usage = (x_groq.usage.prompt_tokens, x_groq.usage.completion_tokens)
+        return "".join(parts), ttfb, usage
+
+    async def parse_json(self, res, name, guild_id=None):
+        """스키마 검증 + 로컬 복구 후, 실패 시에만 짧은 복구 요청을 한 번 보냅니다."""
+        before = self.parser.stats["local_repair"]
+        parsed = self.parser.parse(res, name)
+        if parsed is not None:
+            if self.parser.stats["local_repair"] > before:
+                self.telemetry.record_retry(name, guild_id, "local_repair")
+            return parsed
+        # 공급자 오류 메시지는 모델 출력이 아니므로 복구 요청 대상이 아님
+        if not isinstance(res, str) or res.startswith(("Error:", "❌")):
+            self.telemetry.record_retry(name, guild_id, "failed")
+            return None
+
+        logger.warning(f"[Parser] {name}: 로컬 복구 실패, 복구 요청 전송")
+        fixed = await self.generate_content(self.parser.repair_prompt(res, name), is_json=True,
+                                            prompt_type=f"{name}_repair", guild_id=guild_id)
+        parsed = self.parser.parse(fixed, name, remote=True)
+        self.telemetry.record_retry(name, guild_id, "remote_repair" if parsed is not None else "failed")
+        return parsed
+
+    async def generate_meeting_summary(self, transcript, guild_id=None):
         template = self.prompts.get('meeting_summary', "Error: Prompt not found")
         # [FIX] template을 바로 넘기지 않고 format을 먼저 수행
-        prompt = template.format(transcript=transcript)
+        # [UPDATE] 토큰 예산에 맞춰 변수 압축 후 format
+        prompt = self.budget.render('meeting_summary', template, transcript=transcript)
         
         logger.info("Generating Meeting Summary...")
-        try:
-            res = await self.generate_content(prompt, is_json=True)
-            res_clean = re.sub(r'```json\s*', '', res, flags=re.I).replace('```', '')
-            parsed = json.loads(res_clean.strip())
-            if isinstance(parsed, list): parsed = parsed[0] if parsed else {}
-            return parsed
-        except Exception as e:
-            logger.error(f"Summary Error: {e}")
+        res = await self.generate_content(prompt, is_json=True, prompt_type='meeting_summary', guild_id=guild_id)
+        parsed = await self.parse_json(res, 'meeting_summary', guild_id)
+        if parsed is None:
+            logger.error("Summary Error: 응답 파싱 실패")
             return {"title": "회의록", "summary": str(res), "agenda": [], "decisions": []}
+        return parsed
 
     # [UPDATE] members 인자 추가
-    async def extract_tasks_and_updates(self, transcript, current_project, active_tasks, members):
-        tasks_str = json.dumps(active_tasks, ensure_ascii=False)
+    # [UPDATE] related: 회의 내용과 관련된 과거 결정사항 (Retriever 상위 k 개)
+    async def extract_tasks_and_updates(self, transcript, current_project, active_tasks, members, guild_id=None, related=None):
         template = self.prompts.get('extract_tasks', "")
+        variables = {}
+        if related:
+            # 템플릿에 자리가 없으면 끝에 덧붙임 (예산이 모자라면 가장 먼저 줄어듦)
+            if "{related}" not in template: template += "\n\n[관련 과거 회의 결정사항]\n{related}"
+            variables['related'] = "\n".join(f"- {r}" for r in related)
         
         # [UPDATE] members 포맷팅 추가
-        prompt = template.format(
+        # [UPDATE] active_tasks는 리스트 그대로 넘겨 예산 초과 시 관련도 낮은 작업부터 생략
+        prompt = self.budget.render(
+            'extract_tasks', template,
             current_project=current_project,
-            tasks_str=tasks_str,
+            tasks_str=active_tasks,
             transcript=transcript,
-            members=members
+            members=members,
+            **variables
         )
 
         logger.info("Extracting tasks from meeting...")
-        try:
-            res = await self.generate_content(prompt, is_json=True)
-            res_clean = re.sub(r'```json\s*', '', res, flags=re.I).replace('```', '')
-            parsed = json.loads(res_clean.strip())
-            return parsed
-        except Exception as e:
-            logger.error(f"Task Extraction Failed: {e}")
+        res = await self.generate_content(prompt, is_json=True, prompt_type='extract_tasks', guild_id=guild_id)
+        parsed = await self.parse_json(res, 'extract_tasks', guild_id)
+        if parsed is None:
+            logger.error("Task Extraction Failed: 응답 파싱 실패")
             return {}
+        return parsed
 
-    async def review_code(self, repo, author, msg, diff):
+    async def review_code(self, repo, author, msg, diff, guild_id=None):
         template = self.prompts.get('code_review', "")
-        prompt = template.format(repo=repo, author=author, msg=msg, diff=diff[:20000])
+        prompt = self.budget.render('code_review', template, repo=repo, author=author, msg=msg, diff=diff)
         logger.info(f"Reviewing code...")
-        try:
-            res = await self.generate_content(prompt, is_json=True)
-            res_clean = re.sub(r'```json\s*', '', res, flags=re.I).replace('```', '')
-            parsed = json.loads(res_clean.strip())
-            if isinstance(parsed, list): parsed = parsed[0] if parsed else {}
-            return parsed
-        except Exception as e:
-            logger.error(f"Review Failed: {e}")
-            return {"summary": "실패", "issues": [], "suggestions": [], "score": 0}
\ No newline at end of file
+        res = await self.generate_content(prompt, is_json=True, prompt_type='code_review', guild_id=guild_id)
+        parsed = await self.parse_json(res, 'code_review', guild_id)
+        if parsed is None:
+            logger.error("Review Failed: 응답 파싱 실패")
+            return {"summary": "실패", "issues": [], "suggestions": [], "score": 0}
+        return parsed
+
+    # [NEW] 여러 커밋을 한 번의 호출로 리뷰 (작은 커밋끼리 토큰 예산 안에서 묶음)
+    def batch_packer(self):
+        return ReviewBatchPacker(self.budget, self.config.get("review_batch", {}))
+
+    async def review_code_batch(self, repo, commits, guild_id=None):
+        """묶음 리뷰 결과를 커밋 id 별로 나눠 돌려줍니다. 빠진 커밋은 개별 리뷰로 보충합니다."""
+        template = self.prompts.get('code_review_batch', "")
+        sections = [
+            f"### Commit {c['id'][:7]}\nAuthor: {c['author']}\nMsg: {c['msg']}\n[Diff]:\n{c['diff']}\n"
+            for c in commits
+        ]
+        prompt = self.budget.render('code_review_batch', template, repo=repo, commits="\n".join(sections))
+        logger.info(f"Reviewing {len(commits)} commits in one batch...")
+        res = await self.generate_content(prompt, is_json=True, prompt_type='code_review_batch', guild_id=guild_id)
+        parsed = await self.parse_json(res, 'code_review_batch', guild_id) or {"reviews": []}
+
+        results = {}
+        for item in parsed['reviews']:
+            if not isinstance(item, dict): continue
+            key = str(item.get('commit', ''))[:7]
+            target = next((c for c in commits if key and c['id'].startswith(key)), None)
+            review = self.parser._validate(item, 'code_review')
+            if target and review is not None: results[target['id']] = review
+
+        for c in commits:
+            if c['id'] not in results:
+                logger.warning(f"Batch review missing {c['id'][:7]}, falling back to single review")
+                results[c['id']] = await self.review_code(repo, c['author'], c['msg'], c['diff'], guild_id)
+        return results
+
+    async def review_batch(self, repo, batch, guild_id=None):
+        """batch_packer(ReviewBatchPacker) 가 만든 묶음 하나를 리뷰합니다."""
+        if len(batch) == 1:
+            c = batch[0]
+            return {c['id']: await self.review_code(repo, c['author'], c['msg'], c['diff'], guild_id)}
+        return await self.review_code_batch(repo, batch, guild_id)
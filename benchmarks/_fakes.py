@@ -0,0 +1,156 @@
+"""벤치마크용 가짜 Discord 객체와 오프라인 봇 구성 도우미."""
+import asyncio
+import itertools
+import os
+import random
+import tempfile
+
+from database import DBManager
+from ai_helper import AIHelper
+from services.repo_router import RepoRouter
+from services.retrieval import Retriever
+from services.dedup import DuplicateDetector
+
+_ids = itertools.count(1_000_000)
+
+
+class FakeMessage:
+    def __init__(self, content=None, **kwargs):
+        self.id = next(_ids)
+        self.content = content
+        self.kwargs = kwargs
+
+    async def edit(self, **kwargs): self.kwargs.update(kwargs)
+    async def delete(self): pass
+
+
+class FakeChannel:
+    def __init__(self, cid=None, guild=None):
+        self.id = cid or next(_ids)
+        self.guild = guild
+        self.parent = None
+        self.sent = 0
+
+    async def send(self, content=None, **kwargs):
+        self.sent += 1
+        return FakeMessage(content, **kwargs)
+
+    async def edit(self, **kwargs): pass
+    async def fetch_message(self, mid): return FakeMessage()
+
+
+class FakeMember:
+    def __init__(self, name):
+        self.id = next(_ids)
+        self.name = self.display_name = name
+        self.bot = False
+        self.mention = f"<@{self.id}>"
+
+
+class FakeGuild:
+    def __init__(self, gid, members=20):
+        self.id = gid
+        self.name = f"guild-{gid}"
+        self.members = [FakeMember(f"member{i}") for i in range(members)]
+
+
+class FakeCtx:
+    def __init__(self, guild):
+        self.guild = guild
+        self.channel = FakeChannel(guild=guild)
+        self.author = guild.members[0]
+
+    async def send(self, content=None, **kwargs):
+        return await self.channel.send(content, **kwargs)
+
+
+class FakeBot:
+    def __init__(self, ai, db):
+        self.ai = ai
+        self.db = db
+        self.channels = {}
+        self.repos = RepoRouter(self)
+        self.retriever = Retriever(db)
+        self.dedup = DuplicateDetector(db)
+
+    def get_cog(self, name): return None
+    def get_channel(self, cid): return self.channels.get(cid)
+
+
+def make_stub_bot(stub_options=None, db_path=None):
+    """stub 공급자를 쓰는 AIHelper 와 임시 DB 로 구성된 가짜 봇을 만듭니다."""
+    config = {"ai_provider": "stub", "stub": stub_options or {}}
+    ai = AIHelper(None, config=config)
+    if db_path is None:
+        fd, db_path = tempfile.mkstemp(suffix=".db", prefix="bench_")
+        os.close(fd)
+    return FakeBot(ai, DBManager(db_path)), db_path
+
+
+def make_transcript(n_lines, seed=0):
+    rng = random.Random(seed)
+    phrases = ["로그인 API 수정해야 합니다", "디자인 시안 검토 완료", "배포 일정은 금요일로 결정",
+               "DB 마이그레이션 담당할게요", "테스트 커버리지 확인 필요", "다음 회의까지 문서 정리하기로"]
+    return [{"time": f"10:{i % 60:02d}", "user": f"member{rng.randrange(5)}", "content": rng.choice(phrases)}
+            for i in range(n_lines)]
+
+
+def make_patch(lines_per_file=40, rng=None):
+    rng = rng or random.Random(0)
+    body = "\n".join(
+        f"+    value_{i} = compute({rng.randrange(100)})" + ("  # TODO" if rng.random() < 0.05 else "")
+        for i in range(lines_per_file))
+    return f"@@ -1,0 +1,{lines_per_file} @@\n{body}"
+
+
+def make_diff(n_files, lines_per_file=40, seed=0):
+    rng = random.Random(seed)
+    return "\n".join(f"📄 src/module_{f}.py\n{make_patch(lines_per_file, rng)}\n" for f in range(n_files))
+
+
+def make_push(repo, n_commits, seed=0, files_per_commit=1):
+    """커밋마다 자기 파일을 고치고, 3번째 커밋마다 공용 파일(src/shared.py)도 함께 고치는 push payload"""
+    rng = random.Random(seed)
+    commits = []
+    for i in range(n_commits):
+        sha = "%040x" % rng.getrandbits(160)
+        modified = [f"src/c{i}_f{k}.py" for k in range(files_per_commit)] + (["src/shared.py"] if i % 3 == 0 else [])
+        commits.append({
+            "id": sha, "message": f"commit {i}: update module", "url": f"https://github.com/{repo}/commit/{sha}",
+            "author": {"name": f"dev{i % 3}"}, "added": [], "removed": [], "modified": modified,
+        })
+    return {"repository": {"full_name": repo}, "commits": commits,
+            "before": "%040x" % rng.getrandbits(160), "after": commits[-1]["id"] if commits else None}
+
+
+class FakeGitHub:
+    """등록된 push payload 를 바탕으로 commits / compare 응답을 흉내 내는 GitHub 클라이언트"""
+    def __init__(self, latency=0.0, lines_per_file=40):
+        self.latency = latency
+        self.lines_per_file = lines_per_file
+        self.token = None
+        self.requests = 0
+        self._commits = {}
+        self._pushes = {}
+
+    def register(self, push):
+        for c in push["commits"]: self._commits[c["id"]] = c
+        self._pushes[f"{push['before']}...{push['after']}"] = push
+
+    def _files(self, names, seed):
+        rng = random.Random(seed)
+        return [{"filename": n, "patch": make_patch(self.lines_per_file, rng)} for n in names]
+
+    async def get_json(self, url, conditional=True):
+        self.requests += 1
+        if self.latency: await asyncio.sleep(self.latency)
+        key = url.rsplit("/", 1)[-1]
+        if "/compare/" in url:
+            push = self._pushes.get(key)
+            if not push: return None
+            names = list(dict.fromkeys(n for c in push["commits"] for n in c["modified"] + c["added"]))
+            return {"files": self._files(names, hash(key) & 0xffff)}
+        c = self._commits.get(key)
+        return {"files": self._files(c["modified"] + c["added"], hash(key) & 0xffff)} if c else None
+
+    async def close(self): pass
@@ -0,0 +1,87 @@
+"""
+텍스트 분할 벤치마크 (수 MB 입력).
+기존 smart_chunk_text(문자열 += 누적, 코드 포인트 기준)와 services.chunker.chunk_text 를 비교하고,
+새 방식의 결과가 Discord 한도(UTF-16)와 코드 펜스 짝을 지키는지 함께 확인합니다.
+
+사용법 (프로젝트 루트에서):
+    python -m benchmarks.bench_chunker --sizes 1 4 16 --limit 2000
+"""
+import argparse
+import random
+import time
+
+from services.chunker import _FENCE_RE, chunk_text, utf16_len
+
+
+def legacy_chunk(text, limit=1500):
+    """이전 utils.smart_chunk_text (비교용)"""
+    chunks = []
+    current_chunk = ""
+    in_code_block = False
+    code_block_lang = ""
+    for line in text.split('\n'):
+        if len(current_chunk) + len(line) + 20 > limit:
+            if in_code_block:
+                chunks.append(current_chunk + "\n```")
+                current_chunk = f"```{code_block_lang}\n{line}"
+            else:
+                chunks.append(current_chunk)
+                current_chunk = line
+        else:
+            if current_chunk: current_chunk += "\n" + line
+            else: current_chunk = line
+        stripped = line.strip()
+        if stripped.startswith("```"):
+            if in_code_block:
+                in_code_block = False; code_block_lang = ""
+            else:
+                in_code_block = True; code_block_lang = stripped.replace("```", "").strip()
+    if current_chunk: chunks.append(current_chunk)
+    return chunks
+
+
+def make_text(mb, seed=0):
+    """리뷰/요약과 비슷한 텍스트: 한글·이모지, 중첩 목록, 코드 블록, 가끔 아주 긴 줄"""
+    rng = random.Random(seed)
+    words = ["리뷰", "변경", "함수", "`handler`", "**주의**", "✅", "🚀", "value", "None", "예외 처리"]
+    out, size, target = [], 0, mb * 1024 * 1024
+    while size < target:
+        r = rng.random()
+        if r < 0.05:
+            block = ["```python"] + [f"    result_{i} = compute({rng.randrange(100)})" for i in range(rng.randint(5, 60))] + ["```"]
+        elif r < 0.07:
+            block = [" ".join(rng.choice(words) for _ in range(rng.randint(500, 1500)))]
+        elif r < 0.4:
+            block = [f"- 항목 {rng.randrange(1000)}: " + " ".join(rng.choice(words) for _ in range(rng.randint(3, 15)))]
+            block += [f"  - 세부 {k}: " + " ".join(rng.choice(words) for _ in range(rng.randint(2, 8))) for k in range(rng.randint(0, 3))]
+        else:
+            block = [" ".join(rng.choice(words) for _ in range(rng.randint(5, 30)))]
+        out.extend(block); size += sum(len(b) + 1 for b in block)
+    return "\n".join(out)
+
+
+def check(chunks, limit):
+    over = sum(1 for c in chunks if utf16_len(c) > limit)
+    unbalanced = sum(1 for c in chunks if sum(1 for l in c.split("\n") if _FENCE_RE.match(l)) % 2)
+    return over, unbalanced
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1, 4, 16], help="입력 크기 (MB)")
+    ap.add_argument("--limit", type=int, default=2000)
+    args = ap.parse_args()
+
+    for mb in args.sizes:
+        text = make_text(mb)
+        t0 = time.perf_counter(); old = legacy_chunk(text, args.limit); t_old = time.perf_counter() - t0
+        t0 = time.perf_counter(); new = chunk_text(text, args.limit); t_new = time.perf_counter() - t0
+        o_over, o_bad = check(old, args.limit)
+        n_over, n_bad = check(new, args.limit)
+        print(f"[{mb}MB] legacy {t_old * 1000:8.1f} ms, {len(old)} chunks, over-limit {o_over}, unbalanced fences {o_bad}")
+        print(f"{'':6} chunker {t_new * 1000:7.1f} ms, {len(new)} chunks, over-limit {n_over}, unbalanced fences {n_bad}"
+              f"  ({len(text) / 1024 / 1024 / t_new:.1f} MB/s)")
+
+
+if __name__ == "__main__":
+    main()
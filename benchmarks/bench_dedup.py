@@ -0,0 +1,79 @@
+"""
+중복 작업 검사 벤치마크 (DB 없이 services.dedup.TfidfMatrix 직접 사용).
+작업 N 개로 행렬을 만든 뒤 구축/증분 갱신/질의 시간을 재고, 질의 결과를
+작업마다 n-gram 벡터를 만들어 비교하는 순수 파이썬 방식과 비교합니다.
+
+사용법 (프로젝트 루트에서):
+    python -m benchmarks.bench_dedup --tasks 10000 50000
+"""
+import argparse
+import math
+import random
+import time
+from collections import Counter
+
+from services.dedup import TfidfMatrix, char_ngrams
+
+TOPICS = ["로그인", "결제", "알림", "배포", "캐시", "검색", "대시보드", "권한", "업로드", "리포트", "온보딩", "모니터링"]
+VERBS = ["구현", "수정", "리팩터링", "테스트 작성", "문서화", "성능 개선", "버그 조사", "디자인 검토"]
+EXTRA = ["API", "DB", "iOS", "Android", "웹훅", "Redis", "S3", "CI", "v2", "스테이징"]
+
+
+def make_task(rng):
+    return f"{rng.choice(TOPICS)} {rng.choice(EXTRA)} {rng.choice(VERBS)} ({rng.randrange(5000)})"
+
+
+def brute_force(texts, query, k=3):
+    """작업마다 idf 가중 벡터를 만들어 코사인 비교 (비교용)"""
+    n = len(texts)
+    grams = [Counter(char_ngrams(t)) for t in texts]
+    df = Counter(g for c in grams for g in c)
+    idf = lambda g: math.log((1 + n) / (1 + df.get(g, 0))) + 1
+    vec = lambda c: {g: (1 + math.log(v)) * idf(g) for g, v in c.items()}
+    q = vec(Counter(char_ngrams(query))); qn = math.sqrt(sum(v * v for v in q.values()))
+    scores = []
+    for i, c in enumerate(grams):
+        d = vec(c); dn = math.sqrt(sum(v * v for v in d.values()))
+        scores.append((sum(w * d.get(g, 0) for g, w in q.items()) / (qn * dn), i))
+    return sorted(scores, reverse=True)[:k]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tasks", type=int, nargs="+", default=[10000, 50000])
+    ap.add_argument("--queries", type=int, default=50)
+    ap.add_argument("--brute", type=int, default=10000, help="이 개수 이하일 때만 순수 파이썬 방식도 측정")
+    args = ap.parse_args()
+
+    for n in args.tasks:
+        rng = random.Random(n)
+        texts = [make_task(rng) for _ in range(n)]
+        m = TfidfMatrix()
+        t0 = time.perf_counter()
+        for i, t in enumerate(texts): m.add(i, t)
+        m._refresh_norms()
+        t_build = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for _ in range(1000):
+            i = rng.randrange(n); texts[i] = make_task(rng); m.add(i, texts[i])
+        t_update = (time.perf_counter() - t0) / 1000
+
+        # 기존 작업을 조금 바꾼 제안 (접미사·띄어쓰기 변형)
+        queries = [texts[rng.randrange(n)].replace(" ", "", 1) + " 진행" for _ in range(args.queries)]
+        m.similar(queries[0])    # warm-up (posting 배열 캐시)
+        t0 = time.perf_counter()
+        results = [m.similar(q, 3) for q in queries]
+        t_query = (time.perf_counter() - t0) / len(queries)
+        best = sum(r[0][1] for r in results if r) / len(results)
+        print(f"[{n} tasks] build {t_build * 1000:.0f} ms, update {t_update * 1e6:.0f} us/task, "
+              f"query {t_query * 1000:.2f} ms (평균 최고 유사도 {best:.2f})")
+
+        if n <= args.brute:
+            t0 = time.perf_counter(); ref = brute_force(texts, queries[0]); t_brute = time.perf_counter() - t0
+            same = [i for _, i in ref] == [k for k, _ in m.similar(queries[0], 3)]
+            print(f"{'':6} brute-force {t_brute * 1000:.0f} ms/query (상위 3개 일치: {same})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+큰 합성 push 에서 DiffSelector 와 기존 방식(API 순서 + 파일당 2500자 + 예산에서 잘라냄)을 비교합니다.
+'핵심 변경 보존율' = 리뷰 가치가 큰 소스 파일(src/)의 변경 줄 중 프롬프트에 들어간 비율.
+
+사용법 (프로젝트 루트에서):
+    python -m benchmarks.bench_diff_selection --files 200 --budget 5000 --rounds 20
+"""
+import argparse
+import random
+import time
+
+from services.diff_selector import DiffSelector
+from services.prompt_budget import estimate_tokens
+
+
+def make_files(n, seed=0):
+    """벤더/생성/lock/테스트 파일이 섞인 files 배열. 큰 벤더 파일이 앞쪽에 오도록 배치"""
+    rng = random.Random(seed)
+    files = [{"filename": "vendor/lib/big.js", "patch": _patch(rng, 6, 400)},
+             {"filename": "package-lock.json", "patch": _patch(rng, 1, 800)},
+             {"filename": "static/app.min.js", "patch": _patch(rng, 1, 300)}]
+    kinds = ["src", "src", "src", "tests", "docs", "generated", "vendor"]
+    for i in range(n - len(files)):
+        kind = rng.choice(kinds)
+        name = {"src": f"src/module_{i}.py", "tests": f"tests/test_module_{i}.py", "docs": f"docs/page_{i}.md",
+                "generated": f"proto/msg_{i}_pb2.py", "vendor": f"third_party/pkg_{i}/mod.py"}[kind]
+        files.append({"filename": name, "patch": _patch(rng, rng.randint(1, 4), rng.randint(5, 80))})
+    return files
+
+
+def _patch(rng, hunks, lines):
+    out = []
+    for h in range(hunks):
+        out.append(f"@@ -{h * 100},{lines} +{h * 100},{lines} @@")
+        for i in range(lines):
+            prefix = rng.choice(["+", "-", " ", " "])
+            out.append(f"{prefix}    value_{i} = compute({rng.randrange(1000)})")
+    return "\n".join(out)
+
+
+def naive(files, budget):
+    """기존 방식: API 순서대로 파일당 2500자 자르고, 예산(토큰) 초과분은 뒤에서 잘라냄"""
+    parts = []
+    for f in files:
+        if f["filename"].endswith(("package-lock.json", ".lock")): continue
+        patch = f["patch"][:2500]
+        parts.append(f"📄 {f['filename']}\n{patch}\n")
+    text = "\n".join(parts)
+    est = estimate_tokens(text)
+    return text[:int(len(text) * budget / est)] if est > budget else text
+
+
+def coverage(text, files):
+    kept = total = 0
+    for f in files:
+        if not f["filename"].startswith("src/"): continue
+        changed = [l for l in f["patch"].split("\n") if l[:1] in "+-"]
+        total += len(changed)
+        kept += sum(1 for l in changed if l in text)
+    return kept / total if total else 0.0
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--files", type=int, default=200)
+    ap.add_argument("--budget", type=int, default=5000, help="diff 토큰 예산")
+    ap.add_argument("--rounds", type=int, default=20)
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args()
+
+    selector = DiffSelector(args.budget)
+    results = {"naive": [], "selector": []}
+    for r in range(args.rounds):
+        files = make_files(args.files, seed=args.seed + r)
+        t0 = time.perf_counter(); text = naive(files, args.budget)
+        results["naive"].append((time.perf_counter() - t0, coverage(text, files), estimate_tokens(text)))
+        t0 = time.perf_counter(); text, report = selector.select(files)
+        results["selector"].append((time.perf_counter() - t0, coverage(text, files), estimate_tokens(text)))
+
+    for name, rows in results.items():
+        n = len(rows)
+        print(f"[{name}] files={args.files} budget={args.budget} "
+              f"time={sum(r[0] for r in rows) / n * 1000:.2f}ms src_coverage={sum(r[1] for r in rows) / n:.1%} "
+              f"tokens={sum(r[2] for r in rows) / n:.0f}")
+    print(f"  last report: {DiffSelector.describe(report)}")
+
+
+if __name__ == "__main__":
+    main()
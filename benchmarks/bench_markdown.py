@@ -0,0 +1,140 @@
+"""
+Markdown → flowable 변환 마이크로 벤치마크.
+기존 방식(코드 펜스 re.split + 줄마다 re.match / 클로저 / ListItem 스타일 생성)과
+services.pdf.parse_markdown_to_flowables(단일 패스, 미리 컴파일한 패턴, 공유 스타일)를 비교합니다.
+  - full     : reportlab Paragraph 생성(마크업 파싱)까지 포함한 시간
+  - tokenize : flowable 클래스를 빈 객체로 바꿔 토크나이저 자체 비용만 측정
+새 방식은 표를 셀 단위 Table 로 만들므로(기존은 줄마다 Paragraph) 회의 텍스트의 flowable 수가 다릅니다.
+
+사용법 (프로젝트 루트에서):
+    python -m benchmarks.bench_markdown --sections 200 --rounds 20
+"""
+import argparse
+import contextlib
+import html
+import random
+import re
+import time
+
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Paragraph
+
+from services import pdf
+
+
+def legacy_parse(text, styles, font_name):
+    """이전 parse_markdown_to_flowables (비교용)"""
+    story = []
+    parts = re.split(r'```(?:\w+)?\n(.*?)```', text, flags=re.DOTALL)
+    for i, part in enumerate(parts):
+        if i % 2 == 1:
+            code_content = part.strip()
+            if not code_content: continue
+            story.append(Paragraph(html.escape(code_content).replace('\n', '<br/>').replace(' ', '&nbsp;'), styles['ReportCode']))
+            continue
+        for line in part.split('\n'):
+            if not line.strip(): continue
+            stripped_line = line.lstrip()
+            if stripped_line.startswith('#'):
+                content = stripped_line.lstrip('#').strip()
+                story.append(Paragraph(f"<b>{html.escape(content)}</b>", styles['ReportH1']))
+                continue
+            bullet, content, is_list = "", "", False
+            if stripped_line.startswith(('- ', '* ')):
+                is_list = True; bullet = "•"; content = stripped_line[2:]
+            elif re.match(r'^\d+\.\s', stripped_line):
+                is_list = True
+                m = re.match(r'^(\d+\.)\s', stripped_line)
+                bullet = m.group(1); content = stripped_line[m.end():]
+
+            def process_inline(txt):
+                txt = html.escape(txt)
+                txt = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', txt)
+                txt = re.sub(r'`([^`]+)`', f'<font backColor="{pdf.CODE_BG.hexval()}" name="{font_name}">&nbsp;\\1&nbsp;</font>', txt)
+                return txt
+
+            final_text = process_inline(content if is_list else stripped_line)
+            if is_list:
+                list_style = ParagraphStyle('ListItem', parent=styles['ReportNormal'], leftIndent=20, firstLineIndent=-15)
+                story.append(Paragraph(f"{bullet} {final_text}", list_style))
+            else:
+                story.append(Paragraph(final_text, styles['ReportNormal']))
+    return story
+
+
+def make_review_text(sections, seed=0):
+    """AI 리뷰 본문과 비슷한 텍스트: 제목, 중첩 목록, 인라인 코드, 코드 블록"""
+    rng = random.Random(seed)
+    out = []
+    for s in range(sections):
+        out.append(f"## {s}. `module_{s}.py` 검토")
+        out.append(f"**요약**: 함수 `handler_{s}` 의 예외 처리가 누락되었습니다. " * rng.randint(1, 3))
+        for k in range(rng.randint(2, 5)):
+            out.append(f"- 문제 {k}: `value_{k}` 가 **None** 일 수 있음")
+            out.append(f"  - 원인: 호출부에서 검증하지 않음")
+            out.append(f"    - 제안: early return")
+        out.append("```python")
+        out.extend(f"    result_{j} = compute({rng.randrange(100)})" for j in range(rng.randint(3, 10)))
+        out.append("```")
+    return "\n".join(out)
+
+
+def make_meeting_text(sections, seed=1):
+    """회의 요약과 비슷한 텍스트: 번호 목록, 표"""
+    rng = random.Random(seed)
+    out = []
+    for s in range(sections):
+        out.append(f"### 안건 {s}")
+        out.extend(f"{k + 1}. 논의 내용 {k} - 담당자 확정 필요" for k in range(rng.randint(2, 4)))
+        out.append("| 담당 | 작업 | 기한 |")
+        out.append("|---|---|---|")
+        out.extend(f"| 멤버{k} | 작업 {s}-{k} | 2026-0{k % 9 + 1}-15 |" for k in range(rng.randint(2, 5)))
+        out.append("")
+    return "\n".join(out)
+
+
+class _Stub:
+    def __init__(self, *args, **kwargs): pass
+
+
+@contextlib.contextmanager
+def stub_flowables():
+    """Paragraph / Preformatted / Table 생성을 건너뛰도록 잠시 교체"""
+    g = globals()
+    saved = {name: getattr(pdf, name) for name in ("Paragraph", "Preformatted", "Table", "Spacer")}
+    saved_local = g["Paragraph"]
+    for name in saved: setattr(pdf, name, _Stub)
+    g["Paragraph"] = _Stub
+    try: yield
+    finally:
+        for name, obj in saved.items(): setattr(pdf, name, obj)
+        g["Paragraph"] = saved_local
+
+
+def bench(fn, text, styles, font_name, rounds):
+    fn(text, styles, font_name)    # warm-up
+    t0 = time.perf_counter()
+    for _ in range(rounds): n = len(fn(text, styles, font_name))
+    return (time.perf_counter() - t0) / rounds * 1000, n
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sections", type=int, default=200)
+    ap.add_argument("--rounds", type=int, default=20)
+    args = ap.parse_args()
+
+    font_name, styles = pdf.setup()
+    for label, text in (("review", make_review_text(args.sections)), ("meeting", make_meeting_text(args.sections))):
+        print(f"[{label}] {len(text) / 1024:.0f}KB, {text.count(chr(10)) + 1} lines")
+        old_ms, old_n = bench(legacy_parse, text, styles, font_name, args.rounds)
+        new_ms, new_n = bench(pdf.parse_markdown_to_flowables, text, styles, font_name, args.rounds)
+        with stub_flowables():
+            old_tok, _ = bench(legacy_parse, text, styles, font_name, args.rounds)
+            new_tok, _ = bench(pdf.parse_markdown_to_flowables, text, styles, font_name, args.rounds)
+        print(f"  full     : legacy {old_ms:8.2f} ms ({old_n} flowables) | new {new_ms:8.2f} ms ({new_n} flowables)  x{old_ms / new_ms:.2f}")
+        print(f"  tokenize : legacy {old_tok:8.2f} ms | new {new_tok:8.2f} ms  x{old_tok / new_tok:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+회의록 PDF 처리량(PDFs/sec) 비교.
+  - per-call setup : 기존 방식. 매 호출마다 폰트 등록(TTF 파싱) + 스타일시트 생성
+  - cached setup   : 같은 프로세스에서 폰트·스타일시트를 한 번만 준비
+  - PDFService     : 프로세스 풀(워커당 한 번 준비) + 비동기 API, 동시 요청
+함께 PDFService 사용 중 이벤트 루프가 가장 길게 멈춘 시간도 출력합니다.
+
+사용법 (프로젝트 루트에서, src/fonts 에 NanumGothic 이 있으면 실제 폰트로 측정):
+    python -m benchmarks.bench_pdf --n 40 --workers 4
+"""
+import argparse
+import asyncio
+import time
+
+from services import pdf
+from services.pdf_service import PDFService
+
+
+def make_meeting(i, agenda=8):
+    return {
+        "title": f"주간 회의 #{i}", "date": "2026-01-05",
+        "summary": "이번 주 배포 일정과 장애 대응 방안을 논의했습니다. " * 12,
+        "agenda": [{"topic": f"안건 {k}", "content": "세부 논의 내용과 담당자 배정. " * 8} for k in range(agenda)],
+        "decisions": [f"결정 사항 {k}: 다음 스프린트에 반영" for k in range(6)],
+    }
+
+
+def bench_sync(n, cached):
+    t0 = time.perf_counter()
+    for i in range(n):
+        if not cached: pdf._SETUP = None
+        pdf.generate_meeting_pdf(make_meeting(i))
+    return n / (time.perf_counter() - t0)
+
+
+async def bench_service(n, workers):
+    svc = PDFService(workers)
+    svc.start()
+    await svc.meeting(make_meeting(0))    # 워커 기동 완료 대기
+
+    lag = {"max": 0.0}
+    stop = asyncio.Event()
+
+    async def probe():
+        loop = asyncio.get_running_loop()
+        while not stop.is_set():
+            t = loop.time(); await asyncio.sleep(0.005)
+            lag["max"] = max(lag["max"], loop.time() - t - 0.005)
+
+    task = asyncio.create_task(probe())
+    t0 = time.perf_counter()
+    await asyncio.gather(*(svc.meeting(make_meeting(i)) for i in range(n)))
+    rate = n / (time.perf_counter() - t0)
+    stop.set(); await task
+    svc.shutdown()
+    return rate, lag["max"]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=40)
+    ap.add_argument("--workers", type=int, default=4)
+    args = ap.parse_args()
+
+    print(f"font: {pdf.setup()[0]}  | {args.n} meeting PDFs")
+    print(f"per-call setup : {bench_sync(args.n, cached=False):7.1f} PDFs/s")
+    print(f"cached setup   : {bench_sync(args.n, cached=True):7.1f} PDFs/s")
+    rate, lag = asyncio.run(bench_service(args.n, args.workers))
+    print(f"PDFService x{args.workers}  : {rate:7.1f} PDFs/s  (max loop lag {lag * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
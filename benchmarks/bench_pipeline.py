@@ -0,0 +1,102 @@
+"""
+오프라인 stub AI 공급자로 회의 분석 파이프라인(process_meeting_result)과
+웹훅 리뷰 경로(WebhookServer.process_payload)의 처리량을 측정합니다.
+
+사용법 (프로젝트 루트에서):
+    python -m benchmarks.bench_pipeline --meetings 50 --pushes 50 --commits 5 --concurrency 8 \
+        --latency 0.2 --error-rate 0.05
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+from services.meeting_service import process_meeting_result
+from services.webhook import WebhookServer
+from benchmarks._fakes import FakeChannel, FakeCtx, FakeGitHub, FakeGuild, make_push, make_stub_bot, make_transcript
+
+
+def _report(name, latencies, elapsed):
+    latencies = sorted(latencies)
+    p = lambda q: latencies[min(int(len(latencies) * q), len(latencies) - 1)] * 1000
+    print(f"[{name}] n={len(latencies)} total={elapsed:.2f}s throughput={len(latencies) / elapsed:.1f}/s "
+          f"p50={p(0.5):.1f}ms p95={p(0.95):.1f}ms mean={statistics.mean(latencies) * 1000:.1f}ms")
+
+
+async def _run_bounded(n, concurrency, factory):
+    sem = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i):
+        async with sem:
+            t0 = time.perf_counter()
+            await factory(i)
+            latencies.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(n)))
+    return latencies, time.perf_counter() - t0
+
+
+async def bench_meetings(bot, n, concurrency, lines):
+    guild = FakeGuild(1)
+
+    async def run(i):
+        ctx = FakeCtx(guild)
+        data = {"name": f"bench {i}", "jump_url": "https://discord.com/channels/x", "start_msg_id": None, "project_name": "일반"}
+        await process_meeting_result(ctx, bot, data, make_transcript(lines, seed=i))
+
+    latencies, elapsed = await _run_bounded(n, concurrency, run)
+    _report("process_meeting_result", latencies, elapsed)
+
+
+async def bench_webhook(bot, n, concurrency, commits, diff_files, diff_latency):
+    repo = "bench/repo"
+    ch = FakeChannel(cid=424242)
+    bot.channels[ch.id] = ch
+    bot.repos.add(repo, ch, "bench")
+    bot.github = FakeGitHub(latency=diff_latency)
+    server = WebhookServer(bot)
+
+    async def run(i):
+        push = make_push(repo, commits, seed=i, files_per_commit=diff_files)
+        bot.github.register(push)
+        await server.process_payload(push)
+
+    latencies, elapsed = await _run_bounded(n, concurrency, run)
+    _report("process_payload", latencies, elapsed)
+    print(f"  messages sent: {ch.sent}, AI calls: {bot.ai.stub.calls}, GitHub requests: {bot.github.requests}")
+
+
+async def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--meetings", type=int, default=20)
+    ap.add_argument("--lines", type=int, default=200, help="회의당 발언 수")
+    ap.add_argument("--pushes", type=int, default=20)
+    ap.add_argument("--commits", type=int, default=5, help="push 당 커밋 수")
+    ap.add_argument("--diff-files", type=int, default=2, help="커밋당 변경 파일 수")
+    ap.add_argument("--diff-latency", type=float, default=0.05, help="GitHub diff 조회 지연(초)")
+    ap.add_argument("--concurrency", type=int, default=4)
+    ap.add_argument("--latency", type=float, default=0.1, help="stub AI 응답 지연 중앙값(초)")
+    ap.add_argument("--sigma", type=float, default=0.3)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--malformed-rate", type=float, default=0.0)
+    ap.add_argument("--diff-strategy", default="auto", choices=["auto", "per_commit", "compare_split", "compare_whole"])
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args()
+
+    stub = {"seed": args.seed, "latency": {"dist": "lognormal", "mean": args.latency, "sigma": args.sigma},
+            "error_rate": args.error_rate, "malformed_rate": args.malformed_rate}
+    bot, db_path = make_stub_bot(stub)
+    bot.ai.config["diff_strategy"] = {"mode": args.diff_strategy}
+    try:
+        if args.meetings: await bench_meetings(bot, args.meetings, args.concurrency, args.lines)
+        if args.pushes:
+            await bench_webhook(bot, args.pushes, args.concurrency, args.commits, args.diff_files, args.diff_latency)
+    finally:
+        os.remove(db_path)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
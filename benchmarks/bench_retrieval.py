@@ -0,0 +1,75 @@
+"""
+BM25 관련도 선별 벤치마크 (DB 없이 services.retrieval.BM25Index 직접 사용).
+작업 N 개 + 회의 결정사항을 색인한 뒤 색인/증분 갱신/질의 시간을 재고,
+extract_tasks 프롬프트의 작업 목록을 전체로 넣을 때와 상위 k 개만 넣을 때의 토큰 수를 비교합니다.
+
+사용법 (프로젝트 루트에서):
+    python -m benchmarks.bench_retrieval --tasks 2000 10000 --k 30
+"""
+import argparse
+import json
+import random
+import time
+
+from services.prompt_budget import estimate_tokens
+from services.retrieval import DECISION, TASK, BM25Index
+
+TOPICS = ["로그인", "결제", "알림", "배포", "캐시", "검색", "대시보드", "권한", "업로드", "리포트", "온보딩", "모니터링"]
+VERBS = ["구현", "수정", "리팩터링", "테스트 작성", "문서화", "성능 개선", "버그 조사", "디자인 검토"]
+EXTRA = ["api", "db", "ios", "android", "webhook", "redis", "s3", "ci", "v2", "staging"]
+
+
+def make_task(rng):
+    return f"{rng.choice(TOPICS)} {rng.choice(EXTRA)} {rng.choice(VERBS)} #{rng.randrange(1000)}"
+
+
+def make_transcript(rng, lines=300):
+    """특정 주제 두세 개에 집중된 회의 내용"""
+    focus = rng.sample(TOPICS, 3)
+    out = []
+    for i in range(lines):
+        topic = rng.choice(focus) if rng.random() < 0.8 else rng.choice(TOPICS)
+        out.append(f"[10:{i % 60:02d}] User{i % 7}: {topic} 쪽 {rng.choice(EXTRA)} {rng.choice(VERBS)} 은 이번 주 안에 끝내죠")
+    return "\n".join(out), focus
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--tasks", type=int, nargs="+", default=[2000, 10000])
+    ap.add_argument("--decisions", type=int, default=2000)
+    ap.add_argument("--k", type=int, default=30)
+    ap.add_argument("--rounds", type=int, default=20)
+    args = ap.parse_args()
+
+    for n in args.tasks:
+        rng = random.Random(n)
+        tasks = [{'id': i, 'content': make_task(rng), 'status': 'TODO'} for i in range(n)]
+        idx = BM25Index()
+        t0 = time.perf_counter()
+        for t in tasks: idx.add(('task', t['id']), t['content'], TASK)
+        for i in range(args.decisions): idx.add(('decision', i, 0), f"{rng.choice(TOPICS)} 은 {rng.choice(EXTRA)} 로 진행", DECISION)
+        t_build = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        for i in range(1000):
+            tid = rng.randrange(n); idx.add(('task', tid), make_task(rng), TASK)
+        t_update = (time.perf_counter() - t0) / 1000
+
+        transcript, focus = make_transcript(rng)
+        idx.search(transcript, args.k, TASK)    # warm-up (posting 배열 캐시)
+        t0 = time.perf_counter()
+        for _ in range(args.rounds): hits = idx.search(transcript, args.k, TASK)
+        t_query = (time.perf_counter() - t0) / args.rounds
+
+        chosen = {key[1] for key, _ in hits}
+        top = [t for t in tasks if t['id'] in chosen]
+        on_topic = sum(1 for t in top if any(f in t['content'] for f in focus))
+        full_tok = estimate_tokens(json.dumps(tasks, ensure_ascii=False))
+        top_tok = estimate_tokens(json.dumps(top, ensure_ascii=False))
+        print(f"[{n} tasks + {args.decisions} decisions] build {t_build * 1000:.0f} ms, "
+              f"update {t_update * 1e6:.0f} us/doc, query {t_query * 1000:.1f} ms ({len(transcript)} chars)")
+        print(f"{'':6} tasks_str tokens: all {full_tok} → top-{args.k} {top_tok} (회의 주제와 일치 {on_topic}/{len(top)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+로컬 웹훅 서버(stub AI, 가짜 GitHub)에 push 이벤트를 몰아 보내는 부하 테스트.
+수신 응답 코드 분포, 수신 지연, 큐 최대 적체량, 우선 작업(작은 push / 자체 업데이트)의 처리 순서를 보고합니다.
+
+사용법 (프로젝트 루트에서):
+    python -m benchmarks.load_webhook --requests 500 --clients 50 --max-pending 50 --workers 2
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from collections import Counter
+
+import aiohttp
+from aiohttp.test_utils import TestServer
+
+from services.webhook import WebhookServer
+from benchmarks._fakes import FakeChannel, FakeGitHub, make_push, make_stub_bot
+
+SELF_REPO = "bench/bot"
+
+
+async def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--requests", type=int, default=500)
+    ap.add_argument("--clients", type=int, default=50, help="동시 전송 클라이언트 수")
+    ap.add_argument("--max-pending", type=int, default=50)
+    ap.add_argument("--max-inflight", type=int, default=32)
+    ap.add_argument("--max-body-kb", type=int, default=256)
+    ap.add_argument("--workers", type=int, default=2)
+    ap.add_argument("--latency", type=float, default=0.05, help="stub AI 응답 지연 중앙값(초)")
+    ap.add_argument("--oversize-rate", type=float, default=0.02, help="본문 한도를 넘는 요청 비율")
+    ap.add_argument("--seed", type=int, default=42)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    stub = {"seed": args.seed, "latency": {"dist": "lognormal", "mean": args.latency, "sigma": 0.3}}
+    bot, db_path = make_stub_bot(stub)
+    bot.ai.config["webhook_limits"] = {"max_pending_jobs": args.max_pending, "max_inflight_requests": args.max_inflight,
+                                       "max_body_kb": args.max_body_kb, "retry_after": 5}
+    bot.ai.config["webhook_queue"] = {"workers": args.workers}
+    bot.ai.config["bot_repo"] = SELF_REPO
+    bot.github = FakeGitHub()
+    ch = FakeChannel(cid=1); bot.channels[1] = ch
+    bot.repos.add("bench/repo", ch, "bench")
+
+    server = WebhookServer(bot)
+    processed = []    # (priority, 처리 완료 시각)
+    orig = server.process_payload
+
+    async def process(data, delivery_id=None):
+        if data['repository']['full_name'] == SELF_REPO:
+            processed.append((2, time.perf_counter())); return    # 실제 업데이트(sys.exit)는 생략
+        await orig(data, delivery_id)
+        processed.append((server._priority(data), time.perf_counter()))
+    server.queue.handler = process
+
+    ts = TestServer(server.app); await ts.start_server()
+    server.queue.start()
+    url = str(ts.make_url(server.path))
+
+    bodies = []
+    for i in range(args.requests):
+        r = rng.random()
+        if i == args.requests // 2:
+            push = make_push(SELF_REPO, 1, seed=i)
+        elif r < args.oversize_rate:
+            push = make_push("bench/repo", 3, seed=i); push["padding"] = "x" * (args.max_body_kb * 1024 + 1)
+        else:
+            push = make_push("bench/repo", 1 if r < 0.4 else rng.randint(3, 12), seed=i)
+        bot.github.register(push)
+        bodies.append(json.dumps(push))
+
+    codes, latencies, peak = Counter(), [], 0
+    sem = asyncio.Semaphore(args.clients)
+    t0 = time.perf_counter()
+    async with aiohttp.ClientSession() as session:
+        async def send(i, body):
+            nonlocal peak
+            async with sem:
+                t = time.perf_counter()
+                async with session.post(url, data=body, headers={"X-GitHub-Delivery": f"load-{i}"}) as r:
+                    await r.read()
+                    codes[r.status] += 1
+                latencies.append(time.perf_counter() - t)
+                peak = max(peak, bot.db.count_open_jobs())
+        await asyncio.gather(*(send(i, b) for i, b in enumerate(bodies)))
+    ingest = time.perf_counter() - t0
+
+    while bot.db.count_open_jobs():
+        await asyncio.sleep(0.05)
+    drain = time.perf_counter() - t0
+    await server.queue.stop(); await ts.close(); os.remove(db_path)
+
+    latencies.sort()
+    p = lambda q: latencies[min(int(len(latencies) * q), len(latencies) - 1)] * 1000
+    print(f"[ingest] {args.requests} requests in {ingest:.2f}s | p50={p(0.5):.1f}ms p95={p(0.95):.1f}ms p99={p(0.99):.1f}ms")
+    print(f"  status: {dict(sorted(codes.items()))} | peak open jobs: {peak} (limit {args.max_pending})")
+    print(f"[drain] all accepted jobs done in {drain:.2f}s | processed={len(processed)} AI calls={bot.ai.stub.calls}")
+    for prio in (2, 1, 0):
+        times = [t - t0 for pr, t in processed if pr == prio]
+        if times: print(f"  priority {prio}: {len(times)} jobs, mean completion {sum(times) / len(times):.2f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
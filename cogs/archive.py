@@ -0,0 +1,82 @@
+import discord
+from discord.ext import commands, tasks
+from discord import app_commands
+import asyncio
+from utils import is_authorized
+from ui import LazyEmbedPaginator
+from cogs.search import PAGE_SIZE, render_results
+
+# config.json "archive" 기본값. None 이면 해당 항목은 보관하지 않음
+ARCHIVE_DEFAULTS = {"task_days": 30, "meeting_days": 365, "interval_hours": 6}
+KIND_ALIASES = {"작업": "task", "회의": "meeting"}
+
+
+class ArchiveCog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.conf = {**ARCHIVE_DEFAULTS, **bot.ai.config.get('archive', {})}
+
+    async def cog_load(self):
+        if self.conf['interval_hours']:
+            self.archive_loop.change_interval(hours=self.conf['interval_hours'])
+            self.archive_loop.start()
+
+    async def cog_unload(self):
+        self.archive_loop.cancel()
+
+    async def run_archive(self):
+        """오래된 완료 작업 / 회의록을 보관 DB 로 옮기고 작업이 빠진 길드의 현황판을 갱신"""
+        moved, guilds = await asyncio.to_thread(self.bot.db.archive_old, self.conf['task_days'], self.conf['meeting_days'])
+        if moved['task'] or moved['meeting']: print(f"🗄️ 보관: 작업 {moved['task']}건, 회의록 {moved['meeting']}건")
+        cog = self.bot.get_cog('ProjectCog')
+        if cog:
+            for gid in guilds:
+                try: await cog.refresh_dashboard(gid)
+                except Exception as e: print(f"현황판 갱신 실패 ({gid}): {e}")
+        return moved
+
+    @tasks.loop(hours=6)
+    async def archive_loop(self):
+        try: await self.run_archive()
+        except Exception as e: print(f"[Archive] 보관 작업 실패: {e}")
+
+    @commands.hybrid_group(name="보관", description="보관된 작업·회의록 관리")
+    async def archive_group(self, ctx):
+        if ctx.invoked_subcommand is None: await ctx.send_help(ctx.command)
+
+    @archive_group.command(name="검색", description="보관함의 회의록·작업을 전문 검색합니다.")
+    @app_commands.describe(query="검색어 (여러 단어는 모두 포함)", kind="전체 / 회의 / 작업")
+    @is_authorized()
+    async def search(self, ctx, query: str, kind: str = "전체"):
+        kinds = ("meeting", "task") if kind.strip() == "전체" else (KIND_ALIASES.get(kind.strip()),)
+        if None in kinds: await ctx.send("❌ 종류는 `전체`, `회의`, `작업` 중 하나입니다."); return
+
+        async def fetch(cursor, page):
+            rows, nxt = await asyncio.to_thread(self.bot.db.search, ctx.guild.id, query, None, kinds, PAGE_SIZE, cursor, True)
+            return (render_results(query, rows, page, archived=True) if rows else None), nxt
+
+        await LazyEmbedPaginator.start(ctx, fetch, empty_message=f"📭 보관함에 **{query}** 에 대한 결과가 없습니다.")
+
+    @archive_group.command(name="복원", description="보관된 작업·회의록을 되돌립니다.")
+    @app_commands.describe(kind="작업 / 회의", id="작업 ID 또는 회의 ID")
+    @is_authorized()
+    async def restore(self, ctx, kind: str, id: int):
+        k = KIND_ALIASES.get(kind.strip())
+        if not k: await ctx.send("❌ 종류는 `작업`, `회의` 중 하나입니다."); return
+        if not await asyncio.to_thread(self.bot.db.restore_archived, k, id, ctx.guild.id):
+            await ctx.send(f"❌ 보관함에 {kind} #{id} 이(가) 없습니다."); return
+        await ctx.send(f"♻️ {kind} #{id} 복원 완료")
+        if k == "task":
+            cog = self.bot.get_cog('ProjectCog')
+            if cog: await cog.refresh_dashboard(ctx.guild.id)
+
+    @archive_group.command(name="실행", description="보관 기한이 지난 작업·회의록을 지금 보관함으로 옮깁니다.")
+    @is_authorized()
+    async def run(self, ctx):
+        await ctx.defer()
+        moved = await self.run_archive()
+        counts = await asyncio.to_thread(self.bot.db.get_archive_counts, ctx.guild.id)
+        await ctx.send(f"🗄️ 작업 **{moved['task']}건**, 회의록 **{moved['meeting']}건** 보관 "
+                       f"(이 서버 보관함: 작업 {counts['task']} / 회의록 {counts['meeting']})")
+
+async def setup(bot): await bot.add_cog(ArchiveCog(bot))
@@ -48,13 +48,13 @@ class HelpCog(commands.Cog):
                     embed.add_field(name=f"!{cmd_name}", value=desc, inline=False)
                 return embed
 
-            e1 = create_category_embed("📋 프로젝트 관리", ["프로젝트생성", "상위설정", "프로젝트구조", "할일등록", "현황판", "완료", "담당"], 0x3498db)
+            e1 = create_category_embed("📋 프로젝트 관리", ["프로젝트생성", "상위설정", "프로젝트구조", "할일등록", "현황판", "완료", "담당", "검색", "보관검색", "보관복원"], 0x3498db)
             e1.set_footer(text="Page 1/3")
             
-            e2 = create_category_embed("🎙️ 회의 시스템", ["회의시작", "회의종료", "회의목록", "회의조회", "회의삭제"], 0xe74c3c)
+            e2 = create_category_embed("🎙️ 회의 시스템", ["회의시작", "회의종료", "회의목록", "회의조회", "회의내보내기", "회의삭제"], 0xe74c3c)
             e2.set_footer(text="Page 2/3")
             
-            e3 = create_category_embed("🐙 깃헙 & 관리", ["레포등록", "레포삭제", "레포목록", "초기설정", "권한추가", "권한삭제"], 0x9b59b6)
+            e3 = create_category_embed("🐙 깃헙 & 관리", ["레포등록", "레포삭제", "레포목록", "초기설정", "권한추가", "권한삭제", "보관실행"], 0x9b59b6)
             e3.set_footer(text="Page 3/3 | !도움말 [명령어] 로 상세 정보 확인")
             
             # [UPDATE] 비서 관련 페이지 제거됨 (e4 삭제)
@@ -4,14 +4,27 @@ from discord import app_commands
 import datetime
 import json
 import io
-from ui import EmbedPaginator, MeetingTaskView
+import asyncio
+from ui import EmbedPaginator, LazyEmbedPaginator, MeetingTaskView
 from utils import is_authorized, smart_chunk_text
 from services.meeting_service import process_meeting_result
+from services.export import FORMATS, export_meetings
+from services.chunker import EMBED_DESCRIPTION, EMBED_FIELD_NAME, EMBED_TITLE, add_field_chunks, truncate
+from services.metrics import REGISTRY
+
+MEETING_PAGE_SIZE = 10
 
 class MeetingCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.meeting_buffer = {} 
+        REGISTRY.add_collector("meeting_buffer", self._collect_metrics)
+
+    def _collect_metrics(self):
+        # 진행 중인 회의 수와 버퍼에 쌓인 발언 수 (/metrics)
+        REGISTRY.gauge("pynapse_meetings_active", "Meetings currently recording").set(len(self.meeting_buffer))
+        REGISTRY.gauge("pynapse_meeting_buffer_messages", "Messages buffered across active meetings").set(
+            sum(len(m.get('messages', [])) for m in self.meeting_buffer.values()))
 
     @commands.Cog.listener()
     async def on_message(self, message):
@@ -88,11 +101,17 @@ class MeetingCog(commands.Cog):
     @meeting_group.command(name="목록")
     @is_authorized()
     async def list(self, ctx):
-        rows = self.bot.db.get_recent_meetings(ctx.guild.id)
-        if not rows: await ctx.send("📭 없음"); return
-        e = discord.Embed(title="📂 회의록", color=0xf1c40f)
-        for r in rows: e.add_field(name=f"[{r[0]}] {r[1]}", value=f"📅 {r[2]} | [바로가기]({r[4]})", inline=False)
-        await ctx.send(embed=e)
+        # [UPDATE] 최신순 keyset 페이지 (summary 는 읽지 않고, ▶️ 를 누를 때 다음 페이지 조회)
+        async def fetch(before_id, page):
+            rows = await asyncio.to_thread(self.bot.db.get_meetings_page, ctx.guild.id, before_id, MEETING_PAGE_SIZE + 1)
+            if not rows: return None, None
+            more = len(rows) > MEETING_PAGE_SIZE; rows = rows[:MEETING_PAGE_SIZE]
+            e = discord.Embed(title="📂 회의록", color=0xf1c40f)
+            for r in rows: e.add_field(name=truncate(f"[{r[0]}] {r[1]}", EMBED_FIELD_NAME), value=f"📅 {r[2]} | [바로가기]({r[3]})", inline=False)
+            e.set_footer(text=f"Page {page + 1}")
+            return e, (rows[-1][0] if more else None)
+
+        await LazyEmbedPaginator.start(ctx, fetch)
 
     @meeting_group.command(name="조회")
     @app_commands.describe(id="ID")
@@ -104,21 +123,51 @@ class MeetingCog(commands.Cog):
             meeting_data = json.loads(row[2])
             summary = meeting_data.get('summary', '')
             
-            # [FIX] PDF 생성 제거, JSON만 첨부
+            # JSON 첨부 ([UPDATE] meeting_pdf 설정 시 PDF 도 첨부)
             json_bytes = json.dumps(meeting_data, ensure_ascii=False, indent=2).encode('utf-8')
-            json_file = discord.File(io.BytesIO(json_bytes), filename=f"Meeting_{id}_context.json")
+            files = [discord.File(io.BytesIO(json_bytes), filename=f"Meeting_{id}_context.json")]
+            if self.bot.ai.config.get('meeting_pdf', False):
+                try: files.insert(0, discord.File(await self.bot.pdf.meeting(meeting_data), filename=f"Meeting_{id}_report.pdf"))
+                except Exception as err: print(f"회의록 PDF 생성 실패: {err}")
 
-            e = discord.Embed(title=f"📂 {row[0]}", description=summary[:3500], color=0xf1c40f)
+            e = discord.Embed(title=truncate(f"📂 {row[0]}", EMBED_TITLE), description=truncate(summary, EMBED_DESCRIPTION), color=0xf1c40f)
             if row[3]: e.add_field(name="링크", value=f"[이동]({row[3]})", inline=False)
             
             # 결정사항 표시
             decisions = meeting_data.get('decisions', [])
             if decisions:
-                e.add_field(name="결정 사항", value="\n".join([f"• {d}" for d in decisions]), inline=False)
+                add_field_chunks(e, "결정 사항", "\n".join([f"• {d}" for d in decisions]))
 
-            await ctx.send(embed=e, file=json_file)
+            await ctx.send(embed=e, files=files)
         except: await ctx.send("❌ 데이터 손상")
 
+    # [NEW] 회의록 일괄 내보내기
+    @meeting_group.command(name="내보내기", description="회의록 전체를 NDJSON(gz) 또는 PDF 파일 하나로 내보냅니다.")
+    @app_commands.describe(fmt="ndjson 또는 pdf", project="프로젝트 이름 (비우면 서버 전체)",
+                           since="시작일 YYYY-MM-DD", until="종료일 YYYY-MM-DD")
+    @is_authorized()
+    async def export(self, ctx, fmt: str = "ndjson", project: str = None, since: str = None, until: str = None):
+        fmt = fmt.lower().strip()
+        if fmt not in FORMATS: await ctx.send("❌ 형식은 `ndjson` 또는 `pdf` 만 가능합니다."); return
+        pid = None
+        if project:
+            pid = self.bot.db.get_project_id(ctx.guild.id, project)
+            if not pid: await ctx.send(f"❌ 프로젝트 **{project}** 를 찾을 수 없습니다."); return
+        await ctx.defer()
+        title = f"{ctx.guild.name} 회의록" + (f" - {project}" if project else "")
+        try:
+            spool, count, filename = await asyncio.to_thread(
+                export_meetings, self.bot.db, ctx.guild.id, fmt, pid, since, until, title)
+        except ValueError as e: await ctx.send(f"❌ {e}"); return
+        try:
+            if not count: await ctx.send("📭 조건에 맞는 회의록이 없습니다."); return
+            size = spool.seek(0, io.SEEK_END); spool.seek(0)
+            if size > ctx.guild.filesize_limit:
+                await ctx.send(f"❌ 파일이 너무 큽니다 ({size / 1024 / 1024:.1f}MB). 기간이나 프로젝트로 범위를 좁혀 주세요."); return
+            period = f" | {since or '처음'} ~ {until or '현재'}" if since or until else ""
+            await ctx.send(f"📦 회의록 **{count}건** 내보내기 완료{period}", file=discord.File(spool, filename=filename))
+        finally: spool.close()
+
     @meeting_group.command(name="삭제")
     @is_authorized()
     async def delete(self, ctx, id: int):
@@ -1,8 +1,14 @@
 import discord
+import asyncio
 from discord.ext import commands
 from discord import app_commands
+from services.task_threads import mark_thread_done
 from utils import is_authorized
-from ui import ProjectCreateModal, TaskCreateModal, DashboardView
+from services.chunker import add_field_chunks
+from ui import ProjectCreateModal, TaskCreateModal, DashboardView, LazyEmbedPaginator
+
+STATUS_SECTIONS = (("TODO", "⚪ 대기"), ("IN_PROGRESS", "🔵 진행"), ("DONE", "🟢 완료"))
+STATUS_PAGE_SIZE = 15
 
 class ProjectCog(commands.Cog):
     def __init__(self, bot):
@@ -154,10 +160,10 @@ class ProjectCog(commands.Cog):
             else: done.append(line)
         
         e = discord.Embed(title=f"📊 프로젝트 실시간 현황판", color=0xf1c40f, timestamp=discord.utils.utcnow())
-        e.add_field(name="⚪ 대기 (TODO)", value="\n".join(todo) or "-", inline=False)
-        e.add_field(name="🔵 진행 (IN PROGRESS)", value="\n".join(prog) or "-", inline=False)
-        e.add_field(name="🟢 완료 (DONE)", value="\n".join(done) or "-", inline=False)
         e.set_footer(text="자동 갱신됨")
+        # [UPDATE] 필드 1024 / 임베드 6000 한도에 맞춰 나눠 담음 (넘치면 '…외 N줄')
+        for name, lines in (("⚪ 대기 (TODO)", todo), ("🔵 진행 (IN PROGRESS)", prog), ("🟢 완료 (DONE)", done)):
+            add_field_chunks(e, name, "\n".join(lines))
         view = DashboardView(self.bot)
         await message.edit(content="", embed=e, view=view)
 
@@ -208,19 +214,24 @@ class ProjectCog(commands.Cog):
     @commands.hybrid_command(name="현황판", description="칸반 보드 조회")
     @is_authorized()
     async def status(self, ctx, project: str = None):
-        ts = self.bot.db.get_tasks(ctx.guild.id, project)
-        if not ts: await ctx.send("📭 없음"); return
-        todo=[]; prog=[]; done=[]
-        for t in ts:
-            line = f"**#{t[0]}** [{t[1]}] {t[2]} (👤{t[4] or '-'})"
-            if t[5]=='TODO': todo.append(line)
-            elif t[5]=='IN_PROGRESS': prog.append(line)
-            else: done.append(line)
-        e = discord.Embed(title=f"📊 {project or '전체'} 현황", color=0xf1c40f)
-        e.add_field(name="대기", value="\n".join(todo) or "-", inline=False)
-        e.add_field(name="진행", value="\n".join(prog) or "-", inline=False)
-        e.add_field(name="완료", value="\n".join(done) or "-", inline=False)
-        await ctx.send(embed=e)
+        # [UPDATE] 상태별(대기 → 진행 → 완료) keyset 페이지. 작업 전체를 읽지 않고 ▶️ 를 누를 때 다음 페이지만 조회
+        counts = self.bot.db.count_tasks_by_status(ctx.guild.id, project)
+        sections = [(s, label) for s, label in STATUS_SECTIONS if counts.get(s)]
+        summary = " | ".join(f"{label} {counts.get(s, 0)}" for s, label in STATUS_SECTIONS)
+
+        async def fetch(cursor, page):
+            if not sections: return None, None
+            sec, before_id = cursor or (0, None)
+            st, label = sections[sec]
+            rows = await asyncio.to_thread(self.bot.db.get_tasks_page, ctx.guild.id, st, project, before_id, STATUS_PAGE_SIZE + 1)
+            more = len(rows) > STATUS_PAGE_SIZE; rows = rows[:STATUS_PAGE_SIZE]
+            e = discord.Embed(title=f"📊 {project or '전체'} 현황", description=summary, color=0xf1c40f)
+            add_field_chunks(e, f"{label} ({counts[st]})", "\n".join(f"**#{t[0]}** [{t[1]}] {t[2]} (👤{t[3] or '-'})" for t in rows))
+            e.set_footer(text=f"Page {page + 1}")
+            if more: return e, (sec, rows[-1][0])
+            return e, ((sec + 1, None) if sec + 1 < len(sections) else None)
+
+        await LazyEmbedPaginator.start(ctx, fetch)
 
     @commands.hybrid_command(name="완료", description="할 일을 완료 처리합니다.")
     @app_commands.describe(task_id="완료할 작업 ID")
@@ -237,15 +248,7 @@ class ProjectCog(commands.Cog):
             if thread_id:
                 try:
                     thread = ctx.guild.get_thread(thread_id) or await ctx.guild.fetch_channel(thread_id)
-                    if thread:
-                        if isinstance(thread.parent, discord.ForumChannel):
-                            done_tag = next((t for t in thread.parent.available_tags if t.name == "DONE"), None)
-                            tags = [done_tag] if done_tag else []
-                            await thread.edit(applied_tags=tags, archived=True, locked=False)
-                            await thread.send("✅ **작업이 완료되었습니다.**")
-                        elif isinstance(thread.parent, discord.TextChannel):
-                            await thread.edit(archived=True, locked=False)
-                            await thread.send("✅ **작업이 완료되었습니다.**")
+                    if thread: await mark_thread_done(thread)
                 except Exception as e:
                     print(f"스레드 업데이트 실패: {e}")
 
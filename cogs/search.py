@@ -0,0 +1,48 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+import asyncio
+from utils import is_authorized
+from ui import LazyEmbedPaginator
+from database.search import SEARCH_KINDS
+from services.chunker import EMBED_FIELD_NAME, EMBED_FIELD_VALUE, truncate
+
+PAGE_SIZE = 5
+KIND_LABELS = {"meeting": "🎙️ 회의", "task": "📌 작업", "page": "📄 문서"}
+KIND_ALIASES = {"전체": SEARCH_KINDS, "회의": ("meeting",), "작업": ("task",), "문서": ("page",)}
+
+
+def render_results(query, rows, page, archived=False):
+    """검색 결과 한 페이지 임베드 (/검색, /보관 검색 공용)"""
+    title = f"🗄️ 보관함 '{query}' 검색 결과" if archived else f"🔎 '{query}' 검색 결과"
+    e = discord.Embed(title=truncate(title, 256), color=0x95a5a6 if archived else 0x1abc9c)
+    for r in rows:
+        label = KIND_LABELS.get(r['kind'], r['kind'])
+        if r['kind'] == 'task': name = f"{label} #{r['id']} [{r['extra']}]"
+        elif r['kind'] == 'meeting': name = f"{label} #{r['id']} {r['title'] or ''}"
+        else: name = f"{label} {r['title'] or ''} ({r['extra']})"
+        date = (r['date'] or '')[:10]
+        e.add_field(name=truncate(f"{name} · {date}" if date else name, EMBED_FIELD_NAME),
+                    value=truncate((r['snippet'] or '-').replace('\n', ' '), EMBED_FIELD_VALUE), inline=False)
+    e.set_footer(text=f"Page {page + 1} | 관련도 순")
+    return e
+
+
+class SearchCog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @commands.hybrid_command(name="검색", description="회의록·작업·내 문서를 전문 검색합니다.")
+    @app_commands.describe(query="검색어 (여러 단어는 모두 포함)", kind="전체 / 회의 / 작업 / 문서")
+    @is_authorized()
+    async def search(self, ctx, query: str, kind: str = "전체"):
+        kinds = KIND_ALIASES.get(kind.strip())
+        if not kinds: await ctx.send("❌ 종류는 `전체`, `회의`, `작업`, `문서` 중 하나입니다."); return
+
+        async def fetch(cursor, page):
+            rows, nxt = await asyncio.to_thread(self.bot.db.search, ctx.guild.id, query, ctx.author.id, kinds, PAGE_SIZE, cursor)
+            return (render_results(query, rows, page) if rows else None), nxt
+
+        await LazyEmbedPaginator.start(ctx, fetch, empty_message=f"📭 **{query}** 에 대한 결과가 없습니다.")
+
+async def setup(bot): await bot.add_cog(SearchCog(bot))
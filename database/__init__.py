@@ -5,8 +5,14 @@ from .meetings import MeetingMixin
 from .projects import ProjectMixin
 from .repos import RepoMixin
 from .settings import SettingsMixin
+from .jobs import JobMixin
+from .review_cache import ReviewCacheMixin
+from .search import SearchMixin
+from .archive import ArchiveMixin
+from services.metrics import instrument_db
 
-class DBManager(BaseDB, UserMixin, MeetingMixin, ProjectMixin, RepoMixin, SettingsMixin, PageMixin):
+@instrument_db
+class DBManager(BaseDB, UserMixin, MeetingMixin, ProjectMixin, RepoMixin, SettingsMixin, PageMixin, JobMixin, ReviewCacheMixin, SearchMixin, ArchiveMixin):
     """
     모든 DB 기능을 통합 관리하는 클래스.
     BaseDB 및 각 기능별 Mixin을 상속받습니다.
@@ -0,0 +1,110 @@
+import os
+import sqlite3
+import datetime
+from .base import FTS_OPTIONS, FTS_TABLES
+
+# 보관 DB(ATTACH 'archive') 에 옮기는 컬럼. 원본 테이블과 같은 이름 / 순서
+TASK_COLS = "task_id, guild_id, project_id, content, assignee_id, assignee_name, status, created_at, source_meeting_id, thread_id, message_id, completed_at"
+MEETING_COLS = "id, guild_id, name, date, channel_id, summary, jump_url, project_id, restored_at"
+
+# 종류 -> (테이블, id 컬럼, 컬럼, FTS 테이블, FTS 컬럼)
+_ARCHIVE_KINDS = {
+    "task": ("tasks", "task_id", TASK_COLS, "tasks_fts", "content, guild_id, status, date"),
+    "meeting": ("meetings", "id", MEETING_COLS, "meetings_fts", "title, summary, agenda, decisions, guild_id, date"),
+}
+
+
+class ArchiveMixin:
+    # [NEW] 보관함: 오래 전에 끝난 작업 / 오래된 회의록을 별도 DB 파일로 옮겨 평소 조회는 현재 데이터만 읽도록 함
+    @property
+    def archive_db_name(self):
+        return os.path.splitext(self.db_name)[0] + "_archive.db"
+
+    def _connect_archive(self):
+        """본 DB 연결에 보관 DB 를 'archive' 로 붙여 반환 (테이블 / FTS 는 처음 한 번 생성)"""
+        conn = sqlite3.connect(self.db_name)
+        conn.execute("ATTACH DATABASE ? AS archive", (self.archive_db_name,))
+        if not getattr(self, '_archive_ready', False):
+            c = conn.cursor()
+            c.execute('''CREATE TABLE IF NOT EXISTS archive.tasks
+                         (task_id INTEGER PRIMARY KEY, guild_id INTEGER, project_id INTEGER, content TEXT,
+                          assignee_id INTEGER, assignee_name TEXT, status TEXT, created_at TEXT,
+                          source_meeting_id INTEGER, thread_id INTEGER, message_id INTEGER, completed_at TEXT,
+                          archived_at TEXT)''')
+            c.execute('''CREATE TABLE IF NOT EXISTS archive.meetings
+                         (id INTEGER PRIMARY KEY, guild_id INTEGER, name TEXT, date TEXT, channel_id INTEGER,
+                          summary TEXT, jump_url TEXT, project_id INTEGER, restored_at TEXT,
+                          archived_at TEXT)''')
+            c.execute("CREATE INDEX IF NOT EXISTS archive.idx_tasks_guild ON tasks (guild_id, task_id)")
+            c.execute("CREATE INDEX IF NOT EXISTS archive.idx_meetings_guild ON meetings (guild_id, id)")
+            for kind, (_, _, _, fts_table, _) in _ARCHIVE_KINDS.items():
+                c.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS archive.{fts_table} USING fts5({FTS_TABLES[fts_table]}, {FTS_OPTIONS})")
+            conn.commit()
+            self._archive_ready = True
+        return conn
+
+    def archive_old(self, task_days=30, meeting_days=365, batch=1000):
+        """
+        완료 후 task_days 일이 지난 DONE 작업과 meeting_days 일이 지난 회의록을 보관 DB 로 옮깁니다.
+          - 원본 행과 FTS 색인을 그대로 복사한 뒤 본 DB 에서 삭제 (batch 건씩 한 트랜잭션)
+          - 보관함에서 복원한 회의록은 복원 시각부터 다시 계산
+          - None 인 항목은 옮기지 않음
+        반환: ({'task': 옮긴 수, 'meeting': 옮긴 수}, 작업이 옮겨진 guild_id 집합)
+        """
+        now = datetime.datetime.now()
+        targets = {
+            "task": (task_days, "status='DONE' AND COALESCE(completed_at, created_at) < ?"),
+            "meeting": (meeting_days, "COALESCE(restored_at, date) < ?"),
+        }
+        moved, guilds = {"task": 0, "meeting": 0}, set()
+        conn = self._connect_archive(); c = conn.cursor()
+        try:
+            for kind, (days, cond) in targets.items():
+                if days is None: continue
+                table, key, cols, fts_table, fts_cols = _ARCHIVE_KINDS[kind]
+                cutoff = (now - datetime.timedelta(days=days)).strftime("%Y-%m-%d %H:%M")
+                while True:
+                    rows = c.execute(f"SELECT {key}, guild_id FROM main.{table} WHERE {cond} LIMIT ?", (cutoff, batch)).fetchall()
+                    if not rows: break
+                    ids = ",".join(str(r[0]) for r in rows)
+                    try:
+                        c.execute(f"INSERT OR REPLACE INTO archive.{table} ({cols}, archived_at) SELECT {cols}, ? FROM main.{table} WHERE {key} IN ({ids})",
+                                  (now.strftime("%Y-%m-%d %H:%M"),))
+                        c.execute(f"DELETE FROM archive.{fts_table} WHERE rowid IN ({ids})")
+                        c.execute(f"INSERT INTO archive.{fts_table} (rowid, {fts_cols}) SELECT rowid, {fts_cols} FROM main.{fts_table} WHERE rowid IN ({ids})")
+                        c.execute(f"DELETE FROM main.{table} WHERE {key} IN ({ids})")    # 본 DB FTS 는 트리거가 삭제
+                        conn.commit()
+                    except sqlite3.Error as e:
+                        conn.rollback(); print(f"[DB] 보관 실패 ({kind}): {e}"); break
+                    moved[kind] += len(rows)
+                    for oid, gid in rows: self._emit(kind, gid, oid)
+                    if kind == "task": guilds.update(r[1] for r in rows)
+        finally: conn.close()
+        return moved, guilds
+
+    def restore_archived(self, kind, obj_id, guild_id):
+        """보관함의 작업 / 회의록을 본 DB 로 되돌립니다. 다시 바로 보관되지 않도록 완료·복원 시각을 지금으로 설정"""
+        table, key, cols, fts_table, _ = _ARCHIVE_KINDS[kind]
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+        conn = self._connect_archive(); c = conn.cursor()
+        try:
+            c.execute(f"INSERT INTO main.{table} ({cols}) SELECT {cols} FROM archive.{table} WHERE {key}=? AND guild_id=?", (obj_id, guild_id))
+            if not c.rowcount: return False
+            if kind == "task": c.execute("UPDATE main.tasks SET completed_at=? WHERE task_id=? AND status='DONE'", (now, obj_id))
+            else: c.execute("UPDATE main.meetings SET restored_at=? WHERE id=?", (now, obj_id))
+            c.execute(f"DELETE FROM archive.{table} WHERE {key}=?", (obj_id,))
+            c.execute(f"DELETE FROM archive.{fts_table} WHERE rowid=?", (obj_id,))
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback(); print(f"[DB] 복원 실패 ({kind} #{obj_id}): {e}"); return False
+        finally: conn.close()
+        self._emit(kind, guild_id, obj_id)
+        return True
+
+    def get_archive_counts(self, guild_id):
+        """보관함에 있는 길드의 작업 / 회의록 수"""
+        conn = self._connect_archive(); c = conn.cursor()
+        try:
+            return {kind: c.execute(f"SELECT COUNT(*) FROM archive.{table} WHERE guild_id=?", (guild_id,)).fetchone()[0]
+                    for kind, (table, *_) in _ARCHIVE_KINDS.items()}
+        finally: conn.close()
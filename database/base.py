@@ -1,11 +1,50 @@
 import sqlite3
 import datetime
 
+# [NEW] 회의록 summary(JSON) → FTS 컬럼 (JSON 이 아니면 원문을 요약으로)
+_MEETING_FTS_COLS = """
+    coalesce(new.name, '') || ' ' || coalesce(CASE WHEN json_valid(new.summary) THEN json_extract(new.summary, '$.title') END, ''),
+    CASE WHEN json_valid(new.summary) THEN coalesce(json_extract(new.summary, '$.summary'), '') ELSE coalesce(new.summary, '') END,
+    CASE WHEN json_valid(new.summary) THEN coalesce((SELECT group_concat(
+        CASE WHEN type = 'object' THEN coalesce(json_extract(value, '$.topic'), '') || ' ' || coalesce(json_extract(value, '$.content'), '') ELSE value END, char(10))
+        FROM json_each(new.summary, '$.agenda')), '') ELSE '' END,
+    CASE WHEN json_valid(new.summary) THEN coalesce((SELECT group_concat(value, char(10)) FROM json_each(new.summary, '$.decisions')), '') ELSE '' END"""
+
+# FTS 테이블 정의 (보관 DB 에도 같은 정의로 생성)
+FTS_OPTIONS = "tokenize='unicode61 remove_diacritics 2', prefix='2 3'"
+FTS_TABLES = {
+    "meetings_fts": "title, summary, agenda, decisions, guild_id UNINDEXED, date UNINDEXED",
+    "tasks_fts": "content, guild_id UNINDEXED, status UNINDEXED, date UNINDEXED",
+    "pages_fts": "title, content, owner_id UNINDEXED, page_id UNINDEXED, date UNINDEXED",
+}
+
+# 원본 테이블 -> (FTS 테이블, FTS 컬럼, rowid 식, 값 식, 바뀌면 다시 색인할 원본 컬럼). 식은 트리거의 new 행 기준
+_FTS_SYNC = {
+    "meetings": ("meetings_fts", "title, summary, agenda, decisions, guild_id, date", "new.id",
+                 _MEETING_FTS_COLS + ", new.guild_id, new.date", "name, summary, guild_id, date"),
+    "tasks": ("tasks_fts", "content, guild_id, status, date", "new.task_id",
+              "new.content, new.guild_id, new.status, new.created_at", "content, guild_id, status"),
+    "pages": ("pages_fts", "title, content, owner_id, page_id, date", "new.rowid",
+              "new.title, new.content, new.owner_id, new.page_id, new.updated_at", "title, content, owner_id, updated_at"),
+}
+
+
 class BaseDB:
     def __init__(self, db_name="pm_bot.db"):
         self.db_name = db_name
+        self._listeners = []
         self.init_db()
 
+    # [NEW] 변경 알림 (ContextManager 등 메모리 캐시 갱신용)
+    def add_listener(self, fn):
+        """fn(kind, guild_id, obj_id) — kind: 'task' / 'project' / 'meeting'. guild_id 를 모르는 경우 None"""
+        self._listeners.append(fn)
+
+    def _emit(self, kind, guild_id, obj_id):
+        for fn in self._listeners:
+            try: fn(kind, guild_id, obj_id)
+            except Exception as e: print(f"[DB] listener error: {e}")
+
     def init_db(self):
         conn = sqlite3.connect(self.db_name)
         c = conn.cursor()
@@ -22,11 +61,13 @@ class BaseDB:
                       date TEXT, 
                       channel_id INTEGER, 
                       summary TEXT,
-                      jump_url TEXT)''')
+                      jump_url TEXT,
+                      project_id INTEGER,
+                      restored_at TEXT)''')
         
         # 3. 레포지토리
         c.execute('''CREATE TABLE IF NOT EXISTS repositories
-                     (repo_name TEXT, channel_id INTEGER, added_by TEXT, date TEXT,
+                     (repo_name TEXT, channel_id INTEGER, added_by TEXT, date TEXT, guild_id INTEGER,
                       PRIMARY KEY (repo_name, channel_id))''')
 
         # 4. [UPDATE] 프로젝트 (실제 디스코드 ID 매핑 추가)
@@ -53,7 +94,8 @@ class BaseDB:
                       created_at TEXT,
                       source_meeting_id INTEGER,
                       thread_id INTEGER,          -- 포럼 게시글(스레드) ID
-                      message_id INTEGER          -- 상태 변경 추적용 메시지 ID
+                      message_id INTEGER,         -- 상태 변경 추적용 메시지 ID
+                      completed_at TEXT           -- DONE 이 된 시각 (보관 대상 판단)
                       )''')
         
         # 6. 프로젝트-역할 매핑
@@ -69,6 +111,35 @@ class BaseDB:
         c.execute('''CREATE TABLE IF NOT EXISTS pages
                      (page_id TEXT PRIMARY KEY, title TEXT, content TEXT, owner_id INTEGER, updated_at TEXT)''')
 
+        # 9. [NEW] 웹훅 작업 큐 (delivery_id 로 중복 수신 방지, 시각은 epoch 초)
+        c.execute('''CREATE TABLE IF NOT EXISTS webhook_jobs
+                     (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                      delivery_id TEXT UNIQUE,
+                      event TEXT,
+                      payload TEXT,
+                      status TEXT DEFAULT 'PENDING',
+                      attempts INTEGER DEFAULT 0,
+                      priority INTEGER DEFAULT 0,
+                      next_run_at REAL,
+                      created_at REAL,
+                      updated_at REAL,
+                      last_error TEXT)''')
+        c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON webhook_jobs (status, next_run_at)")
+        # [NEW] 작업별로 채널에 이미 보낸 커밋 (재시도 시 빠진 것만 전송)
+        c.execute('''CREATE TABLE IF NOT EXISTS webhook_sent
+                     (delivery_id TEXT, channel_id INTEGER, commit_id TEXT, sent_at REAL,
+                      PRIMARY KEY (delivery_id, channel_id, commit_id))''')
+
+        # 10. [NEW] 커밋별 diff / 리뷰 캐시
+        c.execute('''CREATE TABLE IF NOT EXISTS review_cache
+                     (repo TEXT, sha TEXT, diff TEXT, review TEXT, size INTEGER, last_used REAL,
+                      PRIMARY KEY (repo, sha))''')
+        c.execute("CREATE INDEX IF NOT EXISTS idx_review_cache_used ON review_cache (last_used)")
+
+        # 11. [NEW] 전문 검색 (FTS5, 원본 테이블 트리거로 동기화). rowid = 원본 id (pages 는 rowid)
+        for name, cols in FTS_TABLES.items():
+            c.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5({cols}, {FTS_OPTIONS})")
+
         # [마이그레이션] 기존 테이블에 새 컬럼 추가
         migrations = [
             "ALTER TABLE meetings ADD COLUMN guild_id INTEGER",
@@ -80,11 +151,36 @@ class BaseDB:
             "ALTER TABLE projects ADD COLUMN meeting_channel_id INTEGER",
             # [NEW] 태스크 테이블 컬럼 추가
             "ALTER TABLE tasks ADD COLUMN thread_id INTEGER",
-            "ALTER TABLE tasks ADD COLUMN message_id INTEGER"
+            "ALTER TABLE tasks ADD COLUMN message_id INTEGER",
+            # [NEW] 웹훅 작업 우선순위 (자체 업데이트 / 작은 push 먼저 처리)
+            "ALTER TABLE webhook_jobs ADD COLUMN priority INTEGER DEFAULT 0",
+            # [NEW] 레포 연결의 길드 (길드별 목록 조회용)
+            "ALTER TABLE repositories ADD COLUMN guild_id INTEGER",
+            # [NEW] 회의록의 프로젝트 (프로젝트별 내보내기)
+            "ALTER TABLE meetings ADD COLUMN project_id INTEGER",
+            # [NEW] 보관 (완료 시각 / 보관함에서 복원된 시각)
+            "ALTER TABLE tasks ADD COLUMN completed_at TEXT",
+            "ALTER TABLE meetings ADD COLUMN restored_at TEXT"
         ]
         for mig in migrations:
             try: c.execute(mig)
             except: pass
+        c.execute("CREATE INDEX IF NOT EXISTS idx_repos_guild ON repositories (guild_id)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_meetings_guild ON meetings (guild_id, date)")
+        # [NEW] keyset 페이지 조회용 (길드 + id 역순 / 길드 + 상태 + id 역순)
+        c.execute("CREATE INDEX IF NOT EXISTS idx_meetings_guild_id ON meetings (guild_id, id)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_tasks_guild_status ON tasks (guild_id, status, task_id)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (status, completed_at)")
+
+        # [NEW] FTS 동기화 트리거 (추가 / 삭제 / 색인 대상 컬럼 수정) + 기존 데이터 최초 색인
+        for table, (fts_table, cols, rowid, values, watch) in _FTS_SYNC.items():
+            insert = f"INSERT INTO {fts_table} (rowid, {cols}) VALUES ({rowid}, {values});"
+            delete = f"DELETE FROM {fts_table} WHERE rowid = {rowid.replace('new.', 'old.')};"
+            c.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT ON {table} BEGIN {insert} END")
+            c.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE ON {table} BEGIN {delete} END")
+            c.execute(f"CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE OF {watch} ON {table} BEGIN {delete} {insert} END")
+            if not c.execute(f"SELECT 1 FROM {fts_table} LIMIT 1").fetchone():
+                c.execute(f"INSERT INTO {fts_table} (rowid, {cols}) SELECT {rowid}, {values} FROM {table} AS new")
         
         conn.commit()
         conn.close()
\ No newline at end of file
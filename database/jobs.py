@@ -0,0 +1,101 @@
+import sqlite3
+import time
+
+class JobMixin:
+    """
+    웹훅 작업 큐 (webhook_jobs 테이블).
+    상태: PENDING → RUNNING → DONE / FAILED. delivery_id(X-GitHub-Delivery) 가 같은 요청은 한 번만 저장됩니다.
+    """
+    def enqueue_job(self, delivery_id, event, payload, priority=0):
+        """새 작업이면 job id, 이미 받은 delivery 면 None. priority 가 큰 작업부터 처리"""
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        now = time.time()
+        c.execute("""INSERT OR IGNORE INTO webhook_jobs
+                     (delivery_id, event, payload, status, attempts, priority, next_run_at, created_at, updated_at)
+                     VALUES (?,?,?,'PENDING',0,?,?,?,?)""", (delivery_id, event, payload, priority, now, now, now))
+        jid = c.lastrowid if c.rowcount > 0 else None
+        conn.commit(); conn.close(); return jid
+
+    def claim_job(self):
+        """실행 가능한 작업 하나를 RUNNING 으로 바꾸고 반환 (없으면 None)"""
+        conn = sqlite3.connect(self.db_name, isolation_level=None); c = conn.cursor()
+        try:
+            c.execute("BEGIN IMMEDIATE")
+            now = time.time()
+            c.execute("""SELECT id, delivery_id, event, payload, attempts FROM webhook_jobs
+                         WHERE status='PENDING' AND next_run_at<=?
+                         ORDER BY priority DESC, id LIMIT 1""", (now,))
+            row = c.fetchone()
+            if not row:
+                c.execute("COMMIT"); return None
+            c.execute("UPDATE webhook_jobs SET status='RUNNING', attempts=attempts+1, updated_at=? WHERE id=?", (now, row[0]))
+            c.execute("COMMIT")
+            return {'id': row[0], 'delivery_id': row[1], 'event': row[2], 'payload': row[3], 'attempts': row[4] + 1}
+        except sqlite3.Error:
+            if conn.in_transaction: c.execute("ROLLBACK")
+            return None
+        finally: conn.close()
+
+    def complete_job(self, jid):
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        c.execute("UPDATE webhook_jobs SET status='DONE', last_error=NULL, updated_at=? WHERE id=?", (time.time(), jid))
+        conn.commit(); conn.close()
+
+    def fail_job(self, jid, error, retry_at=None):
+        """retry_at 이 있으면 그 시각에 다시 시도, 없으면 FAILED 로 종료"""
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        status = 'PENDING' if retry_at else 'FAILED'
+        c.execute("UPDATE webhook_jobs SET status=?, last_error=?, next_run_at=?, updated_at=? WHERE id=?",
+                  (status, str(error)[:1000], retry_at or time.time(), time.time(), jid))
+        conn.commit(); conn.close()
+
+    def get_next_job_time(self):
+        """가장 빠른 PENDING 작업의 실행 예정 시각 (없으면 None)"""
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        c.execute("SELECT MIN(next_run_at) FROM webhook_jobs WHERE status='PENDING'")
+        res = c.fetchone()[0]; conn.close(); return res
+
+    def reset_running_jobs(self):
+        """재시작 전 처리 중이던 작업을 다시 대기열로 (봇 시작 시 호출)"""
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        c.execute("UPDATE webhook_jobs SET status='PENDING', next_run_at=?, updated_at=? WHERE status='RUNNING'",
+                  (time.time(), time.time()))
+        n = c.rowcount; conn.commit(); conn.close(); return n
+
+    def purge_jobs(self, older_than_sec=7 * 86400):
+        """오래된 DONE 작업 삭제 (이 기간 동안은 같은 delivery 재전송을 걸러냄)"""
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        c.execute("DELETE FROM webhook_jobs WHERE status='DONE' AND updated_at<?", (time.time() - older_than_sec,))
+        n = c.rowcount
+        c.execute("DELETE FROM webhook_sent WHERE sent_at<?", (time.time() - older_than_sec,))
+        conn.commit(); conn.close(); return n
+
+    # [NEW] 작업 재시도 / 재시작 시 이미 채널에 보낸 커밋은 다시 보내지 않음
+    def get_sent_commits(self, delivery_id, channel_id):
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        c.execute("SELECT commit_id FROM webhook_sent WHERE delivery_id=? AND channel_id=?", (delivery_id, channel_id))
+        res = {r[0] for r in c.fetchall()}; conn.close(); return res
+
+    def mark_commit_sent(self, delivery_id, channel_id, commit_id):
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        c.execute("INSERT OR IGNORE INTO webhook_sent VALUES (?,?,?,?)", (delivery_id, channel_id, commit_id, time.time()))
+        conn.commit(); conn.close()
+
+    def count_open_jobs(self):
+        """대기 + 처리 중 작업 수 (수신 시 과부하 판단용)"""
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        c.execute("SELECT COUNT(*) FROM webhook_jobs WHERE status IN ('PENDING','RUNNING')")
+        n = c.fetchone()[0]; conn.close(); return n
+
+    def get_job_stats(self):
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        c.execute("SELECT status, COUNT(*) FROM webhook_jobs GROUP BY status")
+        counts = {s: n for s, n in c.fetchall()}
+        c.execute("SELECT MIN(created_at) FROM webhook_jobs WHERE status IN ('PENDING','RUNNING')")
+        oldest = c.fetchone()[0]
+        conn.close()
+        return {
+            'pending': counts.get('PENDING', 0), 'running': counts.get('RUNNING', 0),
+            'done': counts.get('DONE', 0), 'failed': counts.get('FAILED', 0),
+            'oldest_age_sec': round(time.time() - oldest, 1) if oldest else 0.0,
+        }
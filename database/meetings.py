@@ -2,23 +2,71 @@ import sqlite3
 import datetime
 
 class MeetingMixin:
-    def save_meeting(self, gid, name, cid, smry, url):
+    def save_meeting(self, gid, name, cid, smry, url, project_id=None):
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
-        c.execute("INSERT INTO meetings (guild_id,name,date,channel_id,summary,jump_url) VALUES (?,?,?,?,?,?)",
-                  (gid, name, datetime.datetime.now().strftime("%Y-%m-%d %H:%M"), cid, smry, url))
-        mid = c.lastrowid; conn.commit(); conn.close(); return mid
+        c.execute("INSERT INTO meetings (guild_id,name,date,channel_id,summary,jump_url,project_id) VALUES (?,?,?,?,?,?,?)",
+                  (gid, name, datetime.datetime.now().strftime("%Y-%m-%d %H:%M"), cid, smry, url, project_id))
+        mid = c.lastrowid; conn.commit(); conn.close()
+        self._emit('meeting', gid, mid); return mid
 
     def delete_meeting(self, mid, gid):
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
         c.execute("DELETE FROM meetings WHERE id=? AND guild_id=?", (mid, gid))
-        res = c.rowcount > 0; conn.commit(); conn.close(); return res
+        res = c.rowcount > 0; conn.commit(); conn.close()
+        if res: self._emit('meeting', gid, mid)
+        return res
 
     def get_recent_meetings(self, gid, lim=5):
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
         c.execute("SELECT id, name, date, summary, jump_url FROM meetings WHERE guild_id=? ORDER BY id DESC LIMIT ?", (gid, lim))
         res = c.fetchall(); conn.close(); return res
 
+    # [NEW] 목록용 keyset 페이지 (summary 는 읽지 않음)
+    def get_meetings_page(self, gid, before_id=None, limit=10):
+        """(id, name, date, jump_url) 최신순 limit 건. before_id: 이전 페이지 마지막 id (그보다 오래된 것부터)"""
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        if before_id is None:
+            c.execute("SELECT id, name, date, jump_url FROM meetings WHERE guild_id=? ORDER BY id DESC LIMIT ?", (gid, limit))
+        else:
+            c.execute("SELECT id, name, date, jump_url FROM meetings WHERE guild_id=? AND id<? ORDER BY id DESC LIMIT ?", (gid, before_id, limit))
+        res = c.fetchall(); conn.close(); return res
+
     def get_meeting_detail(self, mid, gid):
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
         c.execute("SELECT name, date, summary, jump_url FROM meetings WHERE id=? AND guild_id=?", (mid, gid))
-        res = c.fetchone(); conn.close(); return res
\ No newline at end of file
+        res = c.fetchone(); conn.close(); return res
+
+    # [NEW] 검색 인덱스(Retriever)용 (guild 전체 또는 특정 회의 id 들)
+    def get_meeting_texts(self, gid=None, meeting_ids=None):
+        """(id, guild_id, summary) 목록"""
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        if meeting_ids is not None:
+            ids = list(meeting_ids)
+            if not ids: conn.close(); return []
+            c.execute(f"SELECT id, guild_id, summary FROM meetings WHERE id IN ({','.join('?' * len(ids))})", ids)
+        else:
+            c.execute("SELECT id, guild_id, summary FROM meetings WHERE guild_id=? ORDER BY id", (gid,))
+        res = c.fetchall(); conn.close(); return res
+
+    # [NEW] 내보내기용 순회
+    def iter_meetings(self, gid, project_id=None, since=None, until=None, batch=200):
+        """
+        (id, name, date, summary, jump_url, project_name) 를 오래된 순으로 하나씩 내보내는 제너레이터.
+        커서에서 batch 건씩만 가져오므로 회의록이 수천 건이어도 전체를 메모리에 올리지 않습니다.
+        since / until: 'YYYY-MM-DD' (양 끝 포함)
+        """
+        q = ["SELECT m.id, m.name, m.date, m.summary, m.jump_url, p.name FROM meetings m",
+             "LEFT JOIN projects p ON p.id = m.project_id WHERE m.guild_id=?"]
+        args = [gid]
+        if project_id is not None: q.append("AND m.project_id=?"); args.append(project_id)
+        if since: q.append("AND m.date>=?"); args.append(since)
+        if until: q.append("AND m.date<?"); args.append(until + "~")    # 'YYYY-MM-DD HH:MM' < 'YYYY-MM-DD~'
+        q.append("ORDER BY m.date, m.id")
+        conn = sqlite3.connect(self.db_name)
+        try:
+            c = conn.cursor(); c.execute(" ".join(q), args)
+            while True:
+                rows = c.fetchmany(batch)
+                if not rows: break
+                yield from rows
+        finally: conn.close()
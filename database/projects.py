@@ -10,7 +10,8 @@ class ProjectMixin:
         
         c.execute("INSERT INTO projects (guild_id, name, parent_id, created_at, category_id, forum_channel_id, meeting_channel_id) VALUES (?, ?, ?, ?, ?, ?, ?)",
                   (guild_id, name, parent_id, datetime.datetime.now().strftime("%Y-%m-%d"), category_id, forum_channel_id, meeting_channel_id))
-        pid = c.lastrowid; conn.commit(); conn.close(); return pid
+        pid = c.lastrowid; conn.commit(); conn.close()
+        self._emit('project', guild_id, pid); return pid
 
     def get_project_id(self, guild_id, name):
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
@@ -60,7 +61,8 @@ class ProjectMixin:
             current_check_id = res[0] if res else None
 
         c.execute("UPDATE projects SET parent_id=? WHERE id=?", (parent_id, child_id))
-        conn.commit(); conn.close(); return True
+        conn.commit(); conn.close()
+        self._emit('project', guild_id, child_id); return True
 
     def get_project_tree(self, guild_id):
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
@@ -91,7 +93,8 @@ class ProjectMixin:
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
         c.execute("INSERT INTO tasks (guild_id, project_id, content, status, created_at, source_meeting_id, thread_id, message_id) VALUES (?,?,?, 'TODO',?,?,?,?)",
                   (guild_id, pid, content, datetime.datetime.now().strftime("%Y-%m-%d %H:%M"), source_meeting_id, thread_id, message_id))
-        tid = c.lastrowid; conn.commit(); conn.close(); return tid
+        tid = c.lastrowid; conn.commit(); conn.close()
+        self._emit('task', guild_id, tid); return tid
 
     def get_tasks(self, guild_id, project_name=None):
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
@@ -108,21 +111,90 @@ class ProjectMixin:
         query += " ORDER BY t.task_id"
         c.execute(query, tuple(params)); res = c.fetchall(); conn.close(); return res
 
+    # [NEW] 현황판용 keyset 페이지 / 상태별 개수
+    def get_tasks_page(self, guild_id, status, project_name=None, before_id=None, limit=15):
+        """status 인 작업 (task_id, project_name, content, assignee_name, thread_id) 최신순 limit 건 (before_id 보다 작은 id 만)"""
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        q = ["SELECT t.task_id, p.name, t.content, t.assignee_name, t.thread_id FROM tasks t",
+             "LEFT JOIN projects p ON t.project_id = p.id WHERE t.guild_id = ? AND t.status = ?"]
+        args = [guild_id, status]
+        if project_name: q.append("AND p.name = ?"); args.append(project_name)
+        if before_id is not None: q.append("AND t.task_id < ?"); args.append(before_id)
+        q.append("ORDER BY t.task_id DESC LIMIT ?"); args.append(limit)
+        c.execute(" ".join(q), args); res = c.fetchall(); conn.close(); return res
+
+    def count_tasks_by_status(self, guild_id, project_name=None):
+        """{status: 개수}"""
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        if project_name:
+            c.execute("SELECT t.status, COUNT(*) FROM tasks t JOIN projects p ON t.project_id = p.id WHERE t.guild_id=? AND p.name=? GROUP BY t.status",
+                      (guild_id, project_name))
+        else:
+            c.execute("SELECT status, COUNT(*) FROM tasks WHERE guild_id=? GROUP BY status", (guild_id,))
+        res = dict(c.fetchall()); conn.close(); return res
+
     def get_active_tasks_simple(self, guild_id):
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
         c.execute("SELECT task_id, content, status FROM tasks WHERE guild_id=? AND status != 'DONE'", (guild_id,))
         res = c.fetchall(); conn.close()
         return [{'id': r[0], 'content': r[1], 'status': r[2]} for r in res]
 
+    # [NEW] ContextManager 스냅샷용 (guild 전체 또는 특정 task_id 들)
+    def get_context_tasks(self, guild_id=None, task_ids=None):
+        """(task_id, guild_id, project_id, content, assignee_name, status) 목록"""
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        q = "SELECT task_id, guild_id, project_id, content, assignee_name, status FROM tasks"
+        if task_ids is not None:
+            ids = list(task_ids)
+            if not ids: conn.close(); return []
+            c.execute(q + f" WHERE task_id IN ({','.join('?' * len(ids))}) ORDER BY task_id", ids)
+        else:
+            c.execute(q + " WHERE guild_id=? ORDER BY task_id", (guild_id,))
+        res = c.fetchall(); conn.close(); return res
+
     def update_task_status(self, tid, s):
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
-        c.execute("UPDATE tasks SET status=? WHERE task_id=?", (s, tid))
-        res = c.rowcount > 0; conn.commit(); conn.close(); return res
+        # [UPDATE] 완료 시각 기록 (보관 대상 판단용). DONE 이 아니게 되면 지움
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+        c.execute("UPDATE tasks SET status=?, completed_at=CASE WHEN ?='DONE' THEN COALESCE(completed_at, ?) END WHERE task_id=?", (s, s, now, tid))
+        res = c.rowcount > 0; conn.commit(); conn.close()
+        if res: self._emit('task', None, tid)
+        return res
     
+    # [NEW] 커밋 메시지(fix #N 등)로 닫히는 작업을 한 트랜잭션으로 처리
+    def close_tasks_batch(self, task_ids, guild_ids=None):
+        """
+        아직 DONE 이 아닌 작업만 DONE 으로 바꾸고 실제로 닫힌 작업 목록을 반환합니다.
+        guild_ids 가 주어지면 해당 길드의 작업만 닫습니다 (다른 서버의 같은 번호 작업 보호).
+        """
+        ids = sorted({int(t) for t in task_ids})
+        if not ids: return []
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        query = f"SELECT task_id, guild_id, thread_id FROM tasks WHERE status != 'DONE' AND task_id IN ({','.join('?' * len(ids))})"
+        params = list(ids)
+        if guild_ids is not None:
+            gids = list(guild_ids)
+            if not gids: conn.close(); return []
+            query += f" AND guild_id IN ({','.join('?' * len(gids))})"
+            params += gids
+        try:
+            c.execute(query, params)
+            rows = c.fetchall()
+            now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+            c.executemany("UPDATE tasks SET status='DONE', completed_at=? WHERE task_id=?", [(now, r[0]) for r in rows])
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback(); rows = []
+        finally: conn.close()
+        for r in rows: self._emit('task', r[1], r[0])
+        return [{'task_id': r[0], 'guild_id': r[1], 'thread_id': r[2]} for r in rows]
+
     def assign_task(self, tid, aid, an):
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
         c.execute("UPDATE tasks SET assignee_id=?, assignee_name=? WHERE task_id=?", (aid, an, tid))
-        res = c.rowcount > 0; conn.commit(); conn.close(); return res
+        res = c.rowcount > 0; conn.commit(); conn.close()
+        if res: self._emit('task', None, tid)
+        return res
 
     def get_task(self, tid):
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
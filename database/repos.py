@@ -2,10 +2,11 @@ import sqlite3
 import datetime
 
 class RepoMixin:
-    def add_repo(self, r, c_id, by):
+    def add_repo(self, r, c_id, by, guild_id=None):
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
         try:
-            c.execute("INSERT OR IGNORE INTO repositories VALUES (?,?,?,?)", (r, c_id, by, datetime.datetime.now().strftime("%Y-%m-%d")))
+            c.execute("INSERT OR IGNORE INTO repositories (repo_name, channel_id, added_by, date, guild_id) VALUES (?,?,?,?,?)",
+                      (r, c_id, by, datetime.datetime.now().strftime("%Y-%m-%d"), guild_id))
             conn.commit(); return True
         except: return False
         finally: conn.close()
@@ -23,4 +24,21 @@ class RepoMixin:
     def get_all_repos(self):
         conn = sqlite3.connect(self.db_name); c = conn.cursor()
         c.execute("SELECT repo_name, channel_id FROM repositories")
-        res = c.fetchall(); conn.close(); return res
\ No newline at end of file
+        res = c.fetchall(); conn.close(); return res
+
+    # [NEW] 라우팅 테이블(RepoRouter) 적재 / 갱신용
+    def get_repo_routes(self):
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        c.execute("SELECT repo_name, channel_id, guild_id FROM repositories")
+        res = c.fetchall(); conn.close(); return res
+
+    def set_repo_guild(self, c_id, guild_id):
+        """guild_id 가 없던 기존 행을 채널 기준으로 채움"""
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        c.execute("UPDATE repositories SET guild_id=? WHERE channel_id=? AND guild_id IS NULL", (guild_id, c_id))
+        conn.commit(); conn.close()
+
+    def remove_channel_repos(self, c_id):
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        c.execute("DELETE FROM repositories WHERE channel_id=?", (c_id,))
+        res = c.rowcount; conn.commit(); conn.close(); return res
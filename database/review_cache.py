@@ -0,0 +1,54 @@
+import sqlite3
+import json
+import time
+
+class ReviewCacheMixin:
+    """
+    커밋 SHA 별 diff / 리뷰 결과 캐시 (review_cache 테이블).
+    같은 커밋이 여러 브랜치·재전송·여러 채널로 다시 들어와도 GitHub / LLM 호출 없이 재사용합니다.
+    크기(diff+리뷰 바이트) 합이 max_bytes 를 넘으면 가장 오래 안 쓴 항목부터 삭제합니다.
+    """
+    def get_review_cache(self, repo, sha):
+        """(diff, review dict) 반환. 항목이 없으면 (None, None), 리뷰가 없거나 비어 있으면 review 는 None"""
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        c.execute("SELECT diff, review FROM review_cache WHERE repo=? AND sha=?", (repo, sha))
+        row = c.fetchone()
+        if row:
+            c.execute("UPDATE review_cache SET last_used=? WHERE repo=? AND sha=?", (time.time(), repo, sha))
+            conn.commit()
+        conn.close()
+        if not row: return None, None
+        try: review = json.loads(row[1]) if row[1] else None
+        except ValueError: review = None
+        return row[0], review or None
+
+    def put_review_cache(self, repo, sha, diff=None, review=None, max_bytes=50 * 1024 * 1024):
+        """diff / review 중 주어진 값만 갱신합니다."""
+        review_txt = json.dumps(review, ensure_ascii=False) if review is not None else None
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        now = time.time()
+        c.execute("""INSERT INTO review_cache (repo, sha, diff, review, size, last_used) VALUES (?,?,?,?,0,?)
+                     ON CONFLICT(repo, sha) DO UPDATE SET
+                        diff=COALESCE(excluded.diff, diff), review=COALESCE(excluded.review, review),
+                        last_used=excluded.last_used""", (repo, sha, diff, review_txt, now))
+        c.execute("""UPDATE review_cache SET size=LENGTH(CAST(COALESCE(diff,'') AS BLOB)) + LENGTH(CAST(COALESCE(review,'') AS BLOB))
+                     WHERE repo=? AND sha=?""", (repo, sha))
+        self._evict_review_cache(c, max_bytes)
+        conn.commit(); conn.close()
+
+    def _evict_review_cache(self, c, max_bytes):
+        c.execute("SELECT COALESCE(SUM(size), 0) FROM review_cache")
+        excess = c.fetchone()[0] - max_bytes
+        if excess <= 0: return
+        c.execute("SELECT repo, sha, size FROM review_cache ORDER BY last_used")
+        victims = []
+        for repo, sha, size in c.fetchall():
+            if excess <= 0: break
+            victims.append((repo, sha)); excess -= size
+        c.executemany("DELETE FROM review_cache WHERE repo=? AND sha=?", victims)
+
+    def get_review_cache_stats(self):
+        conn = sqlite3.connect(self.db_name); c = conn.cursor()
+        c.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM review_cache")
+        n, size = c.fetchone(); conn.close()
+        return {'entries': n, 'bytes': size}
@@ -0,0 +1,64 @@
+import re
+import sqlite3
+
+SEARCH_KINDS = ("meeting", "task", "page")
+ARCHIVE_KINDS = ("meeting", "task")    # 보관함에는 페이지가 없음
+_TOKEN_RE = re.compile(r'[^\s"*^():]+')
+# 검색어 끝의 조사 ('서버를' → '서버'). 접두어 검색이라 문서 쪽 조사는 이미 맞지만 질의 쪽 조사는 떼어야 맞음
+_PARTICLE_RE = re.compile(r'(?<=[가-힣]{2})(에서|에게|한테|으로|까지|부터|처럼|보다|이랑|랑|을|를|이|가|은|는|의|에|로|와|과|도|만)$')
+
+# 종류별 검색 SELECT (rank, kind, ref, title, snippet, date, extra). UNION 은 첫 SELECT 의 이름을 쓰므로 모두 같은 별칭. 첫 번째 ? 는 MATCH, 두 번째는 범위(길드 / 작성자)
+# {db} 는 보관함 검색일 때 'archive.'
+_KIND_SQL = {
+    "meeting": "SELECT bm25(meetings_fts, 4.0, 1.0, 2.0, 2.0) AS rank, 'meeting' AS kind, rowid AS ref, title, "
+               "snippet(meetings_fts, -1, '**', '**', '…', 16) AS snip, date, NULL AS extra "
+               "FROM {db}meetings_fts WHERE meetings_fts MATCH ? AND guild_id = ?",
+    "task": "SELECT bm25(tasks_fts) AS rank, 'task' AS kind, rowid AS ref, content AS title, "
+            "snippet(tasks_fts, 0, '**', '**', '…', 16) AS snip, date, status AS extra "
+            "FROM {db}tasks_fts WHERE tasks_fts MATCH ? AND guild_id = ?",
+    "page": "SELECT bm25(pages_fts, 4.0, 1.0) AS rank, 'page' AS kind, rowid AS ref, title, "
+            "snippet(pages_fts, -1, '**', '**', '…', 16) AS snip, date, page_id AS extra "
+            "FROM {db}pages_fts WHERE pages_fts MATCH ? AND owner_id = ?",
+}
+
+
+def fts_query(text):
+    """
+    사용자 입력 → FTS5 질의. 전부 포함(AND)
+      - 단어마다 접두어 검색 ('배포' 가 문서의 '배포를' 에도 맞도록)
+      - 한글 단어 끝 조사는 떼고 검색 ('서버를' 이 문서의 '서버' 에도 맞도록, 남는 글자가 2자 이상일 때만)
+    """
+    tokens = [_PARTICLE_RE.sub('', t) for t in _TOKEN_RE.findall(text or "")]
+    return " ".join(f'"{t}"*' for t in tokens) or None
+
+
+class SearchMixin:
+    # [NEW] 회의록 / 작업 / 페이지 전문 검색 (FTS5, base.py 의 트리거로 동기화)
+    def search(self, guild_id, query, owner_id=None, kinds=SEARCH_KINDS, limit=5, after=None, archived=False):
+        """
+        관련도 순 검색 결과와 다음 페이지 커서를 반환합니다.
+          - 결과: [{'kind', 'id', 'title', 'snippet', 'date', 'extra', 'rank'}]
+          - after: 이전 페이지의 커서 (rank, kind, id). OFFSET 대신 이 값보다 뒤인 행만 가져옴 (keyset)
+          - page 는 owner_id (작성자) 가 주어졌을 때만 검색
+          - archived: 보관 DB (database/archive.py) 의 회의록 / 작업을 검색
+        """
+        match = fts_query(query)
+        if not match: return [], None
+        parts, args = [], []
+        for kind in kinds:
+            scope = owner_id if kind == "page" else guild_id
+            if scope is None or (archived and kind not in ARCHIVE_KINDS): continue
+            parts.append(_KIND_SQL[kind].format(db="archive." if archived else "")); args += [match, scope]
+        if not parts: return [], None
+        q = f"SELECT * FROM ({' UNION ALL '.join(parts)})"
+        if after: q += " WHERE (rank, kind, ref) > (?, ?, ?)"; args += list(after)
+        q += " ORDER BY rank, kind, ref LIMIT ?"; args.append(limit + 1)    # 한 건 더 읽어 다음 페이지 유무 확인
+        conn = self._connect_archive() if archived else sqlite3.connect(self.db_name); c = conn.cursor()
+        try: rows = c.execute(q, args).fetchall()
+        except sqlite3.OperationalError as e:
+            print(f"[DB] 검색 질의 오류: {e}"); rows = []
+        finally: conn.close()
+        more = len(rows) > limit; rows = rows[:limit]
+        res = [{'rank': r[0], 'kind': r[1], 'id': r[2], 'title': r[3], 'snippet': r[4], 'date': r[5], 'extra': r[6]} for r in rows]
+        cursor = (rows[-1][0], rows[-1][1], rows[-1][2]) if more else None
+        return res, cursor
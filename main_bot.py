@@ -21,6 +21,12 @@ import datetime
 from database import DBManager
 from ai_helper import AIHelper
 from services.webhook import WebhookServer
+from services.github_client import GitHubClient
+from services.repo_router import RepoRouter
+from services.pdf_service import PDFService
+from services.retrieval import Retriever
+from services.dedup import DuplicateDetector
+from services.metrics import instrument_discord, monitor_loop_lag, register_ai_telemetry
 
 # [설정 로드]
 def load_key(filename):
@@ -42,10 +48,31 @@ intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 
-bot = commands.Bot(command_prefix='!', intents=intents, help_command=None)
+class PynapseBot(commands.Bot):
+    async def setup_hook(self):
+        # /metrics 용 이벤트 루프 지연 측정
+        self.loop.create_task(monitor_loop_lag())
+        # PDF 렌더링 워커를 미리 띄워 폰트 파싱을 첫 요청 전에 끝냄 (__main__ 에서 이미 띄웠으면 그대로)
+        self.pdf.start()
+
+    async def close(self):
+        # 공용 HTTP 세션 정리 후 종료
+        await self.github.close()
+        self.pdf.shutdown()
+        await super().close()
+
+bot = PynapseBot(command_prefix='!', intents=intents, help_command=None)
 bot.db = DBManager()
 bot.ai = AIHelper(GEMINI_API_KEY, GROQ_API_KEY)
-bot.github_headers = {"Authorization": f"token {GITHUB_TOKEN}", "Accept": "application/vnd.github.v3+json"}
+bot.github = GitHubClient(GITHUB_TOKEN)
+bot.repos = RepoRouter(bot)
+bot.pdf = PDFService(bot.ai.config.get('pdf', {}).get('workers', 2))
+bot.retriever = Retriever(bot.db)       # [NEW] 작업/회의록 BM25 검색 (프롬프트 컨텍스트 선별)
+bot.dedup = DuplicateDetector(bot.db, **bot.ai.config.get('dedup', {}))    # [NEW] 회의 도출 작업 중복 검사
+
+# [NEW] /metrics 계측 연결 (AI 텔레메트리, Discord REST 호출 / 429)
+register_ai_telemetry(bot.ai.telemetry)
+instrument_discord(bot.http)
 
 # 웹훅 서버 인스턴스 생성
 webhook_server = WebhookServer(bot, port=WEBHOOK_PORT, path=WEBHOOK_PATH)
@@ -65,17 +92,39 @@ async def sync_command(ctx):
     except Exception as e:
         await ctx.send(f"❌ 동기화 실패: {e}")
 
+@bot.command(name="aistats")
+async def ai_stats_command(ctx):
+    # AI 호출 텔레메트리 요약 (관리자 전용)
+    if OWNER_ID and str(ctx.author.id) != str(OWNER_ID):
+        await ctx.send("🚫 관리자만 사용할 수 있습니다.")
+        return
+
+    lines = bot.ai.telemetry.summary_lines()
+    p = bot.ai.parser.stats
+    embed = discord.Embed(title="📈 AI 호출 통계", description="\n".join(lines)[:4000] or "기록 없음", color=0x3498db)
+    embed.add_field(name="🧩 응답 파싱", value=f"정상 {p['ok']} | 로컬 복구 {p['local_repair']} | 복구 요청 {p['remote_repair']} | 실패 {p['failed']}", inline=False)
+    q = webhook_server.queue.stats()
+    embed.add_field(name="📥 웹훅 작업 큐", value=f"대기 {q['pending']} | 처리 중 {q['running']} | 실패 {q['failed']} | 가장 오래된 작업 {q['oldest_age_sec']}s", inline=False)
+    embed.set_footer(text=f"Model: {bot.ai.model_name} | JSON: http://<서버>:{WEBHOOK_PORT}/ai-stats")
+    await ctx.send(embed=embed)
+
+@bot.event
+async def on_guild_join(guild):
+    bot.repos.backfill_guilds()
+
 # [Bot Start]
 @bot.event
 async def on_ready():
     print(f'Logged in as {bot.user}')
     
     # Load Cogs
-    exts = ["cogs.meeting", "cogs.project", "cogs.github", "cogs.admin", "cogs.help"]
+    exts = ["cogs.meeting", "cogs.project", "cogs.github", "cogs.admin", "cogs.search", "cogs.archive", "cogs.help"]
     for e in exts: 
         try: await bot.load_extension(e)
         except Exception as err: print(f"Failed to load {e}: {err}")
     
+    bot.repos.backfill_guilds()    # [FIX] guild_id 없이 저장된 기존 레포 연결을 한 번에 채움
+
     # Sync Slash Commands
     try:
         synced = await bot.tree.sync()
@@ -102,6 +151,8 @@ async def on_ready():
                 current_model = conf.get('ai_model', 'Default Gemini')
             elif provider == 'groq':
                 current_model = conf.get('groq_model', 'Default Groq')
+            elif provider == 'stub':
+                current_model = 'Offline Stub'
 
             embed = discord.Embed(title="🟢 Pynapse System Online", color=discord.Color.brand_green())
             embed.add_field(name="🤖 AI Provider", value=f"`{provider.upper()}`", inline=True)
@@ -119,4 +170,6 @@ async def on_ready():
     await webhook_server.start()
 
 if __name__ == "__main__":
-    if DISCORD_TOKEN: bot.run(DISCORD_TOKEN)
\ No newline at end of file
+    if DISCORD_TOKEN:
+        bot.pdf.start()    # 스레드가 생기기 전에 워커를 fork
+        bot.run(DISCORD_TOKEN)
\ No newline at end of file
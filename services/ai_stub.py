@@ -0,0 +1,133 @@
+import asyncio
+import datetime
+import hashlib
+import json
+import math
+import random
+import re
+
+# 프롬프트 본문으로 템플릿 종류를 추정할 때 쓰는 표식 (prompt_type 이 없을 때만 사용)
+_TYPE_MARKERS = [
+    ("code_review_batch", "Perform a Code Review for EACH"),
+    ("code_review", "Perform a Code Review"),
+    ("extract_tasks", "extract tasks"),
+    ("meeting_summary", "Summarize the following meeting"),
+]
+_SPEAKER_LINE_RE = re.compile(r'^\[(\{Speaker [^}]+\}|[^|\]]+) \| [^\]]*\]\s*(.+)$', re.M)
+_TASK_HINT_RE = re.compile(r'(해야|하기로|할게|TODO|담당|까지)', re.I)
+_DIFF_FILE_RE = re.compile(r'^📄 (\S+)', re.M)
+_COMMIT_HEADER_RE = re.compile(r'^### Commit (\w+)', re.M)
+_RISKY_LINE_RE = re.compile(r'^\+.*(TODO|FIXME|print\(|console\.log|password|eval\()', re.M | re.I)
+
+
+class StubProvider:
+    """
+    API 키 없이 동작하는 결정적(deterministic) 오프라인 AI 공급자.
+    벤치마크/부하 테스트용으로 스키마에 맞는 JSON 을 돌려주며,
+    지연 분포와 장애 주입을 config.json 의 "stub" 항목으로 조절합니다.
+
+    예) "stub": {"seed": 42, "latency": {"dist": "lognormal", "mean": 0.8, "sigma": 0.4},
+                 "error_rate": 0.05, "malformed_rate": 0.05}
+    """
+    def __init__(self, options=None):
+        options = options or {}
+        self.rng = random.Random(options.get("seed", 0))
+        self.latency = options.get("latency", {"dist": "fixed", "value": 0.0})
+        self.error_rate = float(options.get("error_rate", 0.0))
+        self.malformed_rate = float(options.get("malformed_rate", 0.0))
+        self.calls = 0
+
+    def sample_latency(self):
+        conf = self.latency
+        dist = conf.get("dist", "fixed")
+        if dist == "uniform":
+            return self.rng.uniform(conf.get("min", 0.0), conf.get("max", 1.0))
+        if dist == "normal":
+            return max(self.rng.gauss(conf.get("mean", 0.5), conf.get("stddev", 0.1)), 0.0)
+        if dist == "lognormal":
+            # mean 은 중앙값(median) 기준
+            return self.rng.lognormvariate(math.log(max(conf.get("mean", 0.5), 1e-6)), conf.get("sigma", 0.5))
+        return float(conf.get("value", 0.0))
+
+    async def generate(self, prompt, is_json=False, prompt_type=None):
+        self.calls += 1
+        delay = self.sample_latency()
+        if delay > 0: await asyncio.sleep(delay)
+
+        if self.error_rate and self.rng.random() < self.error_rate:
+            raise RuntimeError("Stub injected failure")
+
+        prompt_type = prompt_type or self.detect_type(prompt)
+        if prompt_type and prompt_type.endswith("_repair"):
+            prompt_type = prompt_type[:-len("_repair")]
+        builder = {
+            "meeting_summary": self._meeting_summary,
+            "extract_tasks": self._extract_tasks,
+            "code_review": self._code_review,
+            "code_review_batch": self._code_review_batch,
+        }.get(prompt_type)
+        payload = builder(prompt) if builder else {"text": "stub response"}
+        text = json.dumps(payload, ensure_ascii=False)
+
+        if self.malformed_rate and self.rng.random() < self.malformed_rate:
+            # 잘린 응답 흉내: 뒷부분을 날려서 JSON 파싱이 실패하도록 함
+            return "```json\n" + text[: max(len(text) * 2 // 3, 1)]
+        return text
+
+    @staticmethod
+    def detect_type(prompt):
+        for name, marker in _TYPE_MARKERS:
+            if marker.lower() in prompt.lower(): return name
+        return None
+
+    @staticmethod
+    def _digest(text):
+        return int(hashlib.sha1(text.encode("utf-8")).hexdigest()[:8], 16)
+
+    # --- 템플릿별 응답 생성기 ---
+    def _meeting_summary(self, prompt):
+        lines = _SPEAKER_LINE_RE.findall(prompt)
+        speakers = sorted({s for s, _ in lines})
+        topics = [c[:30] for _, c in lines[:3]] or ["일반 논의"]
+        decisions = [c[:60] for _, c in lines if "결정" in c or "하기로" in c][:5]
+        return {
+            "title": f"{topics[0]} 회의",
+            "date": datetime.date.today().strftime("%Y-%m-%d"),
+            "summary": f"**[주요 논의]**\n- 발언 {len(lines)}건, 참석 {len(speakers)}명\n- " + "\n- ".join(topics),
+            "agenda": [{"topic": t, "content": f"{t} 관련 논의"} for t in topics],
+            "decisions": decisions,
+        }
+
+    def _extract_tasks(self, prompt):
+        lines = _SPEAKER_LINE_RE.findall(prompt)
+        new_tasks = [
+            {"content": content[:80], "assignee_hint": speaker}
+            for speaker, content in lines if _TASK_HINT_RE.search(content)
+        ][:10]
+        return {"new_tasks": new_tasks, "updates": [], "create_roles": [], "assign_roles": []}
+
+    def _code_review(self, prompt):
+        files = _DIFF_FILE_RE.findall(prompt)
+        risky = _RISKY_LINE_RE.findall(prompt)
+        issues = [
+            {"type": "Style", "file": files[i % len(files)] if files else "General",
+             "description": f"`{word}` 사용 확인 필요", "severity": "하"}
+            for i, word in enumerate(risky[:5])
+        ]
+        score = max(40, 95 - 5 * len(issues) - self._digest(prompt) % 10)
+        return {
+            "summary": f"**[변경 사항 요약]**\n- 파일 {len(files)}개 변경",
+            "issues": issues,
+            "suggestions": ["테스트 코드를 추가하세요."] if files else [],
+            "score": score,
+        }
+
+    def _code_review_batch(self, prompt):
+        parts = _COMMIT_HEADER_RE.split(prompt)
+        # split 결과: [머리말, id1, 본문1, id2, 본문2, ...]
+        reviews = []
+        for cid, body in zip(parts[1::2], parts[2::2]):
+            review = self._code_review(body)
+            review["commit"] = cid
+            reviews.append(review)
+        return {"reviews": reviews}
@@ -0,0 +1,150 @@
+import re
+
+# Discord 길이 제한 (UTF-16 코드 유닛 기준; 이모지 등 BMP 밖 문자는 2로 셈)
+MESSAGE_LIMIT = 2000
+EMBED_TITLE = 256
+EMBED_DESCRIPTION = 4096
+EMBED_FIELD_NAME = 256
+EMBED_FIELD_VALUE = 1024
+EMBED_FOOTER = 2048
+EMBED_TOTAL = 6000
+EMBED_MAX_FIELDS = 25
+
+_FENCE_RE = re.compile(r'^\s*(`{3,}|~{3,})')
+_FENCE_CLOSE = 4    # "\n```"
+_FENCE_REOPEN_MAX = 32    # 다시 여는 펜스 줄 최대 길이 ("```" + 언어)
+
+
+def utf16_len(text):
+    """Discord 가 세는 길이 (UTF-16 코드 유닛 수)"""
+    return len(text) if text.isascii() else len(text.encode('utf-16-le')) // 2
+
+
+def _fence_prefix(line, limit):
+    """
+    여는 펜스 줄 → 다음 조각에서 다시 열 때 쓸 짧은 줄 (펜스 기호 + 언어만, 최대 _FENCE_REOPEN_MAX)
+    다시 연 조각에 본문이 8자도 안 남을 만큼 limit 가 작으면 언어를 빼고 펜스 기호만 씀
+    """
+    s = line.strip()
+    marker = _FENCE_RE.match(s).group(1)
+    info = s[len(marker):].split(maxsplit=1)
+    prefix = (marker + (info[0] if info else ""))[:_FENCE_REOPEN_MAX]
+    if utf16_len(prefix) + 1 + _FENCE_CLOSE + 8 > limit: prefix = marker[:3]
+    return prefix
+
+
+def _hard_split(line, width):
+    """한 줄이 width 보다 길면 (가능하면 공백에서) 잘라 조각 목록으로"""
+    width = max(width, 1)    # 0 이하면 pos 가 늘지 않아 무한 루프
+    pieces, pos, n = [], 0, len(line)
+    while pos < n:
+        piece = line[pos:pos + width]
+        over = utf16_len(piece) - width
+        while over > 0 and len(piece) > 1:    # BMP 밖 문자(2유닛)가 섞여 넘친 만큼 줄임
+            piece = piece[:len(piece) - max(1, over // 2)]; over = utf16_len(piece) - width
+        if pos + len(piece) < n:
+            cut = piece.rfind(' ', len(piece) * 4 // 5)
+            if cut > 0: piece = piece[:cut + 1]
+        pieces.append(piece); pos += len(piece)
+    return pieces
+
+
+def chunk_text(text, limit=MESSAGE_LIMIT):
+    """
+    text 를 limit(UTF-16) 이하 조각으로 나눕니다. 줄 목록에 쌓아 두었다가 한 번에 join 하므로 입력 길이에 선형.
+      - 코드 펜스 안에서 잘리면 앞 조각은 ``` 로 닫고 다음 조각은 같은 언어로 다시 엽니다.
+      - 들여쓰기 없는 줄(제목, 최상위 목록, 문단) 앞을 '깔끔한 경계'로 기억해 두고, 넘칠 때 그 경계가
+        조각의 뒤쪽 절반 안에 있으면 거기서 자릅니다. 하위 목록·이어지는 줄은 부모 항목과 같은 조각에 남습니다.
+      - 한 줄이 limit 보다 길면 공백 기준으로 나눕니다. 펜스 줄은 나누지 않고 짧은 형태(기호 + 언어)로 줄입니다.
+    """
+    if limit <= _FENCE_CLOSE + 8: raise ValueError("limit too small")
+    chunks = []
+    cur, size = [], 0             # 현재 조각의 줄 목록 / 길이 (줄바꿈 포함)
+    boundary, bsize = 0, 0        # 깔끔한 경계 (cur 인덱스) 와 그 앞까지의 길이
+    fence = None                  # 열린 코드 펜스 (다시 열 때 쓰는 짧은 줄, 예: "```py")
+
+    def flush(close):
+        chunks.append("\n".join(cur) + ("\n" + close if close else ""))
+
+    for line in text.split("\n"):
+        w = len(line) if line.isascii() else len(line.encode('utf-16-le')) >> 1    # utf16_len (인라인)
+        toggles = ('```' in line or '~~~' in line) and _FENCE_RE.match(line) is not None
+        fence_after = (None if fence else _fence_prefix(line, limit)) if toggles else fence
+        if toggles and w + (_FENCE_CLOSE if fence_after else 0) + (utf16_len(fence) + 1 if fence else 0) > limit:
+            # [FIX] 새 조각에도 안 들어가는 펜스 줄은 나누면 펜스가 깨지므로 기호 + 언어만 남김
+            line = fence_after or fence[:3]; w = utf16_len(line)
+
+        if fence is None and cur and not line[:1].isspace():
+            boundary, bsize = len(cur), size
+
+        reserve = _FENCE_CLOSE if fence_after else 0
+        if cur and size + 1 + w + reserve > limit:
+            if 0 < boundary < len(cur) and size - bsize <= limit // 2:
+                # 경계에서 잘라 뒷부분은 다음 조각으로 넘김 (경계는 펜스 밖이므로 닫을 필요 없음)
+                carried = cur[boundary:]
+                del cur[boundary:]; flush(None)
+                cur, size = carried, size - bsize - 1
+            else:
+                flush(fence[:3] if fence else None)
+                cur, size = ([fence], utf16_len(fence)) if fence else ([], 0)
+            boundary, bsize = 0, 0
+
+        if toggles and cur and size + 1 + w + reserve > limit:
+            # 경계에서 넘긴 줄 뒤에 펜스 줄이 안 들어감 → 나누지 않고 새 조각에서 시작
+            flush(fence[:3] if fence else None)
+            cur, size = ([fence], utf16_len(fence)) if fence else ([], 0)
+            boundary, bsize = 0, 0
+
+        if (size + 1 if cur else 0) + w + reserve > limit:
+            # 한 줄이 남은 자리보다 김 → 조각내어 채움
+            for piece in _hard_split(line, limit - reserve - (utf16_len(fence) + 1 if fence else 0)):
+                pw = utf16_len(piece)
+                if cur and size + 1 + pw + reserve > limit:
+                    flush(fence[:3] if fence else None)
+                    cur, size = ([fence], utf16_len(fence)) if fence else ([], 0)
+                size += (1 if cur else 0) + pw; cur.append(piece)
+        else:
+            size += (1 if cur else 0) + w; cur.append(line)
+        fence = fence_after
+
+    if cur and (size or len(cur) > 1 or cur[0]): flush(fence[:3] if fence else None)
+    return chunks
+
+
+def truncate(text, limit, suffix=" …"):
+    """limit 안에 들어가도록 자르고 suffix 를 붙임 (코드 펜스는 닫힌 상태 유지)"""
+    if utf16_len(text) <= limit: return text
+    return chunk_text(text, limit - utf16_len(suffix))[0] + suffix
+
+
+# --- Embed ---
+def embed_length(embed):
+    """Embed 전체 길이 (제목·설명·필드·footer·author, UTF-16) — 6000 한도 비교용"""
+    n = utf16_len(embed.title or "") + utf16_len(embed.description or "")
+    for f in embed.fields: n += utf16_len(f.name or "") + utf16_len(f.value or "")
+    if embed.footer and embed.footer.text: n += utf16_len(embed.footer.text)
+    if embed.author and embed.author.name: n += utf16_len(embed.author.name)
+    return n
+
+
+def add_field_chunks(embed, name, text, inline=False, reserve=0):
+    """
+    text 를 1024 단위 필드로 나눠 추가합니다 (두 번째부터 이름에 '(계속)').
+    필드 25개 / 전체 6000 (reserve 만큼 남겨 둠) 을 넘기게 되면 거기서 멈추고 '…외 N줄' 을 붙입니다.
+    반환값: 생략된 줄 수
+    """
+    text = text or "-"
+    chunks = chunk_text(text, EMBED_FIELD_VALUE)
+    for i, chunk in enumerate(chunks):
+        fname = truncate(name if i == 0 else f"{name} (계속)", EMBED_FIELD_NAME)
+        room = EMBED_TOTAL - reserve - embed_length(embed) - utf16_len(fname)
+        if len(embed.fields) < EMBED_MAX_FIELDS and utf16_len(chunk) <= room:
+            embed.add_field(name=fname, value=chunk, inline=inline); continue
+        # 남은 자리에 들어가는 만큼만 담고 생략 표시
+        rest = sum(c.count("\n") + 1 for c in chunks[i:])
+        if len(embed.fields) >= EMBED_MAX_FIELDS or room < 40: return rest
+        kept = chunk_text(chunk, min(room, EMBED_FIELD_VALUE) - 20)[0]
+        rest -= kept.count("\n") + 1
+        embed.add_field(name=fname, value=f"{kept}\n…외 {rest}줄", inline=inline)
+        return rest
+    return 0
@@ -1,81 +1,144 @@
-import json
+import threading
+
+INBOX = 0    # 프로젝트가 없거나 찾을 수 없는 작업
+
+
+class _Snapshot:
+    """
+    길드 하나의 프로젝트 트리 / 작업 인덱스와 서브트리별 렌더링 캐시.
+      projects : pid -> {'name', 'parent', 'children': [pid]}
+      tasks    : tid -> pid (작업이 어느 프로젝트 목록에 있는지)
+      lines    : pid -> {tid: 렌더링된 한 줄}
+      rendered : pid -> (level, text)  — 해당 서브트리 텍스트. 바뀐 프로젝트와 그 조상만 지움
+    """
+    def __init__(self, proj_rows, task_rows):
+        self.projects = {pid: {'name': name, 'parent': parent, 'children': []} for pid, name, parent in proj_rows}
+        for pid, p in self.projects.items():
+            if p['parent'] in self.projects: self.projects[p['parent']]['children'].append(pid)
+        self.tasks, self.lines, self.rendered = {}, {}, {}
+        for row in task_rows: self.put_task(row)
+
+    # --- 인덱스 갱신 ---
+    def _owner(self, pid):
+        return pid if pid in self.projects else INBOX
+
+    def invalidate(self, pid):
+        """pid 와 조상들의 렌더링 캐시 제거"""
+        seen = set()
+        while pid is not None and pid not in seen:
+            seen.add(pid)
+            self.rendered.pop(pid, None)
+            pid = self.projects[pid]['parent'] if pid in self.projects else None
+
+    def put_task(self, row):
+        tid, _, pid, content, aname, status = row
+        self.drop_task(tid)
+        owner = self._owner(pid)
+        self.tasks[tid] = owner
+        self.lines.setdefault(owner, {})[tid] = f"- [#{tid}] {content} (담당: {aname or '미정'}) [{status}]"
+        self.invalidate(owner)
+
+    def drop_task(self, tid):
+        owner = self.tasks.pop(tid, None)
+        if owner is None: return
+        self.lines.get(owner, {}).pop(tid, None)
+        self.invalidate(owner)
+
+    def put_project(self, pid, name, parent):
+        old = self.projects.get(pid)
+        if old is None:
+            self.projects[pid] = old = {'name': name, 'parent': None, 'children': []}
+            # 이 프로젝트를 부모로 가리키던 하위 프로젝트를 연결
+            for cid, p in self.projects.items():
+                if p['parent'] == pid and cid not in old['children']: old['children'].append(cid)
+            old['children'].sort()
+        self.invalidate(pid)
+        if old['parent'] != parent:
+            if old['parent'] in self.projects: self.projects[old['parent']]['children'].remove(pid)
+            old['parent'] = parent
+            if parent in self.projects:
+                kids = self.projects[parent]['children']; kids.append(pid); kids.sort()
+        old['name'] = name
+        self.invalidate(pid)
+
+    # --- 렌더링 ---
+    def render(self, pid, level):
+        hit = self.rendered.get(pid)
+        if hit and hit[0] == level: return hit[1]
+        proj = self.projects[pid]
+        indent = "  " * level
+        parts = [f"{indent}📁 **{proj['name']}**\n"]
+        for tid in sorted(self.lines.get(pid, ())): parts.append(f"{indent}  └ {self.lines[pid][tid]}\n")
+        for cid in proj['children']: parts.append(self.render(cid, level + 1))
+        text = "".join(parts)
+        self.rendered[pid] = (level, text)
+        return text
+
+    def render_all(self):
+        parts = ["=== [현재 프로젝트 및 업무 현황] ===\n"]
+        for pid, p in self.projects.items():
+            if p['parent'] not in self.projects: parts.append(self.render(pid, 0))
+        if INBOX not in self.rendered:
+            lines = self.lines.get(INBOX, {})
+            text = ("📁 **미분류 작업**\n" + "".join(f"  └ {lines[t]}\n" for t in sorted(lines))) if lines else ""
+            self.rendered[INBOX] = (0, text)
+        parts.append(self.rendered[INBOX][1])
+        return "".join(parts)
+
 
 class ContextManager:
+    """
+    길드별 프로젝트·작업 현황 텍스트 (AI 프롬프트용 컨텍스트).
+    길드마다 스냅샷을 한 번 읽어 두고, DB 변경 알림(add_listener)으로 바뀐 작업·프로젝트 id 만 모았다가
+    다음 조회 때 한 번의 쿼리로 반영합니다. 렌더링은 바뀐 프로젝트와 그 조상 서브트리만 다시 합니다.
+    """
     def __init__(self, db):
         self.db = db
+        self._snapshots = {}           # guild_id -> _Snapshot
+        self._dirty_tasks = set()      # 아직 반영하지 않은 task_id
+        self._dirty_projects = set()   # (guild_id, project_id)
+        self._lock = threading.Lock()
+        db.add_listener(self._on_change)
+
+    def _on_change(self, kind, guild_id, obj_id):
+        with self._lock:
+            if kind == 'task': self._dirty_tasks.add(obj_id)
+            elif kind == 'project': self._dirty_projects.add((guild_id, obj_id))
+
+    def invalidate(self, guild_id=None):
+        """스냅샷을 버리고 다음 조회 때 새로 읽음 (None 이면 전체)"""
+        with self._lock:
+            if guild_id is None: self._snapshots.clear()
+            else: self._snapshots.pop(guild_id, None)
+
+    def _apply_pending(self):
+        with self._lock:
+            tids, projs = self._dirty_tasks, self._dirty_projects
+            self._dirty_tasks, self._dirty_projects = set(), set()
+        for gid, pid in projs:
+            snap = self._snapshots.get(gid)
+            if snap is None: continue
+            p = self.db.get_project(pid)
+            if p: snap.put_project(pid, p['name'], p['parent_id'])
+        if not tids: return
+        rows = {r[0]: r for r in self.db.get_context_tasks(task_ids=tids)}
+        for tid in tids:
+            row = rows.get(tid)
+            for gid, snap in self._snapshots.items():
+                if row and row[1] == gid: snap.put_task(row)
+                elif tid in snap.tasks: snap.drop_task(tid)    # 삭제 / 다른 길드로 이동
+
+    def snapshot(self, guild_id):
+        self._apply_pending()
+        snap = self._snapshots.get(guild_id)
+        if snap is None:
+            snap = _Snapshot(self.db.get_project_tree(guild_id), self.db.get_context_tasks(guild_id))
+            self._snapshots[guild_id] = snap
+        return snap
 
     def build_guild_context(self, guild_id):
         """
         서버의 모든 프로젝트, 할 일, 구조 정보를 하나의 구조화된 텍스트로 생성합니다.
         마치 지식 그래프를 텍스트로 풀어쓴 것과 같은 효과를 냅니다.
         """
-        # 1. 프로젝트 트리 조회
-        proj_rows = self.db.get_project_tree(guild_id) # [(id, name, parent_id), ...]
-        
-        # 2. 할 일 조회 (완료되지 않은 것만)
-        tasks = self.db.get_active_tasks_simple(guild_id) # [{'id', 'content', 'status', 'project_id'??}]
-        # 참고: get_active_tasks_simple이 project_id도 반환하도록 DB 메서드 수정 필요할 수 있음
-        # 여기서는 편의상 tasks를 다시 조회한다고 가정하거나, 기존 메서드를 활용
-        
-        # 데이터 구조화
-        project_map = {r[0]: {'name': r[1], 'parent': r[2], 'tasks': [], 'children': []} for r in proj_rows}
-        project_map[0] = {'name': '미분류(Inbox)', 'parent': None, 'tasks': [], 'children': []} # ID 0 or None for No Project
-
-        # 할 일 매핑 (이 로직을 위해 tasks 테이블 조회 시 project_id가 필요함)
-        # 현재 get_active_tasks_simple은 project_id를 안 가져오므로,
-        # 아래 로직을 위해 DB 쿼리를 조금 수정하거나 여기서 전체 조회를 다시 해야 함.
-        # (성능 최적화를 위해선 DB 쿼리 수정 권장. 여기선 개념적으로 설명)
-        
-        all_tasks_detail = self.db.get_tasks(guild_id) 
-        # get_tasks 리턴: (task_id, proj_name, content, assignee_id, assignee_name, status)
-        
-        for t in all_tasks_detail:
-            tid, pname, content, aid, aname, status = t
-            # 프로젝트 이름으로 매핑 (ID가 더 정확하지만 현재 구조상 이름 사용)
-            # 편의상 텍스트로 바로 구성
-            task_str = f"- [#{tid}] {content} (담당: {aname or '미정'}) [{status}]"
-            
-            # 해당 프로젝트 찾기 (이름 매칭)
-            found = False
-            for pid, pdata in project_map.items():
-                if pdata['name'] == pname:
-                    pdata['tasks'].append(task_str)
-                    found = True
-                    break
-            if not found:
-                project_map[0]['tasks'].append(task_str)
-
-        # 트리 구조 형성
-        root_projects = []
-        for pid, pdata in project_map.items():
-            if pid == 0: continue
-            if pdata['parent'] and pdata['parent'] in project_map:
-                project_map[pdata['parent']]['children'].append(pdata)
-            else:
-                root_projects.append(pdata)
-
-        # 3. 텍스트 렌더링 (재귀)
-        def render_project(proj, level=0):
-            indent = "  " * level
-            output = f"{indent}📁 **{proj['name']}**\n"
-            
-            # 할 일 출력
-            for t in proj['tasks']:
-                output += f"{indent}  └ {t}\n"
-            
-            # 하위 프로젝트 출력
-            for child in proj['children']:
-                output += render_project(child, level + 1)
-            return output
-
-        context_text = "=== [현재 프로젝트 및 업무 현황] ===\n"
-        for proj in root_projects:
-            context_text += render_project(proj)
-        
-        # 미분류 항목
-        if project_map[0]['tasks']:
-            context_text += "📁 **미분류 작업**\n"
-            for t in project_map[0]['tasks']:
-                context_text += f"  └ {t}\n"
-
-        return context_text
\ No newline at end of file
+        return self.snapshot(guild_id).render_all()
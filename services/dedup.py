@@ -0,0 +1,208 @@
+import math
+import re
+import threading
+from collections import Counter
+
+import numpy as np
+
+_STRIP_RE = re.compile(r'[\W_]+')
+NGRAMS = (2, 3)
+
+
+def char_ngrams(text):
+    """공백·문장부호를 뺀 소문자 문자열의 2~3글자 n-gram ('로그인 API 수정' → '로그', '그인', ..., '인ap', ...)"""
+    s = _STRIP_RE.sub('', (text or '').lower())
+    if len(s) < NGRAMS[0]: return [s] if s else []
+    return [s[i:i + n] for n in NGRAMS for i in range(len(s) - n + 1)]
+
+
+class TfidfMatrix:
+    """
+    문자 n-gram TF-IDF 행렬 (행 = 문서). 열(n-gram)별 posting 을 덧붙여 가며 증분 갱신하고,
+    질의는 질의 n-gram 의 posting 을 이어 붙여 bincount 한 번으로 전 문서와의 코사인 유사도를 구합니다.
+      - tf 는 1 + log(tf), idf 는 log((1 + N) / (1 + df)) + 1
+      - 문서 norm 은 추가할 때의 idf 로 계산하고, 문서 수가 norm_drift 비율 이상 바뀌면 전부 다시 계산
+      - 삭제는 alive 표시만 끄고, 죽은 문서가 살아 있는 문서보다 많아지면 압축
+    """
+    def __init__(self, norm_drift=0.2):
+        self.norm_drift = norm_drift
+        self.vocab = {}              # n-gram -> 열 id
+        self.postings = []           # 열 id -> ([doc idx], [tf 가중치])
+        self._arrays = {}            # 열 id -> (np doc idx, np 가중치) 캐시
+        self.df = np.zeros(256, dtype=np.int32)
+        self.keys = []               # doc idx -> key
+        self.index = {}              # key -> doc idx
+        self.rows = []               # doc idx -> (np 열 id, np tf 가중치)
+        self.norms = np.zeros(64, dtype=np.float32)
+        self.alive = np.zeros(64, dtype=bool)
+        self.dead = 0
+        self._norm_n = 0             # norm 을 계산할 때의 문서 수
+
+    def __len__(self):
+        return len(self.index)
+
+    def _idf(self, cols):
+        return np.log((1 + len(self.index)) / (1 + self.df[cols].astype(np.float32))) + 1
+
+    def _vector(self, text, add=False):
+        """text → (열 id, tf 가중치, 처음 보는 n-gram 의 tf 가중치 목록)"""
+        counts = Counter(char_ngrams(text))
+        cols, tfs, unseen = [], [], []
+        for g, c in counts.items():
+            col = self.vocab.get(g)
+            if col is None and add:
+                col = self.vocab[g] = len(self.postings); self.postings.append(([], []))
+            if col is None: unseen.append(1 + math.log(c))
+            else: cols.append(col); tfs.append(1 + math.log(c))
+        return np.asarray(cols, dtype=np.int64), np.asarray(tfs, dtype=np.float32), unseen
+
+    def add(self, key, text):
+        self.remove(key)
+        cols, tfs, _ = self._vector(text, add=True)
+        idx = len(self.keys)
+        if idx >= len(self.alive):
+            size = len(self.alive) * 2
+            self.norms = np.resize(self.norms, size); self.alive = np.resize(self.alive, size); self.alive[idx:] = False
+        if len(self.vocab) > len(self.df):
+            df = np.zeros(max(len(self.vocab), len(self.df) * 2), dtype=np.int32); df[:len(self.df)] = self.df; self.df = df
+        self.keys.append(key); self.index[key] = idx; self.rows.append((cols, tfs))
+        self.alive[idx] = True
+        self.df[cols] += 1
+        for col, w in zip(cols.tolist(), tfs.tolist()):
+            docs, ws = self.postings[col]
+            docs.append(idx); ws.append(w)
+            self._arrays.pop(col, None)
+        self.norms[idx] = np.sqrt(np.sum((tfs * self._idf(cols)) ** 2)) or 1.0
+
+    def remove(self, key):
+        idx = self.index.pop(key, None)
+        if idx is None: return False
+        self.alive[idx] = False
+        self.df[self.rows[idx][0]] -= 1
+        self.dead += 1
+        if self.dead > 1024 and self.dead > len(self.index): self._compact()
+        return True
+
+    def _compact(self):
+        live = [i for i in range(len(self.keys)) if self.alive[i]]
+        items = [(self.keys[i], self.rows[i]) for i in live]
+        self.postings = [([], []) for _ in self.postings]
+        self._arrays, self.keys, self.index, self.rows, self.dead = {}, [], {}, [], 0
+        size = max(64, len(items) * 2)
+        self.norms = np.zeros(size, dtype=np.float32); self.alive = np.zeros(size, dtype=bool)
+        for idx, (key, (cols, tfs)) in enumerate(items):
+            self.keys.append(key); self.index[key] = idx; self.rows.append((cols, tfs)); self.alive[idx] = True
+            for col, w in zip(cols.tolist(), tfs.tolist()):
+                docs, ws = self.postings[col]; docs.append(idx); ws.append(w)
+        self._refresh_norms()
+
+    def _refresh_norms(self):
+        """현재 idf 로 모든 문서 norm 재계산 (행들을 이어 붙여 bincount 한 번)"""
+        n = len(self.keys)
+        self._norm_n = len(self.index)
+        if not n: return
+        lens = np.fromiter((len(r[0]) for r in self.rows), dtype=np.int64, count=n)
+        cols = np.concatenate([r[0] for r in self.rows]); tfs = np.concatenate([r[1] for r in self.rows])
+        sq = np.bincount(np.repeat(np.arange(n), lens), weights=(tfs * self._idf(cols)) ** 2, minlength=n)
+        self.norms[:n] = np.where(sq > 0, np.sqrt(sq), 1.0)
+
+    def _posting(self, col):
+        arr = self._arrays.get(col)
+        if arr is None:
+            docs, ws = self.postings[col]
+            arr = self._arrays[col] = (np.asarray(docs, dtype=np.int64), np.asarray(ws, dtype=np.float32))
+        return arr
+
+    def similar(self, text, k=3, min_score=0.0):
+        """text 와 코사인 유사도 상위 k 개 [(key, score)]"""
+        live = len(self.index)
+        if not live: return []
+        if abs(live - self._norm_n) > self.norm_drift * max(self._norm_n, 1): self._refresh_norms()
+        cols, tfs, unseen = self._vector(text)
+        idf = self._idf(cols)
+        q = tfs * idf
+        unseen_idf = math.log(1 + live) + 1
+        qnorm = math.sqrt(float(np.sum(q ** 2)) + sum((w * unseen_idf) ** 2 for w in unseen))
+        if not len(cols) or not qnorm: return []
+        all_docs, all_w = [], []
+        for col, qw, i in zip(cols.tolist(), q.tolist(), idf.tolist()):
+            docs, ws = self._posting(col)
+            all_docs.append(docs); all_w.append(ws * (qw * i))
+        n = len(self.keys)
+        dot = np.bincount(np.concatenate(all_docs), weights=np.concatenate(all_w), minlength=n)
+        score = np.where(self.alive[:n], dot / (self.norms[:n] * qnorm), 0)
+        hits = np.flatnonzero(score > min_score)
+        if len(hits) > k: hits = hits[np.argpartition(-score[hits], k - 1)[:k]]
+        hits = hits[np.argsort(-score[hits], kind="stable")]
+        return [(self.keys[i], min(float(score[i]), 1.0)) for i in hits]
+
+
+def _cosine(a, b):
+    """두 n-gram Counter 의 코사인 유사도 (제안 작업끼리 비교용, idf 없이)"""
+    dot = sum(c * b[g] for g, c in a.items() if g in b)
+    na = math.sqrt(sum(c * c for c in a.values())); nb = math.sqrt(sum(c * c for c in b.values()))
+    return dot / (na * nb) if na and nb else 0.0
+
+
+class DuplicateDetector:
+    """
+    길드별 진행 중 작업(DONE 제외)의 TF-IDF 행렬을 유지하고, 회의에서 제안된 작업이 기존 작업과 겹치는지 검사합니다.
+    행렬은 처음 검사할 때 한 번 만들고, 이후에는 DB 변경 알림으로 바뀐 작업만 갱신합니다.
+    """
+    def __init__(self, db, threshold=0.7, merge_threshold=0.92):
+        self.db = db
+        self.threshold = threshold               # 이 이상이면 '유사 작업' 표시
+        self.merge_threshold = merge_threshold   # 이 이상이면 같은 작업으로 보고 제안에서 제외
+        self._matrices = {}                      # guild_id -> TfidfMatrix
+        self._dirty = set()
+        self._lock = threading.RLock()
+        db.add_listener(self._on_change)
+
+    def _on_change(self, kind, guild_id, obj_id):
+        if kind != 'task': return
+        with self._lock: self._dirty.add(obj_id)
+
+    def _apply_pending(self):
+        tids, self._dirty = self._dirty, set()
+        if not tids or not self._matrices: return
+        rows = {r[0]: r for r in self.db.get_context_tasks(task_ids=tids)}
+        for tid in tids:
+            row = rows.get(tid)
+            for gid, m in self._matrices.items():
+                if row and row[1] == gid and row[5] != 'DONE': m.add(tid, row[3])
+                else: m.remove(tid)
+
+    def matrix(self, guild_id):
+        with self._lock:
+            self._apply_pending()
+            m = self._matrices.get(guild_id)
+            if m is None:
+                m = TfidfMatrix()
+                for t in self.db.get_active_tasks_simple(guild_id): m.add(t['id'], t['content'])
+                m._refresh_norms()
+                self._matrices[guild_id] = m
+            return m
+
+    def similar(self, guild_id, text, k=3):
+        """진행 중 작업 중 text 와 비슷한 것 [(task_id, score)] (threshold 이상)"""
+        m = self.matrix(guild_id)
+        with self._lock: return m.similar(text, k, self.threshold)
+
+    def review(self, guild_id, proposals):
+        """
+        제안된 작업 목록을 검사합니다.
+          - 제안끼리 merge_threshold 이상 겹치면 앞의 것만 남김
+          - 기존 작업과 merge_threshold 이상이면 제외, threshold 이상이면 t['duplicate_of'] = {'id', 'score'} 표시
+        반환: (남길 제안 목록, [(제외된 제안, 겹치는 task_id 또는 None)])
+        """
+        kept, dropped, grams = [], [], []
+        for t in proposals:
+            g = Counter(char_ngrams(t.get('content')))
+            if any(_cosine(g, other) >= self.merge_threshold for other in grams):
+                dropped.append((t, None)); continue
+            hits = self.similar(guild_id, t.get('content') or '', 1)
+            if hits and hits[0][1] >= self.merge_threshold:
+                dropped.append((t, hits[0][0])); continue
+            if hits: t['duplicate_of'] = {'id': hits[0][0], 'score': round(hits[0][1], 2)}
+            kept.append(t); grams.append(g)
+        return kept, dropped
@@ -0,0 +1,130 @@
+import math
+import re
+
+from services.prompt_budget import estimate_tokens
+
+# 확장자별 가중치 (리뷰 가치가 큰 코드일수록 높음)
+LANG_WEIGHTS = {
+    ".py": 1.0, ".js": 1.0, ".jsx": 1.0, ".ts": 1.0, ".tsx": 1.0, ".go": 1.0, ".java": 1.0, ".kt": 1.0,
+    ".rs": 1.0, ".c": 1.0, ".h": 0.9, ".cpp": 1.0, ".hpp": 0.9, ".cs": 1.0, ".rb": 1.0, ".php": 1.0,
+    ".swift": 1.0, ".scala": 1.0, ".sql": 0.8, ".sh": 0.7, ".vue": 0.9, ".svelte": 0.9,
+    ".html": 0.5, ".css": 0.4, ".scss": 0.4,
+    ".yml": 0.6, ".yaml": 0.6, ".toml": 0.6, ".ini": 0.5, ".cfg": 0.5, ".json": 0.4, ".xml": 0.3,
+    ".md": 0.3, ".rst": 0.3, ".txt": 0.2,
+}
+DEFAULT_WEIGHT = 0.5
+
+IGNORED_FILES = ('package-lock.json', 'yarn.lock', 'poetry.lock', 'Gemfile.lock', 'pnpm-lock.yaml', 'Cargo.lock', 'go.sum')
+IGNORED_EXTS = ('.svg', '.png', '.jpg', '.jpeg', '.gif', '.ico', '.pdf', '.woff', '.woff2', '.ttf', '.eot', '.zip')
+
+# 경로 패턴별 감점 배율
+_VENDORED_RE = re.compile(r'(^|/)(vendor|vendors|node_modules|third_party|external|dist|build|site-packages)/')
+_GENERATED_RE = re.compile(r'(\.min\.(js|css)$|_pb2(_grpc)?\.py$|\.pb\.go$|\.generated\.|(^|/)generated/|\.g\.dart$|\.snap$)')
+_TEST_RE = re.compile(r'(^|/)(tests?|__tests__|spec)/|(^|/)test_[^/]*$|_test\.\w+$|\.(test|spec)\.\w+$')
+_HUNK_RE = re.compile(r'^@@', re.M)
+
+
+def _ext(filename):
+    base = filename.rsplit('/', 1)[-1]
+    return '.' + base.rsplit('.', 1)[-1].lower() if '.' in base else ''
+
+
+class DiffSelector:
+    """
+    GitHub files 배열을 한 번 파싱해 파일·hunk 별 점수를 매기고, 토큰 예산 안에 가치가 큰 hunk 부터 담습니다.
+    점수 = 언어 가중치 × 경로 배율(테스트/생성/벤더) × log(변경량) × hunk 밀도(변경 줄 / 전체 줄)
+    출력은 원래 파일·hunk 순서를 유지하고, 빠진 파일과 일부만 담긴 파일을 report 로 돌려줍니다.
+    """
+    def __init__(self, max_tokens, provider="gemini", max_hunk_tokens=1200):
+        self.max_tokens = max_tokens
+        self.provider = provider
+        self.max_hunk_tokens = max_hunk_tokens
+
+    def estimate(self, text):
+        return estimate_tokens(text, self.provider)
+
+    def file_weight(self, filename):
+        """(가중치, 사유). 가중치 0 이면 리뷰 대상에서 제외"""
+        if any(filename.endswith(x) for x in IGNORED_FILES) or filename.lower().endswith(IGNORED_EXTS):
+            return 0.0, "lock/binary"
+        weight = LANG_WEIGHTS.get(_ext(filename), DEFAULT_WEIGHT)
+        if _VENDORED_RE.search(filename): return weight * 0.05, "vendored"
+        if _GENERATED_RE.search(filename): return weight * 0.1, "generated"
+        if _TEST_RE.search(filename): return weight * 0.6, "test"
+        return weight, None
+
+    def _split_hunks(self, patch):
+        starts = [m.start() for m in _HUNK_RE.finditer(patch)] or [0]
+        if starts[0] != 0: starts.insert(0, 0)
+        return [patch[a:b].rstrip('\n') for a, b in zip(starts, starts[1:] + [len(patch)]) if patch[a:b].strip()]
+
+    def _truncate_hunk(self, hunk, cost):
+        if cost <= self.max_hunk_tokens: return hunk, cost
+        lines = hunk.split('\n')
+        keep = max(int(len(lines) * self.max_hunk_tokens / cost), 1)
+        text = "\n".join(lines[:keep]) + f"\n...(hunk {len(lines) - keep}줄 생략)"
+        return text, self.estimate(text)
+
+    def select(self, files):
+        """files: GitHub API 의 files 배열 → (diff 텍스트, report)"""
+        report = {"files": len(files), "kept": 0, "dropped": [], "partial": [], "tokens": 0}
+        candidates = []    # (value/cost, file_idx, hunk_idx, text, cost)
+        headers = {}
+        for fi, f in enumerate(files):
+            fn = f.get('filename', '')
+            weight, reason = self.file_weight(fn)
+            patch = f.get('patch')
+            if weight == 0.0:
+                report["dropped"].append((fn, reason)); continue
+            if not patch:
+                report["dropped"].append((fn, "no patch")); continue
+            churn = f.get('additions', 0) + f.get('deletions', 0) or patch.count('\n+') + patch.count('\n-')
+            file_score = weight * math.log2(2 + churn)
+            hunks = self._split_hunks(patch)
+            headers[fi] = (f"📄 {fn}" + (f" ({reason})" if reason else ""), len(hunks))
+            for hi, h in enumerate(hunks):
+                lines = h.split('\n')
+                changed = sum(1 for l in lines[1:] if l[:1] in '+-')
+                density = (changed + 1) / len(lines)
+                text, cost = self._truncate_hunk(h, self.estimate(h))
+                candidates.append((file_score * density * (1 + math.log2(1 + changed)) / max(cost, 1), fi, hi, text, cost))
+
+        # 가치 대비 토큰이 큰 hunk 부터 예산이 허용하는 만큼 담기 (파일 헤더 비용은 처음 담을 때 한 번)
+        chosen, used = {}, 0
+        for _, fi, hi, text, cost in sorted(candidates, key=lambda c: -c[0]):
+            header_cost = 0 if fi in chosen else self.estimate(headers[fi][0]) + 2
+            if used + cost + header_cost > self.max_tokens: continue
+            chosen.setdefault(fi, {})[hi] = text
+            used += cost + header_cost
+
+        parts = []
+        for fi, f in enumerate(files):
+            if fi not in headers: continue
+            if fi not in chosen:
+                report["dropped"].append((f['filename'], "budget")); continue
+            header, n_hunks = headers[fi]
+            kept = chosen[fi]
+            body = []
+            for hi in range(n_hunks):
+                if hi in kept: body.append(kept[hi])
+                elif not body or body[-1] != "...(hunk 생략)": body.append("...(hunk 생략)")
+            if len(kept) < n_hunks: report["partial"].append((f['filename'], len(kept), n_hunks))
+            parts.append(header + "\n" + "\n".join(body) + "\n")
+            report["kept"] += 1
+
+        budget_dropped = [fn for fn, r in report["dropped"] if r == "budget"]
+        skipped = [fn for fn, r in report["dropped"] if r != "budget"]
+        if skipped: parts.append(f"...(리뷰 제외 {len(skipped)}개 파일: {', '.join(skipped[:10])})")
+        if budget_dropped:
+            parts.append(f"...(예산 초과로 {len(budget_dropped)}개 파일 생략: {', '.join(budget_dropped[:10])})")
+        report["tokens"] = used
+        if not report["kept"]: return "", report    # 리뷰할 코드 변경이 없음
+        return "\n".join(parts), report
+
+    @staticmethod
+    def describe(report):
+        """로그용 한 줄 요약"""
+        parts = [f"{report['kept']}/{report['files']} files, {report['tokens']} tokens"]
+        if report["partial"]: parts.append("partial " + ", ".join(f"{fn}({k}/{n})" for fn, k, n in report["partial"][:5]))
+        if report["dropped"]: parts.append("dropped " + ", ".join(f"{fn}[{r}]" for fn, r in report["dropped"][:10]))
+        return " | ".join(parts)
@@ -0,0 +1,55 @@
+import datetime
+import gzip
+import json
+import tempfile
+
+from services import pdf
+
+FORMATS = ("ndjson", "pdf")
+SPOOL_MAX_BYTES = 8 * 1024 * 1024    # 이보다 크면 SpooledTemporaryFile 이 디스크로 넘어감
+
+
+def _parse_date(value):
+    """'YYYY-MM-DD' 검증 (잘못된 형식이면 ValueError)"""
+    if not value: return None
+    try: return datetime.datetime.strptime(value.strip(), "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError: raise ValueError(f"날짜 형식은 YYYY-MM-DD 입니다: {value}")
+
+
+def _records(rows):
+    """DB 행 → 내보내기용 dict. summary 는 AI 요약 JSON (손상된 경우 원문 문자열)"""
+    for mid, name, date, summary, jump_url, project in rows:
+        try: data = json.loads(summary) if summary else {}
+        except ValueError: data = {"summary": summary}
+        if not isinstance(data, dict): data = {"summary": str(data)}
+        yield {"id": mid, "name": name, **data, "title": data.get("title") or name,
+               "date": date, "project": project, "jump_url": jump_url}
+
+
+def export_meetings(db, guild_id, fmt="ndjson", project_id=None, since=None, until=None, title="회의록 모음"):
+    """
+    길드(또는 프로젝트)의 회의록을 한 파일로 내보냅니다. 동기 함수이므로 asyncio.to_thread 로 호출하세요.
+      - ndjson : 회의 한 건당 JSON 한 줄, gzip 압축 (.ndjson.gz)
+      - pdf    : 회의마다 새 페이지로 이어지는 PDF (services.pdf.write_meetings_pdf)
+    행은 DB 커서에서 조금씩 읽어 바로 임시 파일에 쓰므로 메모리 사용량은 건수와 무관합니다.
+    반환값: (처음으로 되감은 SpooledTemporaryFile, 회의 수, 파일명)
+    """
+    if fmt not in FORMATS: raise ValueError(f"지원하지 않는 형식: {fmt}")
+    since, until = _parse_date(since), _parse_date(until)
+    rows = db.iter_meetings(guild_id, project_id=project_id, since=since, until=until)
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    try:
+        if fmt == "pdf":
+            count = pdf.write_meetings_pdf(_records(rows), spool, title=title)
+            filename = "meetings.pdf"
+        else:
+            count = 0
+            with gzip.GzipFile(fileobj=spool, mode="wb", filename="meetings.ndjson") as gz:
+                for rec in _records(rows):
+                    gz.write(json.dumps(rec, ensure_ascii=False).encode("utf-8") + b"\n")
+                    count += 1
+            filename = "meetings.ndjson.gz"
+    except Exception:
+        spool.close(); rows.close(); raise
+    spool.seek(0)
+    return spool, count, filename
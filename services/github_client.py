@@ -0,0 +1,117 @@
+import asyncio
+import time
+from collections import OrderedDict
+
+import aiohttp
+
+
+class GitHubClient:
+    """
+    봇 전체가 공유하는 GitHub REST 클라이언트.
+    - 하나의 ClientSession/커넥터를 재사용해 DNS·TCP·TLS 연결 비용을 줄임 (keep-alive, 호스트별 연결 한도)
+    - ETag / If-None-Match 조건부 요청 (304 응답은 GitHub rate limit 에 집계되지 않음)
+    - X-RateLimit-* / Retry-After 헤더를 읽어 한도 소진 시 대기하거나 요청을 건너뜀
+    """
+    API = "https://api.github.com"
+
+    def __init__(self, token=None, limit=20, limit_per_host=10, etag_cache_size=512, max_rate_wait=60):
+        self.token = token
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.etag_cache_size = etag_cache_size
+        self.max_rate_wait = max_rate_wait
+        self._session = None
+        self._etags = OrderedDict()    # url -> (etag, data)
+        self.rate_remaining = None
+        self.rate_reset_at = 0.0
+        self.stats = {"requests": 0, "not_modified": 0, "rate_limited": 0, "errors": 0}
+
+    @property
+    def headers(self):
+        h = {"Accept": "application/vnd.github.v3+json", "User-Agent": "Pynapse-Bot"}
+        if self.token: h["Authorization"] = f"token {self.token}"
+        return h
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit, limit_per_host=self.limit_per_host,
+                keepalive_timeout=60, ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=30, connect=10),
+            )
+        return self._session
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _update_rate_limit(self, headers):
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is not None: self.rate_remaining = int(remaining)
+        if reset is not None: self.rate_reset_at = float(reset)
+
+    def _rate_wait(self, headers=None):
+        """다음 요청까지 기다려야 하는 시간(초). 0 이면 바로 요청 가능"""
+        if headers and headers.get("Retry-After"):
+            return float(headers["Retry-After"])
+        if self.rate_remaining == 0:
+            return max(self.rate_reset_at - time.time(), 0.0)
+        return 0.0
+
+    def _remember(self, url, etag, data):
+        self._etags[url] = (etag, data)
+        self._etags.move_to_end(url)
+        while len(self._etags) > self.etag_cache_size:
+            self._etags.popitem(last=False)
+
+    async def get_json(self, url, conditional=True):
+        """
+        GET 요청 후 JSON 을 반환합니다. 실패하거나 rate limit 때문에 건너뛰면 None.
+        url 은 전체 URL 또는 '/repos/...' 형태의 경로 모두 허용합니다.
+        """
+        if url.startswith("/"): url = self.API + url
+
+        for attempt in range(2):
+            wait = self._rate_wait()
+            if wait > self.max_rate_wait:
+                print(f"[GitHub] Rate limit 소진, {int(wait)}초 뒤 초기화 → 요청 생략: {url}")
+                self.stats["rate_limited"] += 1
+                return None
+            if wait: await asyncio.sleep(wait)
+
+            headers = {}
+            cached = self._etags.get(url) if conditional else None
+            if cached: headers["If-None-Match"] = cached[0]
+
+            self.stats["requests"] += 1
+            try:
+                async with self._get_session().get(url, headers=headers) as r:
+                    self._update_rate_limit(r.headers)
+                    if r.status == 304 and cached:
+                        self.stats["not_modified"] += 1
+                        self._etags.move_to_end(url)
+                        return cached[1]
+                    if r.status == 200:
+                        data = await r.json()
+                        etag = r.headers.get("ETag")
+                        if etag and conditional: self._remember(url, etag, data)
+                        return data
+                    if r.status in (403, 429) and (r.headers.get("Retry-After") or self.rate_remaining == 0):
+                        self.stats["rate_limited"] += 1
+                        retry_wait = self._rate_wait(r.headers)
+                        if attempt == 0 and retry_wait <= self.max_rate_wait:
+                            await asyncio.sleep(retry_wait)
+                            continue
+                    print(f"[GitHub] {r.status} {url}")
+                    self.stats["errors"] += 1
+                    return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"[GitHub] Request error {url}: {e}")
+                self.stats["errors"] += 1
+                return None
+        return None
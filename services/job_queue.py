@@ -0,0 +1,92 @@
+import asyncio
+import json
+import random
+import time
+
+from services.metrics import REGISTRY
+
+
+class WebhookJobQueue:
+    """
+    SQLite(webhook_jobs) 기반 웹훅 작업 큐.
+    - 수신 핸들러는 enqueue 만 하고 바로 응답 → 처리는 워커 풀이 담당
+    - 실패하면 지수 백오프(+지터)로 재시도, max_attempts 를 넘으면 FAILED
+    - 봇이 재시작되면 RUNNING 으로 남은 작업을 다시 대기열에 올려 이어서 처리
+    """
+    def __init__(self, db, handler, workers=2, max_attempts=5, base_delay=5.0, max_delay=600.0, poll_interval=5.0):
+        self.db = db
+        self.handler = handler          # async def handler(payload: dict, delivery_id: str)
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self._wake = asyncio.Event()
+        self._tasks = []
+        self._latency = REGISTRY.histogram("pynapse_webhook_job_seconds", "Webhook job processing latency", ("outcome",))
+
+    def start(self):
+        if self._tasks: return
+        restored = self.db.reset_running_jobs()
+        purged = self.db.purge_jobs()
+        if restored or purged: print(f"📥 Job queue: {restored}개 작업 복구, {purged}개 완료 기록 정리")
+        self._tasks = [asyncio.create_task(self._worker(i)) for i in range(self.workers)]
+        self._wake.set()
+
+    async def stop(self):
+        for t in self._tasks: t.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def enqueue(self, delivery_id, event, body, priority=0):
+        """새 작업이면 True, 이미 받은 delivery(GitHub 재전송) 면 False"""
+        jid = self.db.enqueue_job(delivery_id, event, body, priority)
+        if jid is None: return False
+        self._wake.set()
+        return True
+
+    def backoff(self, attempts):
+        delay = min(self.base_delay * (2 ** (attempts - 1)), self.max_delay)
+        return delay * random.uniform(0.8, 1.2)
+
+    def stats(self):
+        return dict(self.db.get_job_stats(), workers=len(self._tasks))
+
+    async def _worker(self, idx):
+        while True:
+            job = self.db.claim_job()
+            if job is None:
+                self._wake.clear()
+                due = self.db.get_next_job_time()
+                timeout = self.poll_interval if due is None else min(max(due - time.time(), 0.01), self.poll_interval)
+                try: await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+                except asyncio.TimeoutError: pass
+                continue
+            await self._run(job)
+
+    async def _run(self, job):
+        t0 = time.perf_counter()
+        outcome = "done"
+        try:
+            await self.handler(json.loads(job['payload']), job['delivery_id'])
+        except SystemExit:
+            # 자체 업데이트 후 재시작: 재시작 뒤 같은 작업이 다시 실행되지 않도록 완료 처리 후 전파
+            self.db.complete_job(job['id'])
+            outcome = "self_update"
+            raise
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except Exception as e:
+            outcome = "failed" if job['attempts'] >= self.max_attempts else "retry"
+            if job['attempts'] >= self.max_attempts:
+                print(f"❌ Job {job['delivery_id']} failed permanently: {e}")
+                self.db.fail_job(job['id'], e)
+            else:
+                retry_at = time.time() + self.backoff(job['attempts'])
+                print(f"⚠️ Job {job['delivery_id']} failed (attempt {job['attempts']}), retry in {int(retry_at - time.time())}s: {e}")
+                self.db.fail_job(job['id'], e, retry_at)
+        else:
+            self.db.complete_job(job['id'])
+        finally:
+            self._latency.observe(time.perf_counter() - t0, outcome=outcome)
@@ -2,7 +2,7 @@ import discord
 import json
 import io
 import asyncio
-from services.pdf import generate_meeting_pdf
+from services.chunker import EMBED_DESCRIPTION, EMBED_TITLE, add_field_chunks, truncate
 from ui import MeetingTaskView, RoleAssignmentView, RoleCreationView, NewProjectView, StatusUpdateView
 
 async def process_meeting_result(ctx, bot, data, raw_messages):
@@ -27,7 +27,7 @@ async def process_meeting_result(ctx, bot, data, raw_messages):
     waiting = await ctx.send("🤖 AI 분석 및 정리 중... (화자 익명화 적용)")
 
     # 2. AI 요약
-    full_result = await bot.ai.generate_meeting_summary(final_transcript)
+    full_result = await bot.ai.generate_meeting_summary(final_transcript, guild_id=ctx.guild.id)
     if not isinstance(full_result, dict):
         full_result = {"title": data['name'], "summary": str(full_result), "agenda": [], "decisions": []}
 
@@ -46,18 +46,28 @@ async def process_meeting_result(ctx, bot, data, raw_messages):
     
     # 3. DB 저장
     summary_dump = json.dumps(full_result, ensure_ascii=False)
-    m_id = bot.db.save_meeting(ctx.guild.id, title, ctx.channel.id, summary_dump, data['jump_url'])
+    project_id = bot.db.get_project_id(ctx.guild.id, project_name)
+    m_id = bot.db.save_meeting(ctx.guild.id, title, ctx.channel.id, summary_dump, data['jump_url'], project_id)
 
-    # 4. 파일 생성 (PDF는 제거됨, JSON만 생성)
-    files_to_send = await _create_result_files(full_result, m_id)
+    # 4. 파일 생성 (JSON, [UPDATE] meeting_pdf 설정 시 PDF 도 첨부)
+    with_pdf = bot.ai.config.get('meeting_pdf', False)
+    files_to_send = await _create_result_files(bot, full_result, m_id, with_pdf)
 
     # 5. 할 일 분석
     # [UPDATE] 멤버 목록 생성
     mems = ", ".join([m.display_name for m in ctx.guild.members if not m.bot])
     active = bot.db.get_active_tasks_simple(ctx.guild.id)
-    
+
+    # [NEW] 진행 중 작업 / 과거 결정사항은 회의 내용과 관련도 높은 상위 k 개만 프롬프트에 (BM25)
+    related = []
+    rcfg = bot.ai.config.get('retrieval', {})
+    try:
+        active = await asyncio.to_thread(bot.retriever.top_tasks, ctx.guild.id, final_transcript, active, rcfg.get('tasks', 30))
+        related = await asyncio.to_thread(bot.retriever.related_decisions, ctx.guild.id, final_transcript, rcfg.get('decisions', 5), m_id)
+    except Exception as e: print(f"관련 컨텍스트 검색 실패: {e}")
+
     # [UPDATE] 인자 4개 전달 (transcript, project_name, active_tasks, members)
-    res = await bot.ai.extract_tasks_and_updates(final_transcript, project_name, active, mems)
+    res = await bot.ai.extract_tasks_and_updates(final_transcript, project_name, active, mems, guild_id=ctx.guild.id, related=related)
     
     await waiting.delete()
 
@@ -67,11 +77,12 @@ async def process_meeting_result(ctx, bot, data, raw_messages):
     updates = res.get('updates', [])
 
     # 7. 포럼 게시글 본문 수정
-    embed = discord.Embed(title=f"✅ {title}", description=summary_text[:3500], color=0x2ecc71)
+    # [UPDATE] Discord 한도(설명 4096 / 필드 1024 / 전체 6000)에 맞춰 자름, 전체 내용은 첨부 파일에
+    embed = discord.Embed(title=truncate(f"✅ {title}", EMBED_TITLE), description=truncate(summary_text, EMBED_DESCRIPTION), color=0x2ecc71)
+    embed.set_footer(text=f"Meeting ID: #{m_id} | " + ("PDF·JSON 첨부됨" if len(files_to_send) > 1 else "데이터(JSON) 첨부됨"))
     if full_result.get('decisions'):
         d_txt = "\n".join([f"• {d}" for d in full_result['decisions']])
-        embed.add_field(name="☑ 결정 사항", value=d_txt[:1000], inline=False)
-    embed.set_footer(text=f"Meeting ID: #{m_id} | 데이터(JSON) 첨부됨")
+        add_field_chunks(embed, "☑ 결정 사항", d_txt)
 
     await _update_forum_post(ctx, start_msg_id, embed, files_to_send)
 
@@ -91,6 +102,15 @@ async def process_meeting_result(ctx, bot, data, raw_messages):
         except Exception as e:
             print(f"스레드 닫기 실패: {e}")
 
+    # [NEW] 기존 작업과 겹치는 제안은 제외하거나 '유사 작업' 표시 (문자 n-gram TF-IDF 코사인)
+    if new_tasks:
+        try:
+            new_tasks, dropped = await asyncio.to_thread(bot.dedup.review, ctx.guild.id, new_tasks)
+            if dropped:
+                lines = [f"• {t.get('content', '')[:60]}" + (f" → #{tid}" if tid else " (중복 제안)") for t, tid in dropped]
+                await ctx.send("♻️ **이미 있는 작업과 같아 제외했습니다.**\n" + "\n".join(lines[:15]) + (f"\n…외 {len(lines) - 15}건" if len(lines) > 15 else ""))
+        except Exception as e: print(f"중복 작업 검사 실패: {e}")
+
     # 9. 할 일 등록 절차
     if new_tasks:
         view = MeetingTaskView(new_tasks, m_id, ctx.author, ctx.guild, bot.db, cleanup_callback=close_thread_logic)
@@ -135,9 +155,12 @@ def _restore_names_in_json(data, reverse_map):
         item['topic'] = _restore_text(item.get('topic', ''), reverse_map)
         item['content'] = _restore_text(item.get('content', ''), reverse_map)
 
-async def _create_result_files(full_result, m_id):
+async def _create_result_files(bot, full_result, m_id, with_pdf=False):
     files = []
-    # PDF 제거됨
+    if with_pdf:
+        # 렌더링은 bot.pdf 워커 프로세스에서 (이벤트 루프를 막지 않음)
+        try: files.append(discord.File(await bot.pdf.meeting(full_result), filename=f"Meeting_{m_id}_report.pdf"))
+        except Exception as e: print(f"회의록 PDF 생성 실패: {e}")
     try:
         json_bytes = json.dumps(full_result, ensure_ascii=False, indent=2).encode('utf-8')
         files.append(discord.File(io.BytesIO(json_bytes), filename=f"Meeting_{m_id}_context.json"))
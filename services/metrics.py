@@ -0,0 +1,238 @@
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+import time
+
+from services.telemetry import Histogram as _Buckets, LATENCY_BUCKETS
+
+# DB 쿼리처럼 짧은 작업용 버킷 (초)
+FAST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, float("inf"))
+
+
+def _fmt_labels(labelnames, values, extra=None):
+    pairs = list(zip(labelnames, values)) + (extra or [])
+    if not pairs: return ""
+    esc = lambda v: str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return "{" + ",".join(f'{k}="{esc(v)}"' for k, v in pairs) + "}"
+
+
+def _fmt_value(v):
+    if v == float("inf"): return "+Inf"
+    return repr(float(v)) if isinstance(v, float) else str(v)
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(str(labels.get(n, "")) for n in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.extend(self._samples(key, value))
+        return lines
+
+    def _samples(self, key, value):
+        return [f"{self.name}{_fmt_labels(self.labelnames, key)} {_fmt_value(value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock: self._values[key] = self._values.get(key, 0) + amount
+
+    def set(self, value, **labels):
+        """다른 곳에서 이미 누적한 값을 그대로 반영할 때 사용"""
+        with self._lock: self._values[self._key(labels)] = value
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        with self._lock: self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    """버킷 집계는 services.telemetry.Histogram 을 재사용하고, 출력 시 누적(le) 형식으로 변환"""
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = buckets
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            if key not in self._values: self._values[key] = _Buckets(self.buckets)
+            self._values[key].observe(value)
+
+    def set_buckets(self, hist, **labels):
+        """이미 집계된 telemetry.Histogram 을 그대로 내보낼 때 사용"""
+        with self._lock: self._values[self._key(labels)] = hist
+
+    def _samples(self, key, hist):
+        lines, acc = [], 0
+        for bound, cnt in zip(hist.buckets, hist.counts):
+            acc += cnt
+            le = [("le", "+Inf" if bound == float("inf") else repr(float(bound)))]
+            lines.append(f"{self.name}_bucket{_fmt_labels(self.labelnames, key, le)} {acc}")
+        lines.append(f"{self.name}_sum{_fmt_labels(self.labelnames, key)} {_fmt_value(float(hist.sum))}")
+        lines.append(f"{self.name}_count{_fmt_labels(self.labelnames, key)} {hist.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    프로세스 내 메트릭 저장소. 각 모듈은 counter/gauge/histogram 으로 값을 직접 기록하고,
+    조회 시점에만 계산할 수 있는 값(큐 적체량, 회의 버퍼 등)은 collector 콜백으로 등록합니다.
+    """
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = {}
+        self._lock = threading.Lock()
+
+    def _get(self, cls, name, help_text, labelnames, **kwargs):
+        with self._lock:
+            if name not in self._metrics: self._metrics[name] = cls(name, help_text, labelnames, **kwargs)
+            return self._metrics[name]
+
+    def counter(self, name, help_text, labelnames=()):
+        return self._get(Counter, name, help_text, labelnames)
+
+    def gauge(self, name, help_text, labelnames=()):
+        return self._get(Gauge, name, help_text, labelnames)
+
+    def histogram(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self._get(Histogram, name, help_text, labelnames, buckets=buckets)
+
+    def add_collector(self, key, fn):
+        """fn() 은 조회 직전에 호출되어 gauge 등을 갱신합니다. 같은 key 로 다시 등록하면 교체 (Cog 재로드 대비)"""
+        self._collectors[key] = fn
+
+    def render(self):
+        for fn in list(self._collectors.values()):
+            try: fn()
+            except Exception as e: print(f"[Metrics] collector error: {e}")
+        with self._lock: metrics = list(self._metrics.values())
+        lines = []
+        for m in metrics: lines.extend(m.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+# --- DB 계측 ---
+def instrument_db(cls):
+    """DBManager 의 공개 메서드를 감싸 mixin/메서드별 호출 수와 지연시간을 기록하는 클래스 데코레이터"""
+    hist = REGISTRY.histogram("pynapse_db_query_seconds", "DB method latency", ("mixin", "method"), FAST_BUCKETS)
+    errors = REGISTRY.counter("pynapse_db_errors_total", "DB method exceptions", ("mixin", "method"))
+    for name in dir(cls):
+        if name.startswith("_") or name == "init_db": continue
+        owner = next((k for k in cls.__mro__ if name in k.__dict__), None)
+        fn = getattr(cls, name)
+        if owner is None or not callable(fn): continue
+        if inspect.isgeneratorfunction(fn): continue    # 순회 제너레이터는 생성 시간만 잡히므로 제외
+
+        def wrap(fn, mixin, method):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                t0 = time.perf_counter()
+                try: return fn(*args, **kwargs)
+                except Exception:
+                    errors.inc(mixin=mixin, method=method); raise
+                finally: hist.observe(time.perf_counter() - t0, mixin=mixin, method=method)
+            return wrapper
+        setattr(cls, name, wrap(fn, owner.__name__, name))
+    return cls
+
+
+# --- AI 텔레메트리 내보내기 ---
+def register_ai_telemetry(telemetry):
+    latency = REGISTRY.histogram("pynapse_ai_call_seconds", "AI call total latency", ("prompt_type", "guild_id"))
+    ttfb = REGISTRY.histogram("pynapse_ai_ttfb_seconds", "AI call time to first byte", ("prompt_type", "guild_id"))
+    calls = REGISTRY.counter("pynapse_ai_calls_total", "AI calls", ("prompt_type", "guild_id", "outcome"))
+    tokens = REGISTRY.counter("pynapse_ai_tokens_total", "AI tokens", ("prompt_type", "guild_id", "direction"))
+    cost = REGISTRY.counter("pynapse_ai_cost_usd_total", "Estimated AI cost", ("prompt_type", "guild_id"))
+    cache = REGISTRY.counter("pynapse_ai_cache_total", "Review/diff cache lookups", ("prompt_type", "guild_id", "result"))
+
+    def collect():
+        with telemetry._lock:
+            series = list(telemetry._series.items())
+        for (pt, gid), s in series:
+            for result, n in s.cache.items():
+                if n: cache.set(n, prompt_type=pt, guild_id=gid, result=result)
+            if not s.calls: continue
+            latency.set_buckets(s.total, prompt_type=pt, guild_id=gid)
+            ttfb.set_buckets(s.ttfb, prompt_type=pt, guild_id=gid)
+            calls.set(s.calls - s.errors, prompt_type=pt, guild_id=gid, outcome="ok")
+            calls.set(s.errors, prompt_type=pt, guild_id=gid, outcome="error")
+            tokens.set(s.prompt_tokens, prompt_type=pt, guild_id=gid, direction="prompt")
+            tokens.set(s.response_tokens, prompt_type=pt, guild_id=gid, direction="response")
+            cost.set(round(s.cost, 6), prompt_type=pt, guild_id=gid)
+    REGISTRY.add_collector("ai_telemetry", collect)
+
+
+# --- Discord REST ---
+class _RateLimitLogHandler(logging.Handler):
+    """discord.http 의 429 경고 로그를 세는 핸들러 (재시도는 라이브러리 내부에서 처리되므로 로그로 관측)"""
+    def __init__(self, counter):
+        super().__init__(level=logging.WARNING)
+        self.counter = counter
+
+    def emit(self, record):
+        msg = record.msg if isinstance(record.msg, str) else ""
+        if "responded with 429" in msg:
+            method = record.args[0] if record.args else ""
+            self.counter.inc(method=method, scope="route")
+        elif "Global rate limit" in msg:
+            self.counter.inc(method="", scope="global")
+
+
+def instrument_discord(http):
+    """discord.py HTTPClient.request 를 감싸 route 별 REST 호출 수 / 지연시간을 기록"""
+    calls = REGISTRY.counter("pynapse_discord_requests_total", "Discord REST calls", ("method", "route", "outcome"))
+    latency = REGISTRY.histogram("pynapse_discord_request_seconds", "Discord REST call latency", ("method",))
+    limited = REGISTRY.counter("pynapse_discord_rate_limited_total", "Discord 429 responses", ("method", "scope"))
+    logging.getLogger("discord.http").addHandler(_RateLimitLogHandler(limited))
+
+    original = http.request
+
+    @functools.wraps(original)
+    async def request(route, **kwargs):
+        t0 = time.perf_counter()
+        outcome = "ok"
+        try: return await original(route, **kwargs)
+        except Exception:
+            outcome = "error"; raise
+        finally:
+            calls.inc(method=route.method, route=route.path, outcome=outcome)
+            latency.observe(time.perf_counter() - t0, method=route.method)
+    http.request = request
+
+
+# --- 이벤트 루프 지연 ---
+async def monitor_loop_lag(interval=0.5):
+    """interval 마다 깨어나 예정보다 늦게 깨어난 만큼을 이벤트 루프 지연으로 기록"""
+    gauge = REGISTRY.gauge("pynapse_event_loop_lag_last_seconds", "Most recent event loop lag")
+    hist = REGISTRY.histogram("pynapse_event_loop_lag_seconds", "Event loop lag", (), FAST_BUCKETS)
+    loop = asyncio.get_running_loop()
+    while True:
+        t0 = loop.time()
+        await asyncio.sleep(interval)
+        lag = max(loop.time() - t0 - interval, 0.0)
+        gauge.set(round(lag, 6)); hist.observe(lag)
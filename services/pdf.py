@@ -2,7 +2,7 @@ import io
 import os
 import re
 import html
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, ListFlowable, ListItem, HRFlowable
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, ListFlowable, ListItem, HRFlowable, PageBreak, Preformatted
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
@@ -18,6 +18,22 @@ ACCENT_COLOR = colors.HexColor('#E74C3C') # Red for alerts
 HEADER_BG = colors.HexColor('#ECF0F1') # Light Grey for table headers
 CODE_BG = colors.HexColor('#F8F9F9')   # Very light grey for code
 BORDER_COLOR = colors.HexColor('#BDC3C7')
+LIST_BULLETS = ("•", "◦", "▪", "–")  # 중첩 단계별 글머리표
+CODE_LINE_CHARS = 90                  # 코드 블록 한 줄 최대 글자 수 (넘으면 줄바꿈)
+SHORT_CELL_CHARS = 12                 # 이보다 짧은 표 셀은 Paragraph 없이 문자열로
+
+TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (-1,0), HEADER_BG),
+    ('TEXTCOLOR', (0,0), (-1,0), THEME_COLOR),
+    ('ALIGN', (0,0), (-1,-1), 'LEFT'),
+    ('VALIGN', (0,0), (-1,-1), 'TOP'),
+    ('GRID', (0,0), (-1,-1), 0.5, BORDER_COLOR),
+    ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.whitesmoke]),
+    ('LEFTPADDING', (0,0), (-1,-1), 6),
+    ('RIGHTPADDING', (0,0), (-1,-1), 6),
+    ('TOPPADDING', (0,0), (-1,-1), 6),
+    ('BOTTOMPADDING', (0,0), (-1,-1), 6),
+])
 
 def register_fonts():
     """한글 폰트(Regular, Bold) 등록 - 경로 자동 탐색"""
@@ -62,6 +78,17 @@ def register_fonts():
     
     return font_name
 
+# [NEW] 폰트(TTF 파싱)·스타일시트는 프로세스당 한 번만 준비
+_SETUP = None
+
+def setup():
+    """(font_name, styles) 반환. 최초 호출 때만 폰트를 등록하고 스타일시트를 만듭니다."""
+    global _SETUP
+    if _SETUP is None:
+        font_name = register_fonts()
+        _SETUP = (font_name, get_stylesheet(font_name))
+    return _SETUP
+
 def get_stylesheet(font_name):
     styles = getSampleStyleSheet()
     
@@ -93,6 +120,24 @@ def get_stylesheet(font_name):
         borderColor=BORDER_COLOR
     ))
 
+    # [NEW] Heading 2 / 3
+    styles.add(ParagraphStyle(
+        name='ReportH2',
+        parent=styles['ReportH1'],
+        fontSize=13,
+        leading=17,
+        spaceBefore=12,
+        spaceAfter=8
+    ))
+    styles.add(ParagraphStyle(
+        name='ReportH3',
+        parent=styles['ReportH1'],
+        fontSize=11,
+        leading=15,
+        spaceBefore=10,
+        spaceAfter=6
+    ))
+
     # Normal Text
     styles.add(ParagraphStyle(
         name='ReportNormal',
@@ -122,6 +167,16 @@ def get_stylesheet(font_name):
         wordWrap='CJK'
     ))
 
+    # [NEW] List Item (중첩 단계별)
+    for depth in range(len(LIST_BULLETS)):
+        styles.add(ParagraphStyle(
+            name=f'ReportList{depth}',
+            parent=styles['ReportNormal'],
+            leftIndent=20 + 15 * depth,
+            firstLineIndent=-15,
+            spaceAfter=4
+        ))
+
     # Table Cell
     styles.add(ParagraphStyle(
         name='TableCell',
@@ -134,67 +189,99 @@ def get_stylesheet(font_name):
 
     return styles
 
+# [UPDATE] 한 줄씩 한 번만 훑는 Markdown 토크나이저 (패턴은 모듈 로드 시 한 번 컴파일)
+_BLOCK_RE = re.compile(
+    r'(?P<fence>^\s*```)'
+    r'|(?P<heading>^\s{0,3}(?P<hashes>#{1,6})\s+(?P<htext>.*?)(?:\s+#+)?\s*$)'
+    r'|(?P<list>^(?P<indent>[ \t]*)(?P<marker>[-*+]|\d{1,3}[.)])\s+(?P<ltext>.*)$)'
+    r'|(?P<row>^\s*\|.*\|\s*$)'
+)
+_TABLE_SEP_RE = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')    # GFM 구분선 (|-|, |:-:|, |:--|--:|)
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_CODE_SPAN_RE = re.compile(r'`([^`]+)`')
+_BLOCK_START = frozenset('`#-*+|0123456789')    # 이 글자로 시작하는 줄만 블록 패턴 검사
+
+def _split_row(line):
+    cells = line.strip().strip('|').split('|')
+    return [c.strip() for c in cells]
+
 def parse_markdown_to_flowables(text, styles, font_name):
+    """
+    Markdown → flowable 목록. 지원: 코드 펜스, 제목(#~###### 단계별 스타일), 중첩 목록(들여쓰기 2칸 단위),
+    표(| a | b | + 구분선), **굵게**, `코드`. 스타일은 get_stylesheet 에서 만든 것을 그대로 사용합니다.
+    """
     story = []
-    
-    # Regex for code blocks
-    pattern = r'```(?:\w+)?\n(.*?)```'
-    parts = re.split(pattern, text, flags=re.DOTALL)
-    
-    for i, part in enumerate(parts):
-        if i % 2 == 1: # Code Block
-            code_content = part.strip()
-            if not code_content: continue
-            escaped_code = html.escape(code_content).replace('\n', '<br/>').replace(' ', '&nbsp;')
-            story.append(Paragraph(escaped_code, styles['ReportCode']))
+    code_span = f'<font backColor="{CODE_BG.hexval()}" name="{font_name}">&nbsp;\\1&nbsp;</font>'
+    cell_style = styles['TableCell']
+    table_style = TableStyle([('FONTNAME', (0,0), (-1,-1), font_name), ('FONTSIZE', (0,0), (-1,-1), cell_style.fontSize),
+                              ('LEADING', (0,0), (-1,-1), cell_style.leading)], parent=TABLE_STYLE)
+
+    def inline(txt):
+        txt = html.escape(txt)
+        if '**' in txt: txt = _BOLD_RE.sub(r'<b>\1</b>', txt)
+        if '`' in txt: txt = _CODE_SPAN_RE.sub(code_span, txt)
+        return txt
+
+    def flush_code(buf):
+        # 마크업 파싱이 없는 Preformatted 사용 (&nbsp; 치환 Paragraph 보다 훨씬 가벼움), 긴 줄은 잘라서 줄바꿈
+        body = '\n'.join(buf).strip('\n')
+        if body.strip():
+            story.append(Preformatted(body, styles['ReportCode'], maxLineLength=CODE_LINE_CHARS, newLineChars=''))
+
+    def cell(txt):
+        # 짧고 마크업 없는 셀은 Paragraph 대신 문자열 그대로 (셀 폰트는 table_style 로 지정)
+        if len(txt) <= SHORT_CELL_CHARS and '**' not in txt and '`' not in txt: return txt
+        return Paragraph(inline(txt), styles['TableCell'])
+
+    def flush_table(rows):
+        if not rows: return
+        width = max(len(r) for r in rows)
+        rows = [r + [''] * (width - len(r)) for r in rows]
+        data = [[Paragraph(f"<b>{inline(c)}</b>", styles['TableCell']) for c in rows[0]]] + [[cell(c) for c in r] for r in rows[1:]]
+        story.append(Table(data, colWidths=[170 * mm / width] * width, repeatRows=1, style=table_style, hAlign='LEFT'))
+        story.append(Spacer(1, 8))
+
+    lines = text.split('\n')
+    code, table = None, None
+    n = len(lines)
+    i = 0
+    while i < n:
+        line = lines[i]; i += 1
+        if code is not None:
+            if line.strip().startswith('```'):
+                flush_code(code); code = None
+            else: code.append(line)
+            continue
+
+        stripped = line.lstrip()
+        m = _BLOCK_RE.match(line) if stripped[:1] in _BLOCK_START else None
+        if table is not None and m is not None and m.group('row'):
+            table.append(_split_row(line)); continue
+        if table is not None:
+            flush_table(table); table = None
+
+        if not stripped: continue
+        if m is None:
+            story.append(Paragraph(inline(stripped.rstrip()), styles['ReportNormal']))
+        elif m.group('fence'):
+            code = []
+        elif m.group('heading'):
+            level = min(len(m.group('hashes')), 3)
+            story.append(Paragraph(f"<b>{inline(m.group('htext'))}</b>", styles[f'ReportH{level}']))
+        elif m.group('list'):
+            indent = m.group('indent').replace('\t', '    ')
+            depth = min(len(indent) // 2, len(LIST_BULLETS) - 1)
+            marker = m.group('marker')
+            bullet = LIST_BULLETS[depth] if marker in '-*+' else marker
+            story.append(Paragraph(f"{bullet} {inline(m.group('ltext'))}", styles[f'ReportList{depth}']))
+        elif i < n and '|' in lines[i] and _TABLE_SEP_RE.match(lines[i]):
+            # 표 머리글 + 구분선
+            table = [_split_row(line)]; i += 1
         else:
-            # Normal Text
-            lines = part.split('\n')
-            for line in lines:
-                if not line.strip(): continue
-                stripped_line = line.lstrip()
-                
-                # Headers
-                if stripped_line.startswith('#'):
-                    level = len(stripped_line.split(' ')[0])
-                    content = stripped_line.lstrip('#').strip()
-                    # Use H1 style for all headers for simplicity, or adjust
-                    story.append(Paragraph(f"<b>{html.escape(content)}</b>", styles['ReportH1']))
-                    continue
-                
-                # Lists
-                bullet = ""
-                content = ""
-                is_list = False
-                
-                if stripped_line.startswith(('- ', '* ')):
-                    is_list = True; bullet = "•"; content = stripped_line[2:]
-                elif re.match(r'^\d+\.\s', stripped_line):
-                    is_list = True
-                    m = re.match(r'^(\d+\.)\s', stripped_line)
-                    bullet = m.group(1); content = stripped_line[m.end():]
-
-                # Inline Styles
-                def process_inline(txt):
-                    txt = html.escape(txt)
-                    txt = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', txt)
-                    txt = re.sub(r'`([^`]+)`', f'<font backColor="{CODE_BG.hexval()}" name="{font_name}">&nbsp;\\1&nbsp;</font>', txt)
-                    return txt
-
-                final_text = process_inline(content if is_list else stripped_line)
-                
-                if is_list:
-                    # Custom List Style
-                    list_style = ParagraphStyle(
-                        'ListItem',
-                        parent=styles['ReportNormal'],
-                        leftIndent=20,
-                        firstLineIndent=-15
-                    )
-                    story.append(Paragraph(f"{bullet} {final_text}", list_style))
-                else:
-                    story.append(Paragraph(final_text, styles['ReportNormal']))
+            story.append(Paragraph(inline(stripped.rstrip()), styles['ReportNormal']))
 
+    if table is not None: flush_table(table)
+    if code: flush_code(code)    # 닫히지 않은 코드 펜스
     return story
 
 def generate_review_pdf(title, review_data, link=None):
@@ -206,8 +293,7 @@ def generate_review_pdf(title, review_data, link=None):
         topMargin=20*mm, bottomMargin=20*mm
     )
     
-    font_name = register_fonts()
-    styles = get_stylesheet(font_name)
+    font_name, styles = setup()
     
     story = []
     
@@ -268,18 +354,7 @@ def generate_review_pdf(title, review_data, link=None):
             col_widths = [25*mm, 20*mm, 40*mm, 85*mm]
             t = Table(table_data, colWidths=col_widths, repeatRows=1)
             
-            t.setStyle(TableStyle([
-                ('BACKGROUND', (0,0), (-1,0), HEADER_BG),
-                ('TEXTCOLOR', (0,0), (-1,0), THEME_COLOR),
-                ('ALIGN', (0,0), (-1,-1), 'LEFT'),
-                ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                ('GRID', (0,0), (-1,-1), 0.5, BORDER_COLOR),
-                ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.whitesmoke]),
-                ('LEFTPADDING', (0,0), (-1,-1), 6),
-                ('RIGHTPADDING', (0,0), (-1,-1), 6),
-                ('TOPPADDING', (0,0), (-1,-1), 6),
-                ('BOTTOMPADDING', (0,0), (-1,-1), 6),
-            ]))
+            t.setStyle(TABLE_STYLE)
             story.append(t)
             
         # Suggestions
@@ -297,18 +372,8 @@ def generate_review_pdf(title, review_data, link=None):
     buffer.seek(0)
     return buffer
 
-def generate_meeting_pdf(meeting_data):
-    buffer = io.BytesIO()
-    doc = SimpleDocTemplate(
-        buffer, 
-        pagesize=A4,
-        rightMargin=20*mm, leftMargin=20*mm, 
-        topMargin=20*mm, bottomMargin=20*mm
-    )
-    
-    font_name = register_fonts()
-    styles = get_stylesheet(font_name)
-    
+def meeting_story(meeting_data, styles):
+    """회의록 한 건의 flowable 목록 (단일 PDF / 묶음 PDF 공용)"""
     story = []
     
     # Header
@@ -323,8 +388,8 @@ def generate_meeting_pdf(meeting_data):
     summary = meeting_data.get('summary', '')
     if summary:
         story.append(Paragraph("📌 Summary", styles['ReportH1']))
-        # Box effect
-        story.append(Paragraph(html.escape(summary), styles['ReportCode'])) # Reusing Code style for box effect
+        # [UPDATE] AI 요약의 목록·표·제목도 그대로 표시
+        story.extend(parse_markdown_to_flowables(summary, styles, styles['ReportNormal'].fontName))
 
     # Agenda
     agenda = meeting_data.get('agenda', [])
@@ -348,17 +413,7 @@ def generate_meeting_pdf(meeting_data):
             
         col_widths = [40*mm, 130*mm]
         t = Table(table_data, colWidths=col_widths, repeatRows=1)
-        t.setStyle(TableStyle([
-            ('BACKGROUND', (0,0), (-1,0), HEADER_BG),
-            ('TEXTCOLOR', (0,0), (-1,0), THEME_COLOR),
-            ('GRID', (0,0), (-1,-1), 0.5, BORDER_COLOR),
-            ('VALIGN', (0,0), (-1,-1), 'TOP'),
-            ('ROWBACKGROUNDS', (0,1), (-1,-1), [colors.white, colors.whitesmoke]),
-            ('LEFTPADDING', (0,0), (-1,-1), 6),
-            ('RIGHTPADDING', (0,0), (-1,-1), 6),
-            ('TOPPADDING', (0,0), (-1,-1), 6),
-            ('BOTTOMPADDING', (0,0), (-1,-1), 6),
-        ]))
+        t.setStyle(TABLE_STYLE)
         story.append(t)
 
     # Decisions
@@ -369,6 +424,62 @@ def generate_meeting_pdf(meeting_data):
             # Checkbox style bullet
             story.append(Paragraph(f"☑  {html.escape(str(d))}", styles['ReportNormal']))
 
-    doc.build(story)
+    return story
+
+def generate_meeting_pdf(meeting_data):
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer, 
+        pagesize=A4,
+        rightMargin=20*mm, leftMargin=20*mm, 
+        topMargin=20*mm, bottomMargin=20*mm
+    )
+    
+    font_name, styles = setup()
+    doc.build(meeting_story(meeting_data, styles))
     buffer.seek(0)
-    return buffer
\ No newline at end of file
+    return buffer
+
+# [NEW] 여러 회의록을 한 PDF 로 (내보내기)
+class _LazyStory(list):
+    """
+    섹션(flowable 목록) 이터레이터를 필요할 때만 풀어 주는 list.
+    doc.build 는 앞에서부터 flowable 을 꺼내 쓰므로, 전체 story 를 미리 만들지 않아도 됩니다.
+    (keepWithNext 처리를 위해 최소 2개는 미리 채워 둠)
+    """
+    def __init__(self, sections):
+        super().__init__()
+        self._sections = iter(sections)
+
+    def __len__(self):
+        while list.__len__(self) < 2:
+            nxt = next(self._sections, None)
+            if nxt is None: break
+            self.extend(nxt)
+        return list.__len__(self)
+
+def write_meetings_pdf(meetings, fileobj, title="회의록 모음"):
+    """
+    meetings: 회의록 dict 이터레이터 → fileobj 에 섹션(회의)마다 새 페이지로 이어 쓴 PDF.
+    회의록은 한 건씩 flowable 로 바뀌므로 건수가 많아도 story 가 한꺼번에 메모리에 올라가지 않습니다.
+    반환값: 기록한 회의 수
+    """
+    doc = SimpleDocTemplate(
+        fileobj,
+        pagesize=A4,
+        rightMargin=20*mm, leftMargin=20*mm,
+        topMargin=20*mm, bottomMargin=20*mm,
+        title=title
+    )
+    font_name, styles = setup()
+    count = [0]
+
+    def sections():
+        yield [Paragraph(html.escape(title), styles['ReportTitle']), HRFlowable(width="100%", thickness=2, color=THEME_COLOR)]
+        for m in meetings:
+            count[0] += 1
+            yield [PageBreak()] + meeting_story(m, styles)
+        if not count[0]: yield [Paragraph("내보낼 회의록이 없습니다.", styles['ReportNormal'])]
+
+    doc.build(_LazyStory(sections()))
+    return count[0]
\ No newline at end of file
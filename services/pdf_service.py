@@ -0,0 +1,85 @@
+import asyncio
+import io
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from services import pdf
+from services.metrics import REGISTRY
+
+
+# --- 워커 프로세스에서 실행되는 함수 (pickle 가능하도록 모듈 최상위) ---
+def _init_worker():
+    pdf.setup()
+
+def _ping():
+    return True
+
+def _render(kind, args):
+    fn = pdf.generate_meeting_pdf if kind == "meeting" else pdf.generate_review_pdf
+    return fn(*args).getvalue()
+
+
+class PDFService:
+    """
+    reportlab 렌더링을 프로세스 풀에서 실행하는 비동기 API.
+    각 워커는 시작할 때 폰트·스타일시트를 한 번 준비하고, 이후 요청은 레이아웃만 수행하므로
+    이벤트 루프는 렌더링 동안 막히지 않습니다. workers=0 이면 프로세스 대신 스레드에서 렌더링합니다.
+    """
+    def __init__(self, workers=2):
+        self.workers = workers
+        self._pool = None
+        self._latency = REGISTRY.histogram("pynapse_pdf_render_seconds", "PDF render latency", ("kind",))
+
+    @staticmethod
+    def _mp_context():
+        """
+        스레드가 메인 스레드 하나뿐일 때만 fork (main_bot 을 다시 import 하지 않아 빠름).
+        이벤트 루프·aiohttp 스레드가 생긴 뒤에는 fork 한 자식이 잠긴 락을 물려받아 멈출 수 있으므로 forkserver 사용
+        (이때 워커는 main_bot 을 __mp_main__ 으로 다시 import 하지만 bot.run 은 __main__ 가드 안이라 실행되지 않음)
+        """
+        methods = multiprocessing.get_all_start_methods()
+        if "fork" in methods and threading.active_count() == 1: return multiprocessing.get_context("fork")
+        if "forkserver" in methods:
+            multiprocessing.set_forkserver_preload(["services.pdf"])    # reportlab 은 서버에서 한 번만 import
+            return multiprocessing.get_context("forkserver")
+        return None
+
+    def start(self):
+        """
+        풀을 미리 띄워 첫 요청에서 워커 기동·폰트 파싱 비용이 들지 않게 함.
+        봇이 스레드를 만들기 전(bot.run 이전)에 호출하면 워커를 모두 fork 로 띄움
+        """
+        if self.workers <= 0 or self._pool is not None: return
+        self._pool = ProcessPoolExecutor(self.workers, mp_context=self._mp_context(), initializer=_init_worker)
+        for _ in range(self.workers): self._pool.submit(_ping)
+
+    def shutdown(self):
+        if self._pool is None: return
+        self._pool.shutdown(wait=False, cancel_futures=True); self._pool = None
+
+    async def _run(self, kind, *args):
+        t0 = time.perf_counter()
+        if self.workers <= 0:
+            data = await asyncio.to_thread(_render, kind, args)
+        else:
+            self.start()
+            loop = asyncio.get_running_loop()
+            try: data = await loop.run_in_executor(self._pool, _render, kind, args)
+            except BrokenProcessPool:
+                # 워커가 비정상 종료되면 풀을 새로 만들고 한 번만 다시 시도
+                print("[PDF] 워커 풀 재시작")
+                self._pool = None; self.start()
+                data = await loop.run_in_executor(self._pool, _render, kind, args)
+        self._latency.observe(time.perf_counter() - t0, kind=kind)
+        return io.BytesIO(data)
+
+    async def meeting(self, meeting_data):
+        """회의록 PDF (BytesIO)"""
+        return await self._run("meeting", meeting_data)
+
+    async def review(self, title, review_data, link=None):
+        """코드 리뷰 PDF (BytesIO)"""
+        return await self._run("review", title, review_data, link)
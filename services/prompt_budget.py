@@ -0,0 +1,209 @@
+import json
+import logging
+import re
+
+logger = logging.getLogger("PromptBudget")
+
+# 문자 종류별 토큰 환산 비율 (토큰/문자). 실제 토크나이저 대신 쓰는 근사치입니다.
+# - Gemini(SentencePiece): 영문 약 4자/토큰, 한글은 음절당 0.7토큰 안팎
+# - Groq(Llama3 BPE): 영문은 비슷하지만 한글 음절이 1토큰 이상으로 쪼개지는 경우가 많음
+TOKEN_RATIOS = {
+    "gemini": {"ascii": 0.25, "cjk": 0.7, "other": 0.5},
+    "groq": {"ascii": 0.27, "cjk": 1.2, "other": 0.6},
+}
+DEFAULT_RATIO = {"ascii": 0.3, "cjk": 1.2, "other": 0.6}
+
+# 모델 컨텍스트 한도 (응답 몫은 RESPONSE_RESERVE 만큼 비워둠)
+MODEL_CONTEXT = {"gemini": 1_000_000, "groq": 128_000}
+RESPONSE_RESERVE = 4096
+
+# 템플릿별 기본 프롬프트 예산 (토큰). src/config.json 의 "prompt_budget" 으로 덮어쓸 수 있음
+DEFAULT_BUDGETS = {
+    "meeting_summary": 12000,
+    "extract_tasks": 8000,
+    "code_review": 6000,
+    "code_review_batch": 10000,
+}
+
+# 템플릿 변수별 (우선순위, 압축기, 최소 토큰). 우선순위 숫자가 클수록 먼저 줄어듭니다.
+TEMPLATE_SPECS = {
+    "meeting_summary": {
+        "transcript": (1, "transcript", 1000),
+    },
+    "extract_tasks": {
+        "current_project": (0, "text", 50),
+        "transcript": (1, "transcript", 1500),
+        "tasks_str": (2, "tasks", 200),
+        "members": (3, "members", 100),
+        "related": (4, "text", 0),
+    },
+    "code_review": {
+        "repo": (0, "text", 50),
+        "author": (0, "text", 50),
+        "msg": (1, "text", 200),
+        "diff": (2, "diff", 500),
+    },
+    "code_review_batch": {
+        "repo": (0, "text", 50),
+        "commits": (1, "diff", 1000),
+    },
+}
+
+_CJK_RE = re.compile(r'[ᄀ-ᇿ㄰-㆏가-힣぀-ヿ一-鿿]')
+_WORD_RE = re.compile(r'[0-9A-Za-z_]{2,}|[가-힣]{2,}')
+_PLACEHOLDER_RE = re.compile(r'(?<!\{)\{(\w+)\}(?!\})')
+
+
+def estimate_tokens(text, provider="gemini"):
+    """문자 종류별 비율로 토큰 수를 추정합니다."""
+    if not text: return 0
+    ratio = TOKEN_RATIOS.get(provider, DEFAULT_RATIO)
+    total = len(text)
+    ascii_cnt = len(text.encode('ascii', 'ignore'))
+    cjk_cnt = len(_CJK_RE.findall(text))
+    other_cnt = max(total - ascii_cnt - cjk_cnt, 0)
+    return int(ascii_cnt * ratio["ascii"] + cjk_cnt * ratio["cjk"] + other_cnt * ratio["other"]) + 1
+
+
+def _keywords(text):
+    return {w.lower() for w in _WORD_RE.findall(text or "")}
+
+
+class PromptBudget:
+    def __init__(self, config):
+        self.provider = config.get("ai_provider", "gemini")
+        self.budgets = dict(DEFAULT_BUDGETS)
+        self.budgets.update(config.get("prompt_budget", {}))
+        self.context_limit = MODEL_CONTEXT.get(self.provider, 32_000) - RESPONSE_RESERVE
+
+    def estimate(self, text):
+        return estimate_tokens(text, self.provider)
+
+    def budget_for(self, name):
+        return min(self.budgets.get(name, self.context_limit), self.context_limit)
+
+    def render(self, name, template, **variables):
+        """
+        템플릿 변수를 예산에 맞게 압축한 뒤 format 한 프롬프트를 반환합니다.
+        tasks_str 처럼 리스트가 들어오는 변수는 압축기가 직렬화까지 담당합니다.
+        """
+        budget = self.budget_for(name)
+        specs = TEMPLATE_SPECS.get(name, {})
+        overhead = self.estimate(_PLACEHOLDER_RE.sub('', template))
+        available = max(budget - overhead, 0)
+
+        # 1. 변수별 필요 토큰 계산
+        texts = {k: self._serialize(k, v) for k, v in variables.items()}
+        need = {k: self.estimate(t) for k, t in texts.items()}
+
+        # 2. 우선순위가 높은(숫자가 작은) 변수부터 예산 배분 (최소 보장량 먼저)
+        order = sorted(variables, key=lambda k: specs.get(k, (0,))[0])
+        alloc = {k: min(need[k], specs.get(k, (0, "text", need[k]))[2]) for k in order}
+        remaining = available - sum(alloc.values())
+        for k in order:
+            if remaining <= 0: break
+            extra = min(need[k] - alloc[k], remaining)
+            alloc[k] += extra
+            remaining -= extra
+
+        # 3. 배분량을 넘는 변수만 압축
+        compressed = {}
+        for k in order:
+            if need[k] <= alloc[k]: continue
+            kind = specs.get(k, (0, "text"))[1]
+            texts[k] = self._compress(kind, variables[k], texts[k], alloc[k], variables)
+            compressed[k] = (need[k], self.estimate(texts[k]))
+
+        prompt = template.format(**texts)
+        used = self.estimate(prompt)
+        detail = ", ".join(f"{k} {a}→{b}" for k, (a, b) in compressed.items()) or "none"
+        logger.info(f"[Budget] {name}: {used}/{budget} tokens (compressed: {detail})")
+        return prompt
+
+    # --- 직렬화 / 압축 ---
+    def _serialize(self, key, value):
+        if isinstance(value, str): return value
+        if isinstance(value, (list, dict)): return json.dumps(value, ensure_ascii=False)
+        return str(value)
+
+    def _compress(self, kind, raw, text, limit, variables):
+        if kind == "transcript": return self._compress_transcript(text, limit)
+        if kind == "tasks": return self._compress_tasks(raw, limit, variables.get("transcript", ""))
+        if kind == "members": return self._compress_members(text, limit)
+        if kind == "diff": return self._compress_diff(text, limit)
+        return self._truncate(text, limit)
+
+    def _truncate(self, text, limit, suffix="\n...(Truncated)"):
+        est = self.estimate(text)
+        if est <= limit: return text
+        keep = max(int(len(text) * limit / est) - len(suffix), 0)
+        return text[:keep] + suffix
+
+    def _compress_transcript(self, text, limit):
+        """앞부분(안건 제시)과 뒷부분(결론)을 살리고 중간 발언을 생략합니다."""
+        lines = text.split('\n')
+        head_budget = int(limit * 0.3)
+        tail_budget = limit - head_budget
+        head, tail = [], []
+        used = 0
+        for line in lines:
+            cost = self.estimate(line) + 1
+            if used + cost > head_budget: break
+            head.append(line); used += cost
+        used = 0
+        for line in reversed(lines[len(head):]):
+            cost = self.estimate(line) + 1
+            if used + cost > tail_budget: break
+            tail.append(line); used += cost
+        tail.reverse()
+        skipped = len(lines) - len(head) - len(tail)
+        if skipped <= 0: return text
+        return "\n".join(head + [f"...(중략: {skipped}줄)..."] + tail)
+
+    def _compress_tasks(self, tasks, limit, query):
+        """회의 내용과 겹치는 단어가 많은 작업, 그 다음 최근 작업 순으로 남깁니다."""
+        if not isinstance(tasks, list): return self._truncate(self._serialize("", tasks), limit)
+        words = _keywords(query)
+
+        def rank(t):
+            overlap = len(words & _keywords(t.get('content', ''))) if isinstance(t, dict) else 0
+            return (overlap, t.get('id', 0) if isinstance(t, dict) else 0)
+
+        kept, used = [], 2
+        for t in sorted(tasks, key=rank, reverse=True):
+            cost = self.estimate(json.dumps(t, ensure_ascii=False)) + 1
+            if used + cost > limit: break
+            kept.append(t); used += cost
+        kept.sort(key=lambda t: t.get('id', 0) if isinstance(t, dict) else 0)
+        out = json.dumps(kept, ensure_ascii=False)
+        omitted = len(tasks) - len(kept)
+        if omitted: out += f" (관련도 낮은 작업 {omitted}건 생략)"
+        return out
+
+    def _compress_members(self, text, limit):
+        names = [n.strip() for n in text.split(',') if n.strip()]
+        kept, used = [], 0
+        for n in names:
+            cost = self.estimate(n) + 1
+            if used + cost > limit: break
+            kept.append(n); used += cost
+        out = ", ".join(kept)
+        if len(kept) < len(names): out += f" 외 {len(names) - len(kept)}명"
+        return out
+
+    def _compress_diff(self, text, limit):
+        """파일(📄) 단위로 잘라서 중간에 끊긴 패치가 생기지 않도록 합니다."""
+        sections = re.split(r'(?=^📄 )', text, flags=re.M)
+        kept, used, dropped = [], 0, []
+        for sec in sections:
+            if not sec.strip(): continue
+            cost = self.estimate(sec)
+            if used + cost <= limit:
+                kept.append(sec); used += cost
+            elif not kept:
+                kept.append(self._truncate(sec, limit)); used = limit
+            else:
+                dropped.append(sec.split('\n', 1)[0].replace('📄 ', '').strip())
+        out = "".join(kept)
+        if dropped: out += f"\n...(예산 초과로 {len(dropped)}개 파일 생략: {', '.join(dropped[:10])})"
+        return out
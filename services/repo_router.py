@@ -0,0 +1,87 @@
+class RepoRouter:
+    """
+    레포 → 알림 채널 라우팅 테이블 (메모리).
+    웹훅마다 DB 조회 / get_channel 을 반복하지 않도록 DB(repositories) 내용을 한 번 읽어 두고,
+    등록·해제·채널 삭제 시 DB 와 함께 갱신합니다.
+    """
+    def __init__(self, bot):
+        self.bot = bot
+        self._routes = None       # repo -> {channel_id: guild_id}
+        self._by_guild = {}       # guild_id -> {(repo, channel_id)}
+        self._channels = {}       # channel_id -> 채널 객체 (해석된 것만)
+        self._unguilded = set()   # guild_id 없이 저장된 기존 연결 {(repo, channel_id)}
+
+    def _ensure_loaded(self):
+        if self._routes is not None: return
+        self._routes = {}
+        for repo, cid, gid in self.bot.db.get_repo_routes():
+            self._put(repo, cid, gid)
+
+    def _put(self, repo, cid, gid):
+        self._routes.setdefault(repo, {})[cid] = gid
+        if gid is not None: self._by_guild.setdefault(gid, set()).add((repo, cid))
+        else: self._unguilded.add((repo, cid))
+
+    def _resolve(self, cid):
+        ch = self._channels.get(cid)
+        if ch is None:
+            ch = self.bot.get_channel(cid)
+            if ch is not None: self._channels[cid] = ch
+        return ch
+
+    def backfill_guilds(self):
+        """guild_id 없이 저장된 기존 연결은 채널이 보이는 시점에 길드를 채움 (on_ready / 길드 참가 시, 남은 것만)"""
+        self._ensure_loaded()
+        for repo, cid in list(self._unguilded):
+            guild = getattr(self._resolve(cid), 'guild', None)
+            if guild is None: continue
+            self._unguilded.discard((repo, cid))
+            self._routes[repo][cid] = guild.id
+            self._by_guild.setdefault(guild.id, set()).add((repo, cid))
+            self.bot.db.set_repo_guild(cid, guild.id)
+
+    # --- 조회 ---
+    def channel_ids(self, repo):
+        self._ensure_loaded()
+        return list(self._routes.get(repo, {}))
+
+    def channels(self, repo):
+        """해석 가능한 채널 객체 목록 (삭제됐거나 아직 캐시에 없는 채널은 제외)"""
+        return [ch for ch in (self._resolve(cid) for cid in self.channel_ids(repo)) if ch]
+
+    def repos_for_guild(self, guild_id):
+        self._ensure_loaded()
+        if self._unguilded: self.backfill_guilds()    # [FIX] 길드가 빠진 연결이 남아 있을 때만
+        return sorted(self._by_guild.get(guild_id, ()))
+
+    # --- 갱신 (DB 와 함께) ---
+    def add(self, repo, channel, added_by):
+        gid = channel.guild.id if getattr(channel, 'guild', None) else None
+        if not self.bot.db.add_repo(repo, channel.id, added_by, gid): return False
+        self._ensure_loaded()
+        self._put(repo, channel.id, gid)
+        self._channels[channel.id] = channel
+        return True
+
+    def remove(self, repo, channel_id):
+        if not self.bot.db.remove_repo(repo, channel_id): return False
+        self._ensure_loaded()
+        gid = self._routes.get(repo, {}).pop(channel_id, None)
+        if not self._routes.get(repo): self._routes.pop(repo, None)
+        if gid is not None: self._by_guild.get(gid, set()).discard((repo, channel_id))
+        self._unguilded.discard((repo, channel_id))
+        return True
+
+    def remove_channel(self, channel_id):
+        """채널이 삭제되면 그 채널로 가던 연결을 모두 정리하고 해제된 레포 목록을 반환"""
+        self._ensure_loaded()
+        self._channels.pop(channel_id, None)
+        removed = [repo for repo, targets in self._routes.items() if channel_id in targets]
+        if not removed: return []
+        self.bot.db.remove_channel_repos(channel_id)
+        for repo in removed:
+            gid = self._routes[repo].pop(channel_id)
+            if gid is not None: self._by_guild.get(gid, set()).discard((repo, channel_id))
+            self._unguilded.discard((repo, channel_id))
+            if not self._routes[repo]: del self._routes[repo]
+        return removed
@@ -0,0 +1,183 @@
+import json
+import logging
+import re
+
+logger = logging.getLogger("ResponseParser")
+
+# 프롬프트별 응답 스키마: 필드 -> (타입, 기본값). required 가 모두 있어야 유효한 응답으로 인정
+SCHEMAS = {
+    "meeting_summary": {
+        "fields": {"title": (str, "회의록"), "date": (str, ""), "summary": (str, ""), "agenda": (list, []), "decisions": (list, [])},
+        "required": ["summary"],
+    },
+    "extract_tasks": {
+        "fields": {"new_tasks": (list, []), "updates": (list, []), "create_roles": (list, []), "assign_roles": (list, [])},
+        "required": ["new_tasks"],
+    },
+    "code_review": {
+        "fields": {"summary": (str, ""), "issues": (list, []), "suggestions": (list, []), "score": (int, 0)},
+        "required": ["summary", "score"],
+    },
+    "code_review_batch": {
+        "fields": {"reviews": (list, [])},
+        "required": ["reviews"],
+    },
+}
+
+_FENCE_RE = re.compile(r'```(?:json)?\s*', re.I)
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+_PY_LITERALS = (("True", "true"), ("False", "false"), ("None", "null"))
+
+
+class ResponseParser:
+    """
+    LLM 응답(JSON 문자열)을 스키마에 맞춰 파싱합니다.
+    json.loads 가 실패하면 로컬 복구(산문 머리말 제거, 후행 쉼표, 작은따옴표, 잘린 배열/객체 닫기)를
+    순서대로 시도하고, 그래도 안 되면 None 을 돌려 호출 측이 짧은 복구 요청을 보내도록 합니다.
+    """
+    def __init__(self):
+        self.stats = {"ok": 0, "local_repair": 0, "remote_repair": 0, "failed": 0}
+
+    @property
+    def avoided_retries(self):
+        """로컬 복구로 모델 재요청을 피한 횟수"""
+        return self.stats["local_repair"]
+
+    def parse(self, raw, name, remote=False):
+        if not isinstance(raw, str) or not raw.strip():
+            self.stats["failed"] += 1
+            return None
+
+        text = _FENCE_RE.sub('', raw).replace('```', '').strip()
+        data = self._validate(self._loads(text), name)
+        if data is not None:
+            self.stats["remote_repair" if remote else "ok"] += 1
+            return data
+
+        for step in (self._strip_prose, self._remove_trailing_commas, self._fix_quotes, self._close_truncated):
+            text = step(text)
+            data = self._validate(self._loads(text), name)
+            if data is not None:
+                self.stats["remote_repair" if remote else "local_repair"] += 1
+                if not remote: logger.info(f"[Parser] {name}: repaired locally via {step.__name__}")
+                return data
+
+        self.stats["failed"] += 1
+        return None
+
+    def repair_prompt(self, raw, name):
+        """마지막 수단으로 모델에 보낼 짧은 복구 요청"""
+        schema = SCHEMAS.get(name, {"fields": {}})
+        shape = {k: (v[0].__name__) for k, v in schema["fields"].items()}
+        return (
+            "The following text was supposed to be a single JSON object but is malformed or incomplete.\n"
+            f"Required shape: {json.dumps(shape)}\n"
+            "Return ONLY the corrected JSON. Keep the original Korean content.\n\n"
+            f"[Broken Output]\n{raw[:4000]}"
+        )
+
+    # --- 파싱 / 검증 ---
+    @staticmethod
+    def _loads(text):
+        try: return json.loads(text)
+        except (ValueError, TypeError): return None
+
+    def _validate(self, data, name):
+        if data is None: return None
+        schema = SCHEMAS.get(name)
+        if isinstance(data, list):
+            data = next((d for d in data if isinstance(d, dict)), None)
+        if not isinstance(data, dict): return None
+        if not schema: return data
+        if any(k not in data for k in schema["required"]): return None
+
+        out = dict(data)
+        for key, (typ, default) in schema["fields"].items():
+            val = out.get(key, default)
+            if typ is int:
+                try: val = int(float(str(val).split('/')[0].strip()))
+                except (ValueError, TypeError): val = default
+            elif typ is list and not isinstance(val, list):
+                val = [val] if val else []
+            elif typ is str and not isinstance(val, str):
+                val = default if val is None else str(val)
+            out[key] = val
+        return out
+
+    # --- 로컬 복구 단계 (누적 적용) ---
+    @staticmethod
+    def _strip_prose(text):
+        starts = [i for i in (text.find('{'), text.find('[')) if i != -1]
+        if not starts: return text
+        start = min(starts)
+        end = max(text.rfind('}'), text.rfind(']'))
+        # 잘린 응답이면 닫는 괄호가 없을 수 있으므로 뒤쪽은 남겨둠
+        return text[start:end + 1] if end > start else text[start:]
+
+    @staticmethod
+    def _remove_trailing_commas(text):
+        return _TRAILING_COMMA_RE.sub(r'\1', text)
+
+    @staticmethod
+    def _fix_quotes(text):
+        """작은따옴표 문자열과 파이썬 리터럴(True/False/None)을 JSON 형식으로 바꿉니다."""
+        out = []
+        i, n = 0, len(text)
+        quote = None
+        while i < n:
+            ch = text[i]
+            if quote:
+                if ch == '\\' and i + 1 < n:
+                    nxt = text[i + 1]
+                    out.append("'" if nxt == "'" else ch + nxt)
+                    i += 2; continue
+                if ch == quote:
+                    out.append('"'); quote = None
+                elif ch == '"' and quote == "'":
+                    out.append('\\"')
+                else:
+                    out.append(ch)
+            elif ch in ('"', "'"):
+                out.append('"'); quote = ch
+            else:
+                matched = next((py for py, js in _PY_LITERALS if text.startswith(py, i)
+                                and not (i and text[i - 1].isalnum())), None)
+                if matched:
+                    out.append(dict(_PY_LITERALS)[matched]); i += len(matched); continue
+                out.append(ch)
+            i += 1
+        if quote: out.append('"')
+        return "".join(out)
+
+    @staticmethod
+    def _close_truncated(text):
+        """응답이 중간에 끊긴 경우 마지막 완전한 원소까지 남기고 괄호를 닫습니다."""
+        stack = []
+        in_str = esc = False
+        last_safe = 0        # 문자열 밖에서 원소가 끝난 위치 (쉼표 직전)
+        safe_stack = []
+        for i, ch in enumerate(text):
+            if in_str:
+                if esc: esc = False
+                elif ch == '\\': esc = True
+                elif ch == '"': in_str = False
+                continue
+            if ch == '"': in_str = True
+            elif ch in '{[': stack.append('}' if ch == '{' else ']')
+            elif ch in '}]':
+                if stack: stack.pop()
+                last_safe, safe_stack = i + 1, list(stack)
+            elif ch == ',':
+                last_safe, safe_stack = i, list(stack)
+        if not stack and not in_str: return text
+
+        # 1차: 열린 문자열/괄호만 닫아보기
+        candidate = text + ('"' if in_str else '')
+        candidate = re.sub(r'[,:]\s*$', '', candidate.rstrip())
+        closed = candidate + "".join(reversed(stack))
+        try:
+            json.loads(closed); return closed
+        except ValueError:
+            pass
+        # 2차: 마지막 완전한 원소까지 잘라낸 뒤 닫기
+        return text[:last_safe].rstrip().rstrip(',') + "".join(reversed(safe_stack))
@@ -0,0 +1,254 @@
+import json
+import math
+import re
+import threading
+from collections import Counter
+
+import numpy as np
+
+_ASCII_RE = re.compile(r'[0-9a-z_]{2,}')
+_HANGUL_RE = re.compile(r'[가-힣]+')
+
+# 문서 종류 (BM25Index 의 kind 코드)
+TASK, SUMMARY, DECISION = 1, 2, 3
+
+
+def tokenize(text):
+    """
+    영문·숫자는 단어 단위, 한글은 음절 bigram (조사가 붙어도 '서버를' → '서버', '버를' 로 겹치게).
+    한 글자 한글 단어는 그대로 씁니다.
+    """
+    text = (text or "").lower()
+    toks = _ASCII_RE.findall(text)
+    for w in _HANGUL_RE.findall(text):
+        if len(w) < 3: toks.append(w)
+        else: toks.extend(w[i:i + 2] for i in range(len(w) - 1))
+    return toks
+
+
+class BM25Index:
+    """
+    증분 갱신되는 BM25 인덱스.
+    단어별 posting 은 파이썬 리스트에 덧붙이고, 검색할 때 NumPy 배열로 바꿔 캐시해 두었다가
+    질의 단어들의 posting 을 이어 붙여 bincount 한 번으로 점수를 합산합니다.
+    삭제는 alive 표시만 끄고, 죽은 문서가 살아 있는 문서보다 많아지면 압축합니다.
+    """
+    def __init__(self, k1=1.5, b=0.75, k3=8.0):
+        self.k1, self.b, self.k3 = k1, b, k3
+        self.vocab = {}              # term -> term id
+        self.postings = []           # term id -> ([doc idx], [tf])
+        self._arrays = {}            # term id -> (np doc idx, np tf)  캐시
+        self.keys = []               # doc idx -> key
+        self.index = {}              # key -> doc idx
+        self.lengths = np.zeros(64, dtype=np.float32)
+        self.kinds = np.zeros(64, dtype=np.int8)
+        self.alive = np.zeros(64, dtype=bool)
+        self.total_len = 0.0
+        self.dead = 0
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def _grow(self, n):
+        if n <= len(self.lengths): return
+        size = max(n, len(self.lengths) * 2)
+        for name in ("lengths", "kinds", "alive"):
+            old = getattr(self, name); new = np.zeros(size, dtype=old.dtype); new[:len(old)] = old
+            setattr(self, name, new)
+
+    def add(self, key, text, kind=0):
+        """문서 추가 (같은 key 가 있으면 교체)"""
+        self.remove(key)
+        counts = Counter(tokenize(text))
+        idx = len(self.keys)
+        self._grow(idx + 1)
+        self.keys.append(key); self.index[key] = idx
+        length = sum(counts.values())
+        self.lengths[idx], self.kinds[idx], self.alive[idx] = length, kind, True
+        self.total_len += length
+        for term, tf in counts.items():
+            tid = self.vocab.get(term)
+            if tid is None:
+                tid = self.vocab[term] = len(self.postings); self.postings.append(([], []))
+            docs, tfs = self.postings[tid]
+            docs.append(idx); tfs.append(tf)
+            self._arrays.pop(tid, None)
+
+    def remove(self, key):
+        idx = self.index.pop(key, None)
+        if idx is None: return False
+        self.alive[idx] = False
+        self.total_len -= float(self.lengths[idx])
+        self.dead += 1
+        if self.dead > 1024 and self.dead > len(self.index): self._compact()
+        return True
+
+    def _compact(self):
+        """죽은 문서를 빼고 doc idx 를 다시 매김"""
+        n = len(self.keys)
+        remap = np.full(n, -1, dtype=np.int64)
+        live = np.flatnonzero(self.alive[:n])
+        remap[live] = np.arange(len(live))
+        self.keys = [self.keys[i] for i in live]
+        self.index = {k: i for i, k in enumerate(self.keys)}
+        size = max(64, len(live) * 2)
+        for name in ("lengths", "kinds", "alive"):
+            old = getattr(self, name); new = np.zeros(size, dtype=old.dtype); new[:len(live)] = old[live]
+            setattr(self, name, new)
+        postings = []
+        for docs, tfs in self.postings:
+            d = remap[np.asarray(docs, dtype=np.int64)] if docs else np.empty(0, dtype=np.int64)
+            keep = d >= 0
+            postings.append((d[keep].tolist(), np.asarray(tfs)[keep].tolist() if docs else []))
+        self.postings, self._arrays, self.dead = postings, {}, 0
+
+    def _posting(self, tid):
+        arr = self._arrays.get(tid)
+        if arr is None:
+            docs, tfs = self.postings[tid]
+            arr = self._arrays[tid] = (np.asarray(docs, dtype=np.int64), np.asarray(tfs, dtype=np.float32))
+        return arr
+
+    def scores(self, query):
+        """질의 텍스트에 대한 전체 문서 점수 배열 (doc idx 순, 삭제된 문서는 0)"""
+        n = len(self.keys)
+        live = len(self.index)
+        if not live: return np.zeros(n, dtype=np.float32)
+        avgdl = max(self.total_len / live, 1.0)
+        all_docs, all_w = [], []
+        for term, qtf in Counter(tokenize(query)).items():
+            tid = self.vocab.get(term)
+            if tid is None: continue
+            docs, tfs = self._posting(tid)
+            alive = self.alive[docs]
+            df = int(alive.sum())
+            if not df: continue
+            # 긴 질의(회의 내용)에서 자주 나온 단어일수록 가중 (k3 로 포화)
+            idf = math.log(1 + (live - df + 0.5) / (df + 0.5)) * qtf * (self.k3 + 1) / (qtf + self.k3)
+            docs, tfs = docs[alive], tfs[alive]
+            norm = self.k1 * (1 - self.b + self.b * self.lengths[docs] / avgdl)
+            all_docs.append(docs); all_w.append(idf * tfs * (self.k1 + 1) / (tfs + norm))
+        if not all_docs: return np.zeros(n, dtype=np.float32)
+        return np.bincount(np.concatenate(all_docs), weights=np.concatenate(all_w), minlength=n)
+
+    def search(self, query, k=10, kind=None, keys=None):
+        """
+        점수 상위 k 개 [(key, score)] (점수 > 0 인 것만).
+        kind: 해당 종류 문서만 / keys: 이 key 들 중에서만
+        """
+        s = self.scores(query)
+        if kind is not None: s = np.where(self.kinds[:len(s)] == kind, s, 0)
+        if keys is not None:
+            idx = np.fromiter((self.index[x] for x in keys if x in self.index), dtype=np.int64)
+            mask = np.zeros(len(s), dtype=bool); mask[idx] = True
+            s = np.where(mask, s, 0)
+        hits = np.flatnonzero(s > 0)
+        if len(hits) > k: hits = hits[np.argpartition(-s[hits], k - 1)[:k]]
+        hits = hits[np.argsort(-s[hits], kind="stable")]
+        return [(self.keys[i], float(s[i])) for i in hits]
+
+
+def _meeting_docs(mid, summary):
+    """회의록 summary(JSON) → [(key, text, kind)] (요약 1건 + 결정사항 각각)"""
+    try: data = json.loads(summary or "{}")
+    except (TypeError, ValueError): data = {"summary": summary or ""}
+    if not isinstance(data, dict): data = {"summary": str(data)}
+    docs = [(('meeting', mid), f"{data.get('title', '')}\n{data.get('summary', '')}", SUMMARY)]
+    for i, d in enumerate(data.get('decisions') or []):
+        docs.append((('decision', mid, i), str(d), DECISION))
+    return docs
+
+
+class Retriever:
+    """
+    길드별 BM25 인덱스 (작업 / 회의 요약 / 결정사항).
+    길드를 처음 조회할 때 DB 에서 한 번 색인하고, 이후에는 DB 변경 알림으로 바뀐 작업·회의만 다시 색인합니다.
+    """
+    def __init__(self, db, k1=1.5, b=0.75):
+        self.db = db
+        self.k1, self.b = k1, b
+        self._indexes = {}             # guild_id -> BM25Index
+        self._meeting_keys = {}        # (guild_id, meeting_id) -> [key]
+        self._decisions = {}           # ('decision', meeting_id, i) -> 원문 (프롬프트에 그대로 넣음)
+        self._dirty_tasks = set()
+        self._dirty_meetings = set()
+        self._lock = threading.RLock()
+        db.add_listener(self._on_change)
+
+    def _on_change(self, kind, guild_id, obj_id):
+        with self._lock:
+            if kind == 'task': self._dirty_tasks.add(obj_id)
+            elif kind == 'meeting': self._dirty_meetings.add(obj_id)
+
+    def _put_meeting(self, idx, gid, mid, summary):
+        for key in self._meeting_keys.pop((gid, mid), []):
+            idx.remove(key); self._decisions.pop(key, None)
+        if summary is None: return
+        docs = _meeting_docs(mid, summary)
+        for key, text, kind in docs:
+            idx.add(key, text, kind)
+            if kind == DECISION: self._decisions[key] = text
+        self._meeting_keys[(gid, mid)] = [d[0] for d in docs]
+
+    def _apply_pending(self):
+        tids, mids = self._dirty_tasks, self._dirty_meetings
+        self._dirty_tasks, self._dirty_meetings = set(), set()
+        if tids:
+            rows = {r[0]: r for r in self.db.get_context_tasks(task_ids=tids)}
+            for tid in tids:
+                row = rows.get(tid)
+                for gid, idx in self._indexes.items():
+                    if row and row[1] == gid: idx.add(('task', tid), row[3], TASK)
+                    else: idx.remove(('task', tid))
+        if mids:
+            rows = {r[0]: r for r in self.db.get_meeting_texts(meeting_ids=mids)}
+            for mid in mids:
+                row = rows.get(mid)
+                for gid, idx in self._indexes.items():
+                    if row and row[1] == gid: self._put_meeting(idx, gid, mid, row[2])
+                    elif (gid, mid) in self._meeting_keys: self._put_meeting(idx, gid, mid, None)
+
+    def index(self, guild_id):
+        """길드 인덱스 (없으면 DB 에서 새로 색인)"""
+        with self._lock:
+            self._apply_pending()
+            idx = self._indexes.get(guild_id)
+            if idx is None:
+                idx = BM25Index(self.k1, self.b)
+                for r in self.db.get_context_tasks(guild_id): idx.add(('task', r[0]), r[3], TASK)
+                for mid, _, summary in self.db.get_meeting_texts(guild_id): self._put_meeting(idx, guild_id, mid, summary)
+                self._indexes[guild_id] = idx
+            return idx
+
+    def invalidate(self, guild_id=None):
+        with self._lock:
+            gids = list(self._indexes) if guild_id is None else [guild_id]
+            for gid in gids:
+                self._indexes.pop(gid, None)
+                for mk in [k for k in self._meeting_keys if k[0] == gid]:
+                    for key in self._meeting_keys.pop(mk): self._decisions.pop(key, None)
+
+    def search(self, guild_id, query, k=10, kind=None, keys=None):
+        idx = self.index(guild_id)
+        with self._lock: return idx.search(query, k, kind, keys)
+
+    def top_tasks(self, guild_id, query, tasks, k):
+        """
+        tasks([{'id', ...}]) 중 query 와 관련도 높은 k 개. 관련 작업이 k 개보다 적으면 최근 작업으로 채우고,
+        원래 순서를 유지해 돌려줍니다. tasks 가 k 개 이하이면 그대로 반환.
+        """
+        if len(tasks) <= k: return tasks
+        hits = self.search(guild_id, query, k, TASK, [('task', t['id']) for t in tasks])
+        chosen = {key[1] for key, _ in hits}
+        for t in sorted(tasks, key=lambda t: t['id'], reverse=True):
+            if len(chosen) >= k: break
+            chosen.add(t['id'])
+        return [t for t in tasks if t['id'] in chosen]
+
+    def related_decisions(self, guild_id, query, k=5, exclude_meeting=None):
+        """query 와 관련된 과거 회의 결정사항 문자열 목록 ('[회의 #id] 내용')"""
+        hits = [key for key, _ in self.search(guild_id, query, k + 10, DECISION) if key[1] != exclude_meeting]
+        return [f"[회의 #{key[1]}] {self._decisions[key]}" for key in hits[:k] if key in self._decisions]
@@ -0,0 +1,50 @@
+import asyncio
+
+import discord
+
+DONE_MESSAGE = "✅ **작업이 완료되었습니다.**"
+
+
+async def resolve_thread(bot, guild_id, thread_id):
+    guild = bot.get_guild(guild_id) if guild_id else None
+    thread = guild.get_thread(thread_id) if guild else None
+    if thread is None:
+        thread = bot.get_channel(thread_id) or await bot.fetch_channel(thread_id)
+    return thread
+
+
+async def mark_thread_done(thread, note=DONE_MESSAGE):
+    """
+    작업 스레드를 완료 상태로 바꿉니다 (포럼이면 DONE 태그).
+    보관된 스레드에 메시지를 보내면 다시 열리므로 메시지를 먼저 보내고 보관합니다.
+    """
+    if isinstance(thread.parent, discord.ForumChannel):
+        done_tag = next((t for t in thread.parent.available_tags if t.name == "DONE"), None)
+        if note: await thread.send(note)
+        await thread.edit(applied_tags=[done_tag] if done_tag else [], archived=True, locked=False)
+    elif isinstance(thread.parent, discord.TextChannel):
+        if note: await thread.send(note)
+        await thread.edit(archived=True, locked=False)
+
+
+async def close_task_threads(bot, closed, interval=0.5, note=DONE_MESSAGE):
+    """
+    close_tasks_batch 결과의 스레드들을 순서대로 완료 처리하고, 길드마다 현황판을 한 번만 갱신합니다.
+    스레드 수정은 interval 초 간격으로 보내 한꺼번에 몰리지 않게 합니다 (Discord 채널 수정 rate limit).
+    """
+    guilds = []
+    for i, t in enumerate(closed):
+        if t['guild_id'] not in guilds: guilds.append(t['guild_id'])
+        if not t.get('thread_id'): continue
+        if i and interval: await asyncio.sleep(interval)
+        try:
+            thread = await resolve_thread(bot, t['guild_id'], t['thread_id'])
+            if thread: await mark_thread_done(thread, note)
+        except Exception as e:
+            print(f"스레드 업데이트 실패 (#{t['task_id']}): {e}")
+
+    cog = bot.get_cog('ProjectCog')
+    if cog:
+        for gid in guilds:
+            try: await cog.refresh_dashboard(gid)
+            except Exception as e: print(f"현황판 갱신 실패 ({gid}): {e}")
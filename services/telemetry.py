@@ -0,0 +1,131 @@
+import threading
+import time
+
+# 지연시간 히스토그램 버킷 상한 (초)
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 30.0, 60.0, float("inf"))
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def percentile(self, q):
+        """버킷 상한 기준 근사 백분위수"""
+        if not self.count: return 0.0
+        target = q * self.count
+        acc = 0
+        for bound, cnt in zip(self.buckets, self.counts):
+            acc += cnt
+            if acc >= target:
+                return bound if bound != float("inf") else self.buckets[-2]
+        return self.buckets[-2]
+
+    def to_dict(self):
+        return {
+            "buckets": {("+Inf" if b == float("inf") else str(b)): c for b, c in zip(self.buckets, self.counts)},
+            "sum": round(self.sum, 4), "count": self.count,
+        }
+
+
+class _Series:
+    """(prompt_type, guild_id) 한 조합의 누적 통계"""
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.ttfb = Histogram()
+        self.total = Histogram()
+        self.prompt_chars = 0
+        self.response_chars = 0
+        self.prompt_tokens = 0
+        self.response_tokens = 0
+        self.reported_calls = 0     # 공급자가 토큰 수를 알려준 호출 수
+        self.cost = 0.0
+        self.cache = {"hit": 0, "miss": 0}
+        self.retries = {"local_repair": 0, "remote_repair": 0, "failed": 0}
+
+    def to_dict(self):
+        return {
+            "calls": self.calls, "errors": self.errors,
+            "ttfb": self.ttfb.to_dict(), "latency": self.total.to_dict(),
+            "p50": self.total.percentile(0.5), "p95": self.total.percentile(0.95),
+            "prompt_chars": self.prompt_chars, "response_chars": self.response_chars,
+            "prompt_tokens": self.prompt_tokens, "response_tokens": self.response_tokens,
+            "token_reported_calls": self.reported_calls, "cost_usd": round(self.cost, 6),
+            "cache": dict(self.cache), "retries": dict(self.retries),
+        }
+
+
+class AITelemetry:
+    """
+    AI 호출 계측을 메모리에 집계합니다. 라벨은 (프롬프트 템플릿, 길드 ID).
+    비용은 config.json 의 "ai_pricing": {"모델명": {"input": $/1M, "output": $/1M}} 로 계산합니다.
+    """
+    def __init__(self, pricing=None, model=None):
+        self.pricing = pricing or {}
+        self.model = model
+        self.started_at = time.time()
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def _get(self, prompt_type, guild_id):
+        key = (prompt_type or "unknown", str(guild_id) if guild_id else "-")
+        if key not in self._series: self._series[key] = _Series()
+        return self._series[key]
+
+    def record_call(self, prompt_type, guild_id, ttfb, total, prompt_chars, response_chars,
+                    prompt_tokens=None, response_tokens=None, ok=True):
+        with self._lock:
+            s = self._get(prompt_type, guild_id)
+            s.calls += 1
+            if not ok: s.errors += 1
+            s.ttfb.observe(ttfb if ttfb is not None else total)
+            s.total.observe(total)
+            s.prompt_chars += prompt_chars
+            s.response_chars += response_chars
+            if prompt_tokens is not None or response_tokens is not None:
+                s.reported_calls += 1
+                s.prompt_tokens += prompt_tokens or 0
+                s.response_tokens += response_tokens or 0
+                price = self.pricing.get(self.model, {})
+                s.cost += ((prompt_tokens or 0) * price.get("input", 0.0)
+                           + (response_tokens or 0) * price.get("output", 0.0)) / 1_000_000
+
+    def record_cache(self, prompt_type, guild_id, hit):
+        with self._lock:
+            self._get(prompt_type, guild_id).cache["hit" if hit else "miss"] += 1
+
+    def record_retry(self, prompt_type, guild_id, outcome):
+        with self._lock:
+            retries = self._get(prompt_type, guild_id).retries
+            retries[outcome] = retries.get(outcome, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            series = [
+                {"prompt_type": pt, "guild_id": gid, **s.to_dict()}
+                for (pt, gid), s in sorted(self._series.items())
+            ]
+        return {"model": self.model, "uptime_sec": int(time.time() - self.started_at), "series": series}
+
+    def summary_lines(self, limit=15):
+        """관리자 명령어용 요약 (총 지연시간이 큰 순)"""
+        with self._lock:
+            rows = sorted(self._series.items(), key=lambda kv: kv[1].total.sum, reverse=True)[:limit]
+            lines = []
+            for (pt, gid), s in rows:
+                lines.append(
+                    f"`{pt}` @ {gid} | {s.calls}회 (오류 {s.errors}) | p50 {s.total.percentile(0.5)}s "
+                    f"p95 {s.total.percentile(0.95)}s | 토큰 {s.prompt_tokens}/{s.response_tokens} | ${s.cost:.4f}"
+                )
+        return lines
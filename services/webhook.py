@@ -10,7 +10,6 @@ if sys.version_info >= (3, 13):
         mock_audioop.error = error
         sys.modules["audioop"] = mock_audioop
 
-import aiohttp
 from aiohttp import web
 import discord
 import re
@@ -20,7 +19,14 @@ import subprocess
 import sys
 import json
 import os
+import hashlib
+import hmac
 from utils import smart_chunk_text
+from services.chunker import EMBED_DESCRIPTION, MESSAGE_LIMIT, add_field_chunks, truncate
+from services.job_queue import WebhookJobQueue
+from services.diff_selector import DiffSelector
+from services.metrics import REGISTRY
+from services.task_threads import close_task_threads
 from ui import EmbedPaginator
 
 class WebhookServer:
@@ -28,25 +34,48 @@ class WebhookServer:
         self.bot = bot
         self.port = port
         self.path = path
-        self.app = web.Application()
+        limits = bot.ai.config.get('webhook_limits', {}) if hasattr(bot.ai, 'config') else {}
+        # [NEW] 수신 제어 한도: 본문 크기 / 동시 수신 요청 / 큐 적체량
+        self.max_body = int(limits.get('max_body_kb', 5120) * 1024)
+        self.max_inflight = limits.get('max_inflight_requests', 32)
+        self.max_pending = limits.get('max_pending_jobs', 100)
+        self.small_push_commits = limits.get('small_push_commits', 2)
+        self.retry_after = limits.get('retry_after', 30)
+        self.thread_interval = limits.get('thread_update_interval', 0.5)
+        self._inflight = 0
+        self.app = web.Application(client_max_size=self.max_body)
         self.app.router.add_route('*', self.path, self.handler)
+        self.app.router.add_get('/ai-stats', self.ai_stats_handler)
+        self.app.router.add_get('/queue-stats', self.queue_stats_handler)
+        self.app.router.add_get('/metrics', self.metrics_handler)
         
         self.bot_repo = None
+        concurrency = 4
+        queue_conf = {}
+        cache_mb = 50
         if hasattr(bot.ai, 'config'):
             self.bot_repo = bot.ai.config.get('bot_repo')
+            concurrency = bot.ai.config.get('webhook_concurrency', 4)
+            queue_conf = bot.ai.config.get('webhook_queue', {})
+            cache_mb = bot.ai.config.get('review_cache', {}).get('max_mb', 50)
+        self.cache_max_bytes = int(cache_mb * 1024 * 1024)
+        # diff 조회 / AI 리뷰 동시 실행 한도 (서버 전체 공유)
+        self._fetch_sem = asyncio.Semaphore(concurrency)
+        self._review_sem = asyncio.Semaphore(concurrency)
+        # [NEW] 수신한 payload 는 DB 작업 큐에 저장 후 워커가 처리 (재시작해도 유실 없음)
+        self.queue = WebhookJobQueue(bot.db, self.process_payload, **queue_conf)
 
-    def _get_github_token(self):
-        try:
-            with open("src/key/github_key", "r", encoding="utf-8") as f:
-                return f.read().strip()
-        except:
-            return None
+        # [NEW] /metrics (Prometheus) 용 계측
+        self._deliveries = REGISTRY.counter("pynapse_webhook_deliveries_total", "Webhook deliveries by response status", ("status",))
+        self._ingest = REGISTRY.histogram("pynapse_webhook_ingest_seconds", "Webhook request handling latency")
+        REGISTRY.add_collector("webhook_queue", self._collect_metrics)
 
     async def start(self):
         runner = web.AppRunner(self.app)
         await runner.setup()
         site = web.TCPSite(runner, '0.0.0.0', self.port)
         await site.start()
+        self.queue.start()
         print(f"🌍 Webhook Server running on port {self.port}")
 
     async def _run_cmd(self, cmd):
@@ -56,111 +85,254 @@ class WebhookServer:
             return process.returncode, stdout.decode().strip(), stderr.decode().strip()
         except Exception as e: return -1, "", str(e)
 
+    def _format_files(self, files):
+        # [UPDATE] 파일·hunk 점수 기반 선택 (벤더/생성 파일이 실제 코드 변경을 밀어내지 않도록)
+        ai = self.bot.ai
+        conf = ai.config.get('diff_selection', {}) if hasattr(ai, 'config') else {}
+        max_tokens = conf.get('max_tokens') or ai.budget.budget_for('code_review') - 800
+        selector = DiffSelector(max_tokens, ai.budget.provider, conf.get('max_hunk_tokens', 1200))
+        text, report = selector.select(files)
+        if report['dropped'] or report['partial']: print(f"[DiffSelect] {DiffSelector.describe(report)}")
+        return text
+
     async def get_github_diff(self, url):
         print(f"[DEBUG] Diff Request: {url}")
-        async with aiohttp.ClientSession() as s:
-            async with s.get(url, headers=self.bot.github_headers) as r:
-                if r.status == 200:
-                    d = await r.json()
-                    lines = []
-                    ignored_files = ['package-lock.json', 'yarn.lock', 'poetry.lock', 'Gemfile.lock']
-                    ignored_exts = ('.svg', '.png', '.jpg', '.jpeg', '.gif', '.ico', '.pdf', '.woff', '.ttf')
-                    for f in d.get('files', []):
-                        fn = f['filename']
-                        if any(x in fn for x in ignored_files) or fn.endswith(ignored_exts):
-                            lines.append(f"📄 {fn} (Skipped)")
-                            continue
-                        patch = f.get('patch', None)
-                        if not patch:
-                            lines.append(f"📄 {fn} (Skipped: No Patch)")
-                            continue
-                        if len(patch) > 2500:
-                            patch = patch[:2500] + "\n...(Truncated)"
-                        lines.append(f"📄 {fn}\n{patch}\n")
-                    return "\n".join(lines)
+        # [UPDATE] 봇이 소유한 공용 GitHub 클라이언트 사용 (연결 재사용 + ETag + rate limit 처리)
+        d = await self.bot.github.get_json(url)
+        if d is None: return None
+        return self._format_files(d.get('files', []))
+
+    # [NEW] compare API 로 Push 전체 diff 를 한 번에 조회
+    def _choose_diff_strategy(self, data, commits):
+        conf = self.bot.ai.config.get('diff_strategy', {}) if hasattr(self.bot.ai, 'config') else {}
+        mode = conf.get('mode', 'auto')
+        if mode != 'auto': return mode
+        before = data.get('before') or ''
+        if len(commits) < conf.get('compare_min_commits', 3): return 'per_commit'
+        if not before or set(before) == {'0'} or data.get('forced') or not data.get('after'):
+            return 'per_commit'
+        return 'compare'
+
+    async def get_push_diffs(self, rn, data, prepared, pending=None):
+        """
+        compare 전략이면 {commit_id: diff} 를 반환하고, 커밋별 조회가 나으면 None 을 반환합니다.
+        pending 이 주어지면 (캐시에 없는 커밋만) 그 커밋들 기준으로 전략을 고르고 diff 를 배정합니다.
+        - compare_split: 집계 diff 의 파일을 push payload 의 added/modified/removed 목록으로 커밋에 배분
+        - compare_whole: 커밋이 많고 변경량이 작으면 Push 전체를 한 번에 리뷰 (마지막 커밋 메시지에 첨부)
+        """
+        pending = prepared if pending is None else pending
+        strategy = self._choose_diff_strategy(data, pending)
+        if strategy == 'per_commit' or not pending: return None
+
+        conf = self.bot.ai.config.get('diff_strategy', {})
+        url = f"https://api.github.com/repos/{rn}/compare/{data.get('before')}...{data.get('after')}"
+        print(f"[DEBUG] Compare Request: {url}")
+        d = await self.bot.github.get_json(url)
+        # compare 응답은 최대 300개 파일까지만 포함하므로 그 이상이면 커밋별 조회로 후퇴
+        if d is None or len(d.get('files', [])) >= 300: return None
+        files = d['files']
+
+        if strategy == 'compare':
+            total_chars = sum(len(f.get('patch') or '') for f in files)
+            many_commits = len(pending) >= conf.get('whole_min_commits', 10)
+            strategy = 'compare_whole' if many_commits and total_chars <= conf.get('whole_max_chars', 40000) else 'compare_split'
+
+        if strategy == 'compare_whole':
+            last = pending[-1]
+            last['msg'] = f"Push of {len(prepared)} commits:\n" + "\n".join(f"- {p['msg'].splitlines()[0] if p['msg'] else ''}" for p in prepared)
+            return {p['id']: (self._format_files(files) if p is last else "") for p in pending}
+
+        # compare_split: 파일을 마지막으로 건드린 커밋에 배분
+        commit_files = {c['id']: set(c.get('added', []) + c.get('modified', []) + c.get('removed', []))
+                        for c in data.get('commits', [])}
+        assigned = {p['id']: [] for p in prepared}
+        notes = {p['id']: [] for p in prepared}
+        for f in files:
+            touching = [p['id'] for p in prepared if f['filename'] in commit_files.get(p['id'], ())]
+            owner = touching[-1] if touching else prepared[-1]['id']
+            assigned[owner].append(f)
+            if len(touching) > 1:
+                notes[owner].append(f"ℹ️ {f['filename']}: {', '.join(t[:7] for t in touching)} 커밋의 누적 변경")
+        return {p['id']: "\n".join(notes[p['id']] + [self._format_files(assigned[p['id']])]) if assigned[p['id']] else ""
+                for p in pending}
+
+    def _build_review_embed(self, review_json, web_url):
+        if isinstance(review_json, list): review_json = review_json[0] if review_json else {}
+        score = review_json.get('score', 0)
+        summ = review_json.get('summary', '요약 없음')
+        color = discord.Color.green() if score >= 80 else discord.Color.orange() if score >= 50 else discord.Color.red()
+        
+        main_embed = discord.Embed(title=f"🤖 AI Code Review (Score: {score})", url=web_url, color=color,
+                                   description=truncate(str(summ), EMBED_DESCRIPTION))
+        
+        issues = review_json.get('issues', [])
+        if issues:
+            i_txt = ""
+            for i in issues[:5]: # 최대 5개까지 표시
+                if isinstance(i, dict):
+                    severity = i.get('severity', '중')
+                    i_type = i.get('type', '알림')
+                    desc = i.get('description', '')
+                else:
+                    severity = '중'; i_type = '알림'; desc = str(i)
+                icon = "🔴" if severity == '상' else "🟡" if severity == '중' else "🟢"
+                i_txt += f"{icon} **[{i_type}]** {desc}\n"
+            if len(issues) > 5: i_txt += f"...외 {len(issues)-5}건"
+            add_field_chunks(main_embed, "🚨 이슈", i_txt.rstrip())
+        return main_embed
+
+    async def _fetch_diff(self, rn, commit_id):
+        async with self._fetch_sem:
+            try:
+                diff = await self.get_github_diff(f"https://api.github.com/repos/{rn}/commits/{commit_id}")
+                if diff is not None: self.bot.db.put_review_cache(rn, commit_id, diff=diff, max_bytes=self.cache_max_bytes)
+                return diff
+            except Exception as e:
+                print(f"[ERROR] Diff fetch fail {commit_id[:7]}: {e}")
+                return None
+
+    async def _review_batch(self, rn, batch, gid, results):
+        async with self._review_sem:
+            try:
+                reviews = await self.bot.ai.review_batch(rn, batch, gid)
+            except Exception as e:
+                print(f"[ERROR] Review fail {rn}: {e}")
+                reviews = {}
+        for c in batch:
+            review = reviews.get(c['id'])
+            # [FIX] compare 로 받은 diff(누적 배분 / Push 전체)의 리뷰는 이번 Push 범위에만 맞으므로 SHA 로 캐시하지 않음
+            if review and review.get('summary') != "실패" and not c.get('push_scoped'):
+                self.bot.db.put_review_cache(rn, c['id'], review=review, max_bytes=self.cache_max_bytes)
+            if not results[c['id']].done(): results[c['id']].set_result(review)
+
+    async def _send_in_order(self, ch, prepared, results, delivery_id=None, sent=()):
+        """
+        한 채널에 커밋 순서대로 전송 (앞 커밋의 리뷰가 끝날 때까지 대기).
+        delivery_id 가 있으면 보낸 커밋을 기록해 두고, 같은 작업을 다시 처리할 때는 sent(이미 보낸 커밋)를 건너뜀
+        """
+        for p in prepared:
+            if p['id'] in sent: continue
+            review_json = await results[p['id']]
+            try:
+                if review_json is not None:
+                    await ch.send(content=p['head'], embed=self._build_review_embed(review_json, p['url']))
+                else:
+                    await ch.send(content=p['head'])
+                    if p['diff'] is None:
+                        await ch.send(embed=discord.Embed(title="⚠️ 분석 생략", description="변경량 과다", color=discord.Color.light_grey()))
+                if delivery_id: self.bot.db.mark_commit_sent(delivery_id, ch.id, p['id'])
+            except Exception as e:
+                print(f"[ERROR] Send fail {ch.id}: {e}")
+
+    def _guild_label(self, channels):
+        """텔레메트리 라벨용: 알림 채널들이 속한 길드 ID (여러 길드면 첫 번째)"""
+        for ch in channels:
+            if getattr(ch, 'guild', None): return ch.guild.id
         return None
 
-    async def process_payload(self, data):
+    async def process_payload(self, data, delivery_id=None):
+        """push payload 처리. delivery_id(작업 큐에서 호출) 가 있으면 재시도 때 이미 보낸 커밋은 건너뜀"""
         if 'repository' not in data: return
         rn = data['repository']['full_name']
         
-        cids = self.bot.db.get_repo_channels(rn)
+        # [UPDATE] 메모리 라우팅 테이블에서 이미 해석된 채널 객체를 가져옴 (DB 조회 / get_channel 반복 없음)
+        channels = self.bot.repos.channels(rn)
         is_self_update = (self.bot_repo and rn == self.bot_repo)
         
-        if not cids and not is_self_update: return
+        if not channels and not is_self_update: return
 
         # 1. 리뷰 및 알림
+        # [UPDATE] diff 조회 → 리뷰 → 채널 전송을 커밋별로 겹쳐서 실행 (동시 실행 수는 webhook_concurrency)
+        #          작은 커밋들은 한 번의 LLM 호출로 묶어서 리뷰하고, 채널별 전송 순서는 커밋 순서를 유지
         commits = data.get('commits', [])
+        # [UPDATE] Push 전체의 작업 닫기(fix/close/resolve #N)를 모아 한 트랜잭션으로 처리 (알림 채널의 길드 작업만)
+        mentions = {c['id']: re.findall(r'(?:fix|close|resolve)\s*#(\d+)', c['message'], re.IGNORECASE) for c in commits}
+        guild_ids = {ch.guild.id for ch in channels if getattr(ch, 'guild', None)}
+        # [FIX] 알림 채널이 없으면(자체 업데이트 전용) 빈 집합 → 아무 작업도 닫지 않음 (None 은 길드 제한 없음)
+        closed = self.bot.db.close_tasks_batch([t for ids in mentions.values() for t in ids], guild_ids)
+        closed_ids = {str(t['task_id']) for t in closed}
+
+        prepared = []
         for c in commits:
             author = c['author']['name']
             message = c['message']
             web_url = c['url']
             commit_id = c['id']
             short_id = commit_id[:7]
+            closed_tasks = [t for t in dict.fromkeys(mentions[commit_id]) if t in closed_ids]
 
-            matches = re.findall(r'(?:fix|close|resolve)\s*#(\d+)', message, re.IGNORECASE)
-            closed_tasks = []
-            for t_id in matches:
-                if self.bot.db.update_task_status(int(t_id), "DONE"):
-                    closed_tasks.append(t_id)
-
-            msg_head = f"🚀 **Push** `{rn}`\nCommit: [`{short_id}`]({web_url}) by **{author}**\nMsg: `{message}`"
+            # 커밋 메시지는 Discord 메시지 한도(2000) 안에 머리글과 함께 들어가도록 자름
+            msg_head = f"🚀 **Push** `{rn}`\nCommit: [`{short_id}`]({web_url}) by **{author}**\nMsg: `{truncate(message, MESSAGE_LIMIT - 500)}`"
             if closed_tasks: msg_head += f"\n✅ Closed: {', '.join(closed_tasks)}"
-            
-            api_url = f"https://api.github.com/repos/{rn}/commits/{commit_id}"
-            diff_text = await self.get_github_diff(api_url)
-            
-            review_embeds = []
-
-            if diff_text and len(diff_text.strip()) > 0:
-                review_json = await self.bot.ai.review_code(rn, author, message, diff_text)
-                if isinstance(review_json, list): review_json = review_json[0] if review_json else {}                
-                
-                score = review_json.get('score', 0)
-                summ = review_json.get('summary', '요약 없음')
-                color = discord.Color.green() if score >= 80 else discord.Color.orange() if score >= 50 else discord.Color.red()
-                
-                main_embed = discord.Embed(title=f"🤖 AI Code Review (Score: {score})", url=web_url, color=color, description=summ)
-                
-                issues = review_json.get('issues', [])
-                if issues:
-                    i_txt = ""
-                    for i in issues[:5]: # 최대 5개까지 표시
-                        if isinstance(i, dict):
-                            severity = i.get('severity', '중')
-                            i_type = i.get('type', '알림')
-                            desc = i.get('description', '')
-                        else:
-                            severity = '중'; i_type = '알림'; desc = str(i)
-                        icon = "🔴" if severity == '상' else "🟡" if severity == '중' else "🟢"
-                        i_txt += f"{icon} **[{i_type}]** {desc}\n"
-                    if len(issues) > 5: i_txt += f"...외 {len(issues)-5}건"
-                    main_embed.add_field(name="🚨 이슈", value=i_txt, inline=False)
-                
-                review_embeds.append(main_embed)
-
-            for cid in cids:
-                ch = self.bot.get_channel(cid)
-                if ch:
-                    try:
-                        if review_embeds:
-                            await ch.send(content=msg_head, embed=review_embeds[0])
-                        else:
-                            await ch.send(content=msg_head)
-                            if diff_text is None:
-                                await ch.send(embed=discord.Embed(title="⚠️ 분석 생략", description="변경량 과다", color=discord.Color.light_grey()))
-                    except Exception as e:
-                        print(f"[ERROR] Send fail {cid}: {e}")
+            prepared.append({'id': commit_id, 'author': author, 'msg': message, 'diff': None,
+                             'url': web_url, 'head': msg_head})
+
+        # 닫힌 작업의 스레드 태그/보관과 현황판 갱신은 리뷰와 나란히 진행 (간격을 두고 순차 수정)
+        thread_sync = asyncio.create_task(close_task_threads(self.bot, closed, self.thread_interval)) if closed else None
+
+        loop = asyncio.get_running_loop()
+        results = {p['id']: loop.create_future() for p in prepared}
+        # 재시도 / 재시작으로 같은 작업을 다시 처리하면 채널마다 이미 보낸 커밋은 건너뛰고, 모든 채널에 보낸 커밋은 리뷰도 생략
+        sent = {ch.id: self.bot.db.get_sent_commits(delivery_id, ch.id) for ch in channels} if delivery_id else {}
+        delivered = set.intersection(*sent.values()) if sent else set()
+        senders = [asyncio.create_task(self._send_in_order(ch, prepared, results, delivery_id, sent.get(ch.id, ())))
+                   for ch in channels]
+        fetches, reviews = [], []
+        failed = True
+        try:
+            gid = self._guild_label(channels)
+            # [NEW] 이미 리뷰한 커밋(다른 브랜치·재전송·여러 채널)은 캐시에서 바로 사용
+            pending, cached_diffs = [], {}
+            for p in prepared:
+                if p['id'] in delivered:
+                    results[p['id']].set_result(None); continue
+                diff, review = self.bot.db.get_review_cache(rn, p['id'])
+                self.bot.ai.telemetry.record_cache('code_review', gid, review is not None)
+                if review is not None:
+                    p['diff'] = diff or ""
+                    results[p['id']].set_result(review)
+                else:
+                    pending.append(p)
+                    if diff is not None: cached_diffs[p['id']] = diff
+            diff_map = await self.get_push_diffs(rn, data, prepared, pending) if len(cached_diffs) < len(pending) else None
+            for p in pending:
+                self.bot.ai.telemetry.record_cache('github_diff', gid, p['id'] in cached_diffs)
+                if p['id'] not in cached_diffs and diff_map is None:
+                    fetches.append(asyncio.create_task(self._fetch_diff(rn, p['id'])))
+                else:
+                    done = loop.create_future()
+                    if p['id'] not in cached_diffs: p['push_scoped'] = True    # compare diff: 캐시하지 않음
+                    done.set_result(cached_diffs[p['id']] if p['id'] in cached_diffs else diff_map.get(p['id'], ""))
+                    fetches.append(done)
+            packer = self.bot.ai.batch_packer()
+            for p, fetch in zip(pending, fetches):
+                p['diff'] = await fetch
+                if p['diff'] and len(p['diff'].strip()) > 0:
+                    for batch in packer.add(p):
+                        reviews.append(asyncio.create_task(self._review_batch(rn, batch, gid, results)))
+                else:
+                    results[p['id']].set_result(None)
+            for batch in packer.flush():
+                reviews.append(asyncio.create_task(self._review_batch(rn, batch, gid, results)))
+            await asyncio.gather(*reviews)
+            failed = False
+        finally:
+            for f in fetches + reviews: f.cancel()
+            if failed:
+                # [FIX] 실패하면 리뷰 없이 머리글만 보내지 않도록 전송을 멈추고 기다림 → 재시도 때 남은 커밋만 전송
+                for s in senders: s.cancel()
+                await asyncio.gather(*senders, *([thread_sync] if thread_sync else []), return_exceptions=True)
+            for fut in results.values():
+                if not fut.done(): fut.set_result(None)
+        await asyncio.gather(*senders)
+        if thread_sync: await thread_sync
 
         # 2. 강제 업데이트 로직
         if is_self_update:
             print(f"🔄 Self-update triggered for {rn}")
-            notify_channels = []
-            for cid in cids:
-                ch = self.bot.get_channel(cid)
-                if ch: notify_channels.append(ch); 
+            notify_channels = channels
             
-            token = self._get_github_token()
+            token = self.bot.github.token
             remote_url = f"https://{token}@github.com/{rn}.git" if token else "origin"
             
             try:
@@ -173,12 +345,85 @@ class WebhookServer:
             except Exception as e:
                 print(f"❌ Update Error: {e}")
 
+    def _check_stats_token(self, request):
+        # [FIX] 웹훅과 같은 공개 포트라 토큰이 없으면 막음 (길드 ID·비용·큐 상태 노출 방지)
+        token = self.bot.ai.config.get('stats_token') if hasattr(self.bot.ai, 'config') else None
+        if not token: return False
+        given = request.query.get('token') or request.headers.get('Authorization', '').removeprefix('Bearer ')
+        return hmac.compare_digest(given.encode(), str(token).encode())
+
+    async def ai_stats_handler(self, request):
+        if not self._check_stats_token(request): return web.Response(status=401)
+        stats = self.bot.ai.telemetry.snapshot()
+        stats['parser'] = dict(self.bot.ai.parser.stats, avoided_retries=self.bot.ai.parser.avoided_retries)
+        return web.json_response(stats)
+
+    def _collect_metrics(self):
+        jobs = REGISTRY.gauge("pynapse_webhook_jobs", "Webhook jobs by status", ("status",))
+        q = self.bot.db.get_job_stats()
+        for status in ('pending', 'running', 'done', 'failed'): jobs.set(q[status], status=status)
+        REGISTRY.gauge("pynapse_webhook_oldest_job_age_seconds", "Age of the oldest open webhook job").set(q['oldest_age_sec'])
+        REGISTRY.gauge("pynapse_webhook_inflight_requests", "Webhook requests being read").set(self._inflight)
+
+    async def metrics_handler(self, request):
+        if not self._check_stats_token(request): return web.Response(status=401)
+        return web.Response(text=REGISTRY.render(), content_type="text/plain", charset="utf-8",
+                            headers={"X-Content-Type-Options": "nosniff"})
+
+    async def queue_stats_handler(self, request):
+        if not self._check_stats_token(request): return web.Response(status=401)
+        return web.json_response(dict(self.queue.stats(), inflight_requests=self._inflight, max_pending=self.max_pending))
+
+    def _priority(self, data):
+        """2: 봇 자체 업데이트, 1: 작은 push, 0: 그 외"""
+        rn = data.get('repository', {}).get('full_name')
+        if self.bot_repo and rn == self.bot_repo: return 2
+        if len(data.get('commits', [])) <= self.small_push_commits: return 1
+        return 0
+
+    def _admit(self, priority):
+        """큐 적체량 기준 수신 여부. 우선 작업은 한도의 2배까지, 자체 업데이트는 항상 받음"""
+        if priority >= 2: return True
+        pending = self.bot.db.count_open_jobs()
+        return pending < (self.max_pending * 2 if priority == 1 else self.max_pending)
+
+    def _shed(self, status, reason):
+        print(f"[Webhook] {status} {reason}")
+        return web.Response(status=status, text=reason, headers={'Retry-After': str(self.retry_after)})
+
     async def handler(self, request):
         if request.method == 'GET': return web.Response(text="🟢 Bot Webhook Server OK")
+        t0 = asyncio.get_running_loop().time()
+        resp = await self._receive(request)
+        self._deliveries.inc(status=resp.status)
+        self._ingest.observe(asyncio.get_running_loop().time() - t0)
+        return resp
+
+    async def _receive(self, request):
+        # [NEW] 과부하 시 본문을 읽기 전에 빠르게 거절
+        if request.content_length and request.content_length > self.max_body:
+            return web.Response(status=413, text="Payload too large")
+        if self._inflight >= self.max_inflight:
+            return self._shed(503, "Too many concurrent deliveries")
+        self._inflight += 1
         try:
-            data = await request.json()
-            self.bot.loop.create_task(self.process_payload(data))
-            return web.Response(text="OK", status=200)
+            body = await request.text()
+            data = json.loads(body)
+            priority = self._priority(data) if isinstance(data, dict) else 0
+            if not self._admit(priority):
+                return self._shed(429, "Job queue saturated")
+            # [UPDATE] 바로 처리하지 않고 작업 큐에 저장. 같은 X-GitHub-Delivery 재전송은 한 번만 처리
+            delivery = request.headers.get('X-GitHub-Delivery') or hashlib.sha256(body.encode()).hexdigest()
+            event = request.headers.get('X-GitHub-Event', 'push')
+            if not self.queue.enqueue(delivery, event, body, priority):
+                return web.Response(text="Duplicate", status=200)
+            return web.Response(text="Queued", status=202)
+        except web.HTTPRequestEntityTooLarge:
+            return web.Response(status=413, text="Payload too large")
+        except ValueError:
+            return web.Response(status=400)
         except Exception as e:
             print(f"[ERROR] Webhook: {e}")
-            return web.Response(status=500)
\ No newline at end of file
+            return web.Response(status=500)
+        finally:
+            self._inflight -= 1
@@ -0,0 +1,54 @@
+from services.chunker import chunk_text, utf16_len
+
+
+def test_long_fence_opener_terminates():
+    # 펜스 여는 줄이 limit 만큼 길어도 다음 긴 줄을 자를 폭이 0 이하가 되지 않아야 함
+    text = '```' + 'a' * 1200 + '\n' + 'b' * 1100
+    for limit in (1024, 2000):
+        chunks = chunk_text(text, limit)
+        assert all(utf16_len(c) <= limit for c in chunks)
+        assert "".join(chunks).count('b') == 1100
+
+
+def test_fence_reopened_with_short_prefix():
+    chunks = chunk_text("```python extra info\n" + "x" * 3000, 1024)
+    assert all(c.startswith("```python\n") for c in chunks[1:])
+    assert all(c.endswith("\n```") for c in chunks[:-1])
+
+
+def _fence_lines(chunk):
+    return [l for l in chunk.split("\n") if l.lstrip().startswith(("```", "~~~"))]
+
+
+SAMPLES = [
+    "```" + "verylonglanguagename" * 3 + "\n" + "\n".join("x" * n for n in range(1, 40)) + "\n```\n끝",
+    "소개\n```python extra info " + "y" * 80 + "\n" + "print('hi') " * 20 + "\n```\n- a\n  - b 😀😀",
+    "# 제목\n" + "문단 " * 30 + "\n~~~~sh\n" + "echo z\n" * 15 + "~~~~\n",
+]
+
+
+def test_small_limits_stay_within_limit_and_balanced():
+    # add_field_chunks 는 limit 20 까지 내려서 부름 → 작은 limit 에서도 넘치거나 펜스가 깨지면 안 됨
+    for text in SAMPLES:
+        for limit in range(13, 61):
+            chunks = chunk_text(text, limit)
+            for c in chunks:
+                assert utf16_len(c) <= limit, (limit, c)
+                assert len(_fence_lines(c)) % 2 == 0, (limit, c)
+
+
+def test_long_language_dropped_when_reopen_does_not_fit():
+    chunks = chunk_text("```" + "l" * 40 + "\n" + "x" * 200, 40)
+    assert all(utf16_len(c) <= 40 for c in chunks)
+    assert all(c.startswith("```\n") and c.endswith("\n```") for c in chunks)
+    assert "".join(chunks).count("x") == 200
+
+
+def test_fence_opener_not_split():
+    text = "앞 문단\n```js " + "meta" * 30 + "\nlet a = 1\n```"
+    for limit in (20, 40, 60):
+        chunks = chunk_text(text, limit)
+        opener = [l for c in chunks for l in _fence_lines(c) if l != "```"]
+        assert opener and all(l.startswith("```js") for l in opener)
+        assert all(utf16_len(c) <= limit and len(_fence_lines(c)) % 2 == 0 for c in chunks)
+        assert not any("meta" in c for c in chunks)
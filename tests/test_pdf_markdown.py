@@ -0,0 +1,39 @@
+import pytest
+
+pytest.importorskip("reportlab")
+
+from reportlab.platypus import Paragraph, Table
+
+from services import pdf
+
+
+@pytest.fixture(scope="module")
+def render():
+    font_name, styles = pdf.setup()
+    return lambda text: pdf.parse_markdown_to_flowables(text, styles, font_name)
+
+
+@pytest.mark.parametrize("sep", ["|---|---|", "|-|-|", "|:-:|:-:|", "|:--|--:|", "| :--- | ---: |"])
+def test_gfm_table_separators(render, sep):
+    story = render(f"| a | b |\n{sep}\n| 1 | 2 |")
+    tables = [f for f in story if isinstance(f, Table)]
+    assert len(tables) == 1
+    assert len(tables[0]._cellvalues) == 2
+    assert not any(isinstance(f, Paragraph) and '|' in f.text for f in story)
+
+
+def test_headings_use_level_styles(render):
+    story = render("# 하나\n## 둘\n### 셋\n#### 넷")
+    assert [f.style.name for f in story] == ["ReportH1", "ReportH2", "ReportH3", "ReportH3"]
+
+
+def test_nested_lists(render):
+    story = render("- 상위\n  - 하위\n    - 하위의 하위\n1. 번호")
+    assert [f.style.name for f in story] == ["ReportList0", "ReportList1", "ReportList2", "ReportList0"]
+    assert story[0].text.startswith(pdf.LIST_BULLETS[0]) and story[1].text.startswith(pdf.LIST_BULLETS[1])
+    assert story[3].text.startswith("1.")
+
+
+def test_dash_line_after_row_without_pipe_is_not_separator(render):
+    story = render("| 그냥 문장 |\n---")
+    assert not any(isinstance(f, Table) for f in story)
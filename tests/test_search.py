@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from database import DBManager
+from database.search import fts_query
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DBManager(str(tmp_path / "t.db"))
+    db.create_project(1, "알파")
+    db.add_task(1, "알파", "배포 서버 점검")
+    db.save_meeting(1, "배포 회의", 10, json.dumps({"title": "배포", "summary": "서버 배포 일정", "decisions": ["금요일 배포"]}), "u")
+    db.create_page("배포 가이드", "서버 배포 순서", 7)
+    return db
+
+
+@pytest.mark.parametrize("kind", ["meeting", "task", "page"])
+def test_single_kind_search(db, kind):
+    rows, _ = db.search(1, "배포", 7, (kind,))
+    assert [r['kind'] for r in rows] == [kind]
+
+
+def test_archived_task_search(db):
+    db.update_task_status(1, "DONE")
+    db.archive_old(task_days=-1, meeting_days=None)
+    rows, _ = db.search(1, "배포", None, ("task",), archived=True)
+    assert [(r['kind'], r['id']) for r in rows] == [("task", 1)]
+
+
+def test_query_particles_stripped(db):
+    assert fts_query("서버를 배포에서 회의") == '"서버"* "배포"* "회의"*'
+    rows, _ = db.search(1, "서버를", 7)
+    assert {r['kind'] for r in rows} == {"meeting", "task", "page"}
@@ -1,4 +1,4 @@
-from .common import EmbedPaginator
+from .common import EmbedPaginator, LazyEmbedPaginator
 from .project_views import StatusUpdateView, NewProjectView, TaskSelectionView, AutoAssignTaskView, AssistantActionView, DashboardView
 from .role_views import RoleCreationView, RoleAssignmentView
 from .forms import ProjectCreateModal, TaskCreateModal
@@ -29,4 +29,65 @@ class EmbedPaginator(View):
     async def next_button(self, interaction: discord.Interaction, button: Button):
         self.current_page += 1
         self.update_buttons()
-        await interaction.response.edit_message(embed=self.embeds[self.current_page], view=self)
\ No newline at end of file
+        await interaction.response.edit_message(embed=self.embeds[self.current_page], view=self)
+
+# [NEW] 페이지를 미리 만들지 않는 EmbedPaginator (DB keyset 커서로 필요한 페이지만 조회)
+class LazyEmbedPaginator(View):
+    """
+    fetch(cursor, page) -> (embed, next_cursor) 를 ▶️ 를 누를 때마다 호출합니다. next_cursor 가 None 이면 마지막 페이지.
+    지나온 페이지는 커서만 기억하고 embed 는 최근 max_cached 개만 보관하므로, 깊이 넘겨도 메모리가 늘지 않습니다.
+    """
+    def __init__(self, fetch, first_embed, next_cursor, author=None, max_cached=5, timeout=180):
+        super().__init__(timeout=timeout)
+        self.fetch = fetch
+        self.cursors = [None, next_cursor]    # cursors[i] = i 페이지를 가져올 커서 (마지막 원소는 아직 안 본 다음 페이지)
+        self.cache = {0: first_embed}
+        self.max_cached = max_cached
+        self.current_page = 0
+        self.author = author
+        self.update_buttons()
+
+    @classmethod
+    async def start(cls, ctx, fetch, empty_message="📭 없음", **kwargs):
+        """첫 페이지를 보내고 (다음 페이지가 있을 때만 버튼 부착). fetch 가 embed 로 None 을 주면 empty_message"""
+        embed, next_cursor = await fetch(None, 0)
+        if embed is None: return await ctx.send(empty_message)
+        if next_cursor is None: return await ctx.send(embed=embed)
+        return await ctx.send(embed=embed, view=cls(fetch, embed, next_cursor, author=kwargs.pop('author', ctx.author), **kwargs))
+
+    def update_buttons(self):
+        self.children[0].disabled = (self.current_page == 0)
+        self.children[1].disabled = (self.cursors[self.current_page + 1] is None)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if self.author and interaction.user != self.author:
+            await interaction.response.send_message("🚫 권한이 없습니다.", ephemeral=True)
+            return False
+        return True
+
+    async def _page(self, page):
+        embed = self.cache.pop(page, None)
+        if embed is None:
+            embed, next_cursor = await self.fetch(self.cursors[page], page)
+            if embed is None:    # 그 사이 데이터가 지워짐
+                embed = discord.Embed(description="📭 더 이상 항목이 없습니다."); next_cursor = None
+            if page + 1 == len(self.cursors): self.cursors.append(next_cursor)
+            else: self.cursors[page + 1] = next_cursor
+        self.cache[page] = embed
+        while len(self.cache) > self.max_cached: self.cache.pop(next(iter(self.cache)))
+        return embed
+
+    async def _show(self, interaction, page):
+        await interaction.response.defer()
+        embed = await self._page(page)
+        self.current_page = page
+        self.update_buttons()
+        await interaction.edit_original_response(embed=embed, view=self)
+
+    @discord.ui.button(label="◀️", style=discord.ButtonStyle.secondary)
+    async def prev_button(self, interaction: discord.Interaction, button: Button):
+        await self._show(interaction, self.current_page - 1)
+
+    @discord.ui.button(label="▶️", style=discord.ButtonStyle.secondary)
+    async def next_button(self, interaction: discord.Interaction, button: Button):
+        await self._show(interaction, self.current_page + 1)
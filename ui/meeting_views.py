@@ -18,7 +18,11 @@ class MeetingTaskView(View):
             project = (t.get('project') or '미정')[:15]
             assignee = (t.get('assignee_hint') or '미정')[:10]
             label = f"[{project}] {content}"
-            options.append(discord.SelectOption(label=label, description=f"담당: {assignee}", value=str(i)))
+            desc = f"담당: {assignee}"
+            # [NEW] 기존 작업과 유사 (DuplicateDetector)
+            dup = t.get('duplicate_of')
+            if dup: label = f"⚠️ {label}"; desc += f" | #{dup['id']} 와 유사 ({dup['score']:.0%})"
+            options.append(discord.SelectOption(label=label, description=desc, value=str(i)))
         
         if len(options) > 25: options = options[:25]
         
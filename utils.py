@@ -1,35 +1,10 @@
 import discord
 from discord.ext import commands
+from services.chunker import chunk_text
 
 def smart_chunk_text(text, limit=1500):
-    chunks = []
-    current_chunk = ""
-    in_code_block = False
-    code_block_lang = ""
-
-    for line in text.split('\n'):
-        if len(current_chunk) + len(line) + 20 > limit:
-            if in_code_block:
-                chunks.append(current_chunk + "\n```")
-                current_chunk = f"```{code_block_lang}\n{line}"
-            else:
-                chunks.append(current_chunk)
-                current_chunk = line
-        else:
-            if current_chunk: current_chunk += "\n" + line
-            else: current_chunk = line
-        
-        stripped = line.strip()
-        if stripped.startswith("```"):
-            if in_code_block:
-                in_code_block = False
-                code_block_lang = ""
-            else:
-                in_code_block = True
-                code_block_lang = stripped.replace("```", "").strip()
-    
-    if current_chunk: chunks.append(current_chunk)
-    return chunks
+    # [UPDATE] services.chunker 로 위임 (선형 시간, UTF-16 길이, 코드 펜스 / 목록 경계 유지)
+    return chunk_text(text, limit)
 
 # Cog 내부에서 self.bot.db에 접근하기 위한 커스텀 체크
 def is_authorized():